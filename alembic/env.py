@@ -33,8 +33,10 @@ if config.config_file_name is not None:
 from app.models.user import User
 from app.models.pet import Pet
 from app.models.caregiver import CaregiverProfile
+from app.models.caregiver_service_price import CaregiverServicePrice
 from app.models.booking import Booking, BookingStatus, ServiceType
 from app.models.review import Review
+from app.models.search_version import SearchVersion
 from app.models.payment import Payment, PaymentStatus, PaymentType  # Add this line
 from app.core.database import Base
 
@@ -43,6 +45,7 @@ __all__ = [
     "User",
     "Pet",
     "CaregiverProfile",
+    "CaregiverServicePrice",
     "Booking",
     "BookingStatus",
     "ServiceType",
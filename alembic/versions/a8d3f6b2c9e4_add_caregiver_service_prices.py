@@ -0,0 +1,125 @@
+"""add_caregiver_service_prices
+
+Revision ID: a8d3f6b2c9e4
+Revises: f1c5a9e3b7d2
+Create Date: 2026-10-17 17:41:55.028316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8d3f6b2c9e4'
+down_revision: Union[str, None] = 'f1c5a9e3b7d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 5000
+
+
+def prices_sql(profiles: str) -> str:
+    """(caregiver_id, service_type, price, is_available) for each offered service of `profiles` (alias cp)."""
+    return f"""
+        SELECT cp.id, s.service_type, p.price, coalesce(cp.is_available, false)
+        FROM {profiles}
+        CROSS JOIN LATERAL (
+            SELECT DISTINCT upper(t) AS service_type FROM unnest(cp.services_offered) AS t
+        ) AS s
+        CROSS JOIN LATERAL (
+            SELECT CASE s.service_type
+                WHEN 'BOARDING' THEN cp.price_per_night
+                WHEN 'DAYCARE' THEN cp.price_per_day
+                WHEN 'WALKING' THEN cp.price_per_walk
+            END AS price
+        ) AS p
+        WHERE p.price IS NOT NULL
+    """
+
+
+# Rebuild a profile's rows whenever anything they derive from changes;
+# deleting the profile cascades through the foreign key
+TRIGGER_FUNCTION_SQL = f"""
+CREATE OR REPLACE FUNCTION caregiver_profiles_sync_service_prices() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    DELETE FROM caregiver_service_prices WHERE caregiver_id = NEW.id;
+    INSERT INTO caregiver_service_prices (caregiver_id, service_type, price, is_available)
+    {prices_sql('(SELECT NEW.*) AS cp')};
+    RETURN NULL;
+END
+$$
+"""
+
+TRIGGER_SQL = """
+CREATE TRIGGER caregiver_profiles_sync_service_prices
+AFTER INSERT OR UPDATE OF services_offered, price_per_night, price_per_day, price_per_walk, is_available
+ON caregiver_profiles
+FOR EACH ROW EXECUTE FUNCTION caregiver_profiles_sync_service_prices()
+"""
+
+# Upper bound of the next batch of profiles, walking the primary key
+NEXT_BATCH_SQL = """
+SELECT max(id) FROM (
+    SELECT id FROM caregiver_profiles
+    WHERE (CAST(:after AS uuid) IS NULL OR id > CAST(:after AS uuid))
+    ORDER BY id
+    LIMIT :batch_size
+) AS batch
+"""
+
+# Rows the trigger already wrote for profiles updated meanwhile are newer; keep them
+BACKFILL_SQL = f"""
+INSERT INTO caregiver_service_prices (caregiver_id, service_type, price, is_available)
+{prices_sql('''(
+    SELECT * FROM caregiver_profiles
+    WHERE (CAST(:after AS uuid) IS NULL OR id > CAST(:after AS uuid)) AND id <= CAST(:upto AS uuid)
+) AS cp''')}
+ON CONFLICT DO NOTHING
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        'caregiver_service_prices',
+        sa.Column('caregiver_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('service_type', sa.String(length=50), nullable=False),
+        sa.Column('price', sa.Float(), nullable=False),
+        sa.Column('is_available', sa.Boolean(), nullable=False),
+        sa.ForeignKeyConstraint(['caregiver_id'], ['caregiver_profiles.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('caregiver_id', 'service_type'),
+    )
+    # The table is new and empty, so a plain CREATE INDEX blocks nobody
+    op.create_index(
+        'ix_caregiver_service_prices_service_type_price_available',
+        'caregiver_service_prices',
+        ['service_type', 'price', 'caregiver_id'],
+        postgresql_where=sa.text('is_available'),
+    )
+    op.execute(TRIGGER_FUNCTION_SQL)
+    op.execute(TRIGGER_SQL)
+
+    # One short autocommitted transaction per batch of profiles
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        after = None
+        while True:
+            upto = bind.execute(sa.text(NEXT_BATCH_SQL), {'after': after, 'batch_size': BATCH_SIZE}).scalar()
+            if upto is None:
+                break
+            bind.execute(sa.text(BACKFILL_SQL), {'after': after, 'upto': str(upto)})
+            after = str(upto)
+        bind.execute(sa.text('ANALYZE caregiver_service_prices'))
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER IF EXISTS caregiver_profiles_sync_service_prices ON caregiver_profiles')
+    op.execute('DROP FUNCTION IF EXISTS caregiver_profiles_sync_service_prices()')
+    op.drop_index(
+        'ix_caregiver_service_prices_service_type_price_available',
+        table_name='caregiver_service_prices',
+    )
+    op.drop_table('caregiver_service_prices')
@@ -0,0 +1,172 @@
+"""add_caregiver_card_columns
+
+Revision ID: b2e6d4a9f1c7
+Revises: a8d3f6b2c9e4
+Create Date: 2026-10-17 19:12:40.551862
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2e6d4a9f1c7'
+down_revision: Union[str, None] = 'a8d3f6b2c9e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 5000
+
+# First caregiver image by display order; its thumbnail is the card picture
+THUMBNAIL_SQL = """(
+    SELECT coalesce(i.thumbnail_url, i.url) FROM images AS i
+    WHERE i.entity_type = 'caregiver' AND i.entity_id = {profile_id}
+    ORDER BY i."order", i.created_at
+    LIMIT 1
+)"""
+
+# Everything a search card shows that lives outside caregiver_profiles is
+# copied onto it, so search reads one table. Each source table's trigger
+# also bumps the profile's updated_at: the card changed, and that is what
+# the ETag version probes look at.
+FUNCTIONS_SQL = [
+    f"""
+    CREATE OR REPLACE FUNCTION caregiver_profiles_fill_card() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        SELECT coalesce(u.full_name, ''), u.profile_picture
+        INTO NEW.user_full_name, NEW.user_profile_picture
+        FROM users AS u WHERE u.id = NEW.user_id;
+        NEW.thumbnail_url := {THUMBNAIL_SQL.format(profile_id='NEW.id')};
+        RETURN NEW;
+    END
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION users_sync_caregiver_card() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        UPDATE caregiver_profiles
+        SET user_full_name = coalesce(NEW.full_name, ''),
+            user_profile_picture = NEW.profile_picture,
+            updated_at = timezone('utc', now())
+        WHERE user_id = NEW.id;
+        RETURN NULL;
+    END
+    $$
+    """,
+    f"""
+    CREATE OR REPLACE FUNCTION images_sync_caregiver_card() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    DECLARE
+        profile_ids uuid[] := '{{}}';
+    BEGIN
+        IF TG_OP <> 'DELETE' AND NEW.entity_type = 'caregiver' THEN
+            profile_ids := profile_ids || NEW.entity_id;
+        END IF;
+        IF TG_OP <> 'INSERT' AND OLD.entity_type = 'caregiver' THEN
+            profile_ids := profile_ids || OLD.entity_id;
+        END IF;
+        IF cardinality(profile_ids) > 0 THEN
+            UPDATE caregiver_profiles AS cp
+            SET thumbnail_url = {THUMBNAIL_SQL.format(profile_id='cp.id')},
+                updated_at = timezone('utc', now())
+            WHERE cp.id = ANY(profile_ids);
+        END IF;
+        RETURN NULL;
+    END
+    $$
+    """,
+]
+
+TRIGGERS_SQL = [
+    """
+    CREATE TRIGGER caregiver_profiles_fill_card
+    BEFORE INSERT OR UPDATE OF user_id ON caregiver_profiles
+    FOR EACH ROW EXECUTE FUNCTION caregiver_profiles_fill_card()
+    """,
+    """
+    CREATE TRIGGER users_sync_caregiver_card
+    AFTER UPDATE OF full_name, profile_picture ON users
+    FOR EACH ROW
+    WHEN (OLD.full_name IS DISTINCT FROM NEW.full_name
+          OR OLD.profile_picture IS DISTINCT FROM NEW.profile_picture)
+    EXECUTE FUNCTION users_sync_caregiver_card()
+    """,
+    """
+    CREATE TRIGGER images_sync_caregiver_card
+    AFTER INSERT OR UPDATE OR DELETE ON images
+    FOR EACH ROW EXECUTE FUNCTION images_sync_caregiver_card()
+    """,
+]
+
+NEXT_BATCH_SQL = """
+SELECT max(id) FROM (
+    SELECT id FROM caregiver_profiles
+    WHERE (CAST(:after AS uuid) IS NULL OR id > CAST(:after AS uuid))
+    ORDER BY id
+    LIMIT :batch_size
+) AS batch
+"""
+
+# updated_at is left alone: the card holds the same data the API already served
+BACKFILL_SQL = f"""
+UPDATE caregiver_profiles AS cp
+SET user_full_name = coalesce(u.full_name, ''),
+    user_profile_picture = u.profile_picture,
+    thumbnail_url = {THUMBNAIL_SQL.format(profile_id='cp.id')}
+FROM users AS u
+WHERE u.id = cp.user_id
+  AND (CAST(:after AS uuid) IS NULL OR cp.id > CAST(:after AS uuid)) AND cp.id <= CAST(:upto AS uuid)
+"""
+
+
+def upgrade() -> None:
+    # Nullable columns without a default are a catalog-only change
+    op.add_column('caregiver_profiles', sa.Column('user_full_name', sa.String(length=255), nullable=True))
+    op.add_column('caregiver_profiles', sa.Column('user_profile_picture', sa.String(length=255), nullable=True))
+    op.add_column('caregiver_profiles', sa.Column('thumbnail_url', sa.String(), nullable=True))
+
+    # The thumbnail lookup (trigger and backfill) is one probe of this index
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_images_entity_type_entity_id_order',
+            'images',
+            ['entity_type', 'entity_id', 'order', 'created_at'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+    for statement in FUNCTIONS_SQL + TRIGGERS_SQL:
+        op.execute(statement)
+
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        after = None
+        while True:
+            upto = bind.execute(sa.text(NEXT_BATCH_SQL), {'after': after, 'batch_size': BATCH_SIZE}).scalar()
+            if upto is None:
+                break
+            bind.execute(sa.text(BACKFILL_SQL), {'after': after, 'upto': str(upto)})
+            after = str(upto)
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER IF EXISTS images_sync_caregiver_card ON images')
+    op.execute('DROP TRIGGER IF EXISTS users_sync_caregiver_card ON users')
+    op.execute('DROP TRIGGER IF EXISTS caregiver_profiles_fill_card ON caregiver_profiles')
+    op.execute('DROP FUNCTION IF EXISTS images_sync_caregiver_card()')
+    op.execute('DROP FUNCTION IF EXISTS users_sync_caregiver_card()')
+    op.execute('DROP FUNCTION IF EXISTS caregiver_profiles_fill_card()')
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_images_entity_type_entity_id_order',
+            table_name='images',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column('caregiver_profiles', 'thumbnail_url')
+    op.drop_column('caregiver_profiles', 'user_profile_picture')
+    op.drop_column('caregiver_profiles', 'user_full_name')
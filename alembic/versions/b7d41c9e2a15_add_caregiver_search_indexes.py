@@ -0,0 +1,70 @@
+"""add_caregiver_search_indexes
+
+Revision ID: b7d41c9e2a15
+Revises: 40e93af08220
+Create Date: 2026-10-17 09:12:31.402117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d41c9e2a15'
+down_revision: Union[str, None] = '40e93af08220'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Search only ever looks at available caregivers, so every index is partial on it
+AVAILABLE = sa.text('is_available')
+
+GIN_INDEXES = {
+    'ix_caregiver_profiles_services_offered_available': 'services_offered',
+    'ix_caregiver_profiles_accepted_pet_types_available': 'accepted_pet_types',
+    'ix_caregiver_profiles_preferred_pet_size_available': 'preferred_pet_size',
+}
+
+# max_price ORs the three prices; one btree each lets the planner BitmapOr them
+PRICE_INDEXES = {
+    'ix_caregiver_profiles_price_per_night_available': 'price_per_night',
+    'ix_caregiver_profiles_price_per_day_available': 'price_per_day',
+    'ix_caregiver_profiles_price_per_walk_available': 'price_per_walk',
+}
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction, and a plain
+    # CREATE INDEX would block profile writes for the whole build
+    with op.get_context().autocommit_block():
+        for name, column in GIN_INDEXES.items():
+            op.create_index(
+                name,
+                'caregiver_profiles',
+                [column],
+                postgresql_using='gin',
+                postgresql_where=AVAILABLE,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for name, column in PRICE_INDEXES.items():
+            op.create_index(
+                name,
+                'caregiver_profiles',
+                [column],
+                postgresql_where=AVAILABLE,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name in list(PRICE_INDEXES) + list(GIN_INDEXES):
+            op.drop_index(
+                name,
+                table_name='caregiver_profiles',
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,48 @@
+"""add_caregiver_location
+
+Revision ID: c3e8f0a4d2b6
+Revises: b7d41c9e2a15
+Create Date: 2026-10-17 10:41:05.118734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e8f0a4d2b6'
+down_revision: Union[str, None] = 'b7d41c9e2a15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Nullable columns without a default are a catalog-only change
+    op.add_column('caregiver_profiles', sa.Column('latitude', sa.Float(), nullable=True))
+    op.add_column('caregiver_profiles', sa.Column('longitude', sa.Float(), nullable=True))
+
+    # Radius search turns into a latitude range scan with longitude checked
+    # from the same index entries; only available, located caregivers are kept
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_caregiver_profiles_location_available',
+            'caregiver_profiles',
+            ['latitude', 'longitude'],
+            postgresql_where=sa.text('is_available AND latitude IS NOT NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_caregiver_profiles_location_available',
+            table_name='caregiver_profiles',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column('caregiver_profiles', 'longitude')
+    op.drop_column('caregiver_profiles', 'latitude')
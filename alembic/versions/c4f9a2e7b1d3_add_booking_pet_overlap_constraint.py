@@ -0,0 +1,57 @@
+"""add_booking_pet_overlap_constraint
+
+Revision ID: c4f9a2e7b1d3
+Revises: b2e6d4a9f1c7
+Create Date: 2026-10-17 20:36:18.730194
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f9a2e7b1d3'
+down_revision: Union[str, None] = 'b2e6d4a9f1c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Every status that still holds the dates, including bookings awaiting payment
+ACTIVE = "status IN ('PENDING', 'PAYMENT_REQUIRED', 'CONFIRMED')"
+
+# Existing double bookings would make ADD CONSTRAINT fail half way through;
+# find them first so the error says what to fix
+CONFLICTS_SQL = f"""
+SELECT a.id, b.id FROM bookings AS a
+JOIN bookings AS b
+  ON a.pet_id = b.pet_id AND a.id < b.id
+ AND tsrange(a.start_date, a.end_date) && tsrange(b.start_date, b.end_date)
+WHERE a.{ACTIVE} AND b.{ACTIVE}
+LIMIT 20
+"""
+
+
+def upgrade() -> None:
+    # btree_gist (enabled in e4b7c1d8f2a6) provides the uuid = operator for GiST
+    op.execute('CREATE EXTENSION IF NOT EXISTS btree_gist')
+
+    conflicts = op.get_bind().execute(sa.text(CONFLICTS_SQL)).all()
+    if conflicts:
+        pairs = ", ".join(f"{a}/{b}" for a, b in conflicts)
+        raise RuntimeError(
+            "Pets with overlapping PENDING/PAYMENT_REQUIRED/CONFIRMED bookings must be resolved (cancel or "
+            f"reject one of each pair) before this migration can run: {pairs}"
+        )
+
+    # Exclusion constraints can't be built CONCURRENTLY: writes to bookings wait
+    # for one table scan. The partial index itself only holds active bookings.
+    op.execute(
+        "ALTER TABLE bookings ADD CONSTRAINT ex_bookings_pet_id_period_active "
+        "EXCLUDE USING gist (pet_id WITH =, tsrange(start_date, end_date) WITH &&) "
+        f"WHERE ({ACTIVE})"
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('ex_bookings_pet_id_period_active', 'bookings', type_='exclude')
@@ -0,0 +1,80 @@
+"""add_search_versions
+
+Revision ID: d6a1e8b3f5c2
+Revises: c4f9a2e7b1d3
+Create Date: 2026-10-18 09:12:40.518273
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd6a1e8b3f5c2'
+down_revision: Union[str, None] = 'c4f9a2e7b1d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Columns a search result depends on: filters, sort keys and the card itself.
+# search_vector is derived from bio and home_type. user_id and updated_at are
+# not read, so touching only those leaves every cached search valid. Card
+# columns copied from users and images are written through caregiver_profiles,
+# so those triggers bump the version too.
+SEARCHED_COLUMNS = (
+    "bio", "years_of_experience", "services_offered", "accepted_pet_types",
+    "price_per_night", "price_per_walk", "price_per_day", "available_from", "available_to",
+    "maximum_pets", "home_type", "has_fenced_yard", "living_space_size", "emergency_transport",
+    "is_available", "preferred_pet_size", "latitude", "longitude",
+    "user_full_name", "user_profile_picture", "thumbnail_url", "rating", "total_reviews", "created_at",
+)
+
+TRIGGER_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION search_versions_bump() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    UPDATE search_versions SET version = version + 1 WHERE name = TG_TABLE_NAME;
+    RETURN NULL;
+END
+$$
+"""
+
+# Rows added or removed: one bump per statement, however many rows
+INSERT_DELETE_TRIGGER_SQL = """
+CREATE TRIGGER caregiver_profiles_bump_search_version
+AFTER INSERT OR DELETE OR TRUNCATE ON caregiver_profiles
+FOR EACH STATEMENT EXECUTE FUNCTION search_versions_bump()
+"""
+
+# Updates only when a searched column really changes. Other writes (e.g. a
+# rating recompute that lands on the same value) skip the shared row, so they
+# neither wait on its lock nor invalidate cached searches.
+UPDATE_TRIGGER_SQL = f"""
+CREATE TRIGGER caregiver_profiles_bump_search_version_on_update
+AFTER UPDATE OF {", ".join(SEARCHED_COLUMNS)} ON caregiver_profiles
+FOR EACH ROW
+WHEN (({", ".join("OLD." + c for c in SEARCHED_COLUMNS)})
+      IS DISTINCT FROM ({", ".join("NEW." + c for c in SEARCHED_COLUMNS)}))
+EXECUTE FUNCTION search_versions_bump()
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        'search_versions',
+        sa.Column('name', sa.String(length=50), nullable=False),
+        sa.Column('version', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('name'),
+    )
+    op.execute("INSERT INTO search_versions (name, version) VALUES ('caregiver_profiles', 0)")
+    op.execute(TRIGGER_FUNCTION_SQL)
+    op.execute(INSERT_DELETE_TRIGGER_SQL)
+    op.execute(UPDATE_TRIGGER_SQL)
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER IF EXISTS caregiver_profiles_bump_search_version_on_update ON caregiver_profiles')
+    op.execute('DROP TRIGGER IF EXISTS caregiver_profiles_bump_search_version ON caregiver_profiles')
+    op.execute('DROP FUNCTION IF EXISTS search_versions_bump()')
+    op.drop_table('search_versions')
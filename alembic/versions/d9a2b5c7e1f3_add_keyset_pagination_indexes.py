@@ -0,0 +1,53 @@
+"""add_keyset_pagination_indexes
+
+Revision ID: d9a2b5c7e1f3
+Revises: c3e8f0a4d2b6
+Create Date: 2026-10-17 12:03:47.660291
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9a2b5c7e1f3'
+down_revision: Union[str, None] = 'c3e8f0a4d2b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns, partial predicate). Each list endpoint filters on
+# the leading column(s) and pages with (created_at, id) > / < cursor, so the
+# seek and the ORDER BY are both answered by one index range scan.
+INDEXES = [
+    ('ix_caregiver_profiles_created_at_id_available', 'caregiver_profiles', ['created_at', 'id'], 'is_available'),
+    ('ix_bookings_owner_id_created_at_id', 'bookings', ['owner_id', 'created_at', 'id'], None),
+    ('ix_bookings_caregiver_id_created_at_id', 'bookings', ['caregiver_id', 'created_at', 'id'], None),
+    ('ix_bookings_created_at_id', 'bookings', ['created_at', 'id'], None),
+    ('ix_messages_chat_room_id_created_at_id', 'messages', ['chat_room_id', 'created_at', 'id'], None),
+    ('ix_reviews_caregiver_id_created_at_id', 'reviews', ['caregiver_id', 'created_at', 'id'], None),
+    ('ix_payments_payer_id_created_at_id', 'payments', ['payer_id', 'created_at', 'id'], None),
+    ('ix_payments_recipient_id_created_at_id', 'payments', ['recipient_id', 'created_at', 'id'], None),
+    ('ix_payments_created_at_id', 'payments', ['created_at', 'id'], None),
+    ('ix_pets_owner_id_created_at_id', 'pets', ['owner_id', 'created_at', 'id'], None),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_where=sa.text(where) if where else None,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,71 @@
+"""add_booking_period_index
+
+Revision ID: e4b7c1d8f2a6
+Revises: d9a2b5c7e1f3
+Create Date: 2026-10-17 14:22:31.904517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b7c1d8f2a6'
+down_revision: Union[str, None] = 'd9a2b5c7e1f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# tsrange() raises on a lower bound above the upper one, so a single legacy
+# booking saved with its dates reversed would fail the index build below and
+# every availability query that reaches it. Find them first so the error says
+# what to fix; which date is wrong is for whoever owns the booking to decide.
+REVERSED_DATES_SQL = """
+SELECT id FROM bookings WHERE end_date < start_date LIMIT 20
+"""
+
+
+def upgrade() -> None:
+    # btree_gist lets the uuid caregiver_id sit in the same GiST index as the range
+    op.execute('CREATE EXTENSION IF NOT EXISTS btree_gist')
+
+    reversed_ids = op.get_bind().execute(sa.text(REVERSED_DATES_SQL)).scalars().all()
+    if reversed_ids:
+        raise RuntimeError(
+            "Bookings with end_date before start_date must be corrected before this "
+            f"migration can run: {', '.join(str(booking_id) for booking_id in reversed_ids)}"
+        )
+
+    # Keep new ones out. NOT VALID only needs a brief lock; the validation
+    # scan then runs in its own transaction, under a lock that lets writes
+    # through, instead of holding the ADD CONSTRAINT lock for the whole scan.
+    op.execute(
+        "ALTER TABLE bookings ADD CONSTRAINT check_booking_end_after_start "
+        "CHECK (end_date >= start_date) NOT VALID"
+    )
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE bookings VALIDATE CONSTRAINT check_booking_end_after_start")
+
+    # Availability-aware search counts each candidate's bookings overlapping
+    # the requested window: caregiver_id = ? AND tsrange(start_date, end_date) && ?
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_bookings_caregiver_id_period',
+            'bookings',
+            ['caregiver_id', sa.text('tsrange(start_date, end_date)')],
+            postgresql_using='gist',
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_bookings_caregiver_id_period',
+            table_name='bookings',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_constraint('check_booking_end_after_start', 'bookings', type_='check')
@@ -0,0 +1,102 @@
+"""add_caregiver_search_vector
+
+Revision ID: f1c5a9e3b7d2
+Revises: e4b7c1d8f2a6
+Create Date: 2026-10-17 16:08:12.377940
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c5a9e3b7d2'
+down_revision: Union[str, None] = 'e4b7c1d8f2a6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 5000
+
+
+def vector_sql(row: str) -> str:
+    return (
+        f"setweight(to_tsvector('english', coalesce({row}home_type, '')), 'A') || "
+        f"setweight(to_tsvector('english', coalesce({row}bio, '')), 'B')"
+    )
+
+
+# A GENERATED ... STORED column would rewrite the whole table under an
+# ACCESS EXCLUSIVE lock. A plain nullable column is a catalog-only change; a
+# trigger keeps new writes current and the backfill below fills in the rest.
+TRIGGER_FUNCTION_SQL = f"""
+CREATE OR REPLACE FUNCTION caregiver_profiles_search_vector() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.search_vector := {vector_sql('NEW.')};
+    RETURN NEW;
+END
+$$
+"""
+
+TRIGGER_SQL = """
+CREATE TRIGGER caregiver_profiles_search_vector
+BEFORE INSERT OR UPDATE OF bio, home_type ON caregiver_profiles
+FOR EACH ROW EXECUTE FUNCTION caregiver_profiles_search_vector()
+"""
+
+# One short autocommitted transaction per batch, walking the primary key so
+# row locks are held for BATCH_SIZE rows at a time and no batch rescans the table
+BACKFILL_SQL = f"""
+WITH batch AS (
+    SELECT id FROM caregiver_profiles
+    WHERE (CAST(:after AS uuid) IS NULL OR id > CAST(:after AS uuid))
+    ORDER BY id
+    LIMIT :batch_size
+)
+UPDATE caregiver_profiles SET search_vector = {vector_sql('caregiver_profiles.')}
+FROM batch WHERE caregiver_profiles.id = batch.id
+RETURNING caregiver_profiles.id
+"""
+
+
+def upgrade() -> None:
+    op.add_column('caregiver_profiles', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+    op.execute(TRIGGER_FUNCTION_SQL)
+    op.execute(TRIGGER_SQL)
+
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        after = None
+        while True:
+            ids = bind.execute(
+                sa.text(BACKFILL_SQL), {'after': after, 'batch_size': BATCH_SIZE}
+            ).scalars().all()
+            if not ids:
+                break
+            after = str(max(ids))
+
+        op.create_index(
+            'ix_caregiver_profiles_search_vector_available',
+            'caregiver_profiles',
+            ['search_vector'],
+            postgresql_using='gin',
+            postgresql_where=sa.text('is_available'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_caregiver_profiles_search_vector_available',
+            table_name='caregiver_profiles',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.execute('DROP TRIGGER IF EXISTS caregiver_profiles_search_vector ON caregiver_profiles')
+    op.execute('DROP FUNCTION IF EXISTS caregiver_profiles_search_vector()')
+    op.drop_column('caregiver_profiles', 'search_vector')
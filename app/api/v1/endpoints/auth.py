@@ -9,7 +9,7 @@ from app.core import security
 from app.core.config import settings
 from app.schemas import user as user_schemas
 from app.models.user import User
-from app.core.security import get_password_hash, verify_password
+from app.core.security import get_password_hash_async, get_password_hash_pooled, verify_password_pooled
 from app.utils import email as email_utils
 import jwt
 from jwt.exceptions import PyJWTError
@@ -33,7 +33,7 @@ async def register_user(
     # Create user
     user = User(
         email=user_in.email,
-        hashed_password=get_password_hash(user_in.password),
+        hashed_password=await get_password_hash_async(user_in.password),
         full_name=user_in.full_name,
         phone=user_in.phone,
         address=user_in.address,
@@ -64,7 +64,7 @@ def login(
 ) -> Any:
     """OAuth2 compatible token login."""
     user = db.query(User).filter(User.email == form_data.username).first()
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user or not verify_password_pooled(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -180,7 +180,7 @@ def reset_password(
     if len(new_password) < 8:
         raise HTTPException(status_code=400, detail="Password must be at least 8 characters long")
     
-    user.hashed_password = get_password_hash(new_password)
+    user.hashed_password = get_password_hash_pooled(new_password)
     user.reset_password_token = None
     db.commit()
     
@@ -204,7 +204,7 @@ def update_user_me(
     if user_in.password:
         if len(user_in.password) < 8:
             raise HTTPException(status_code=400, detail="Password must be at least 8 characters long")
-        current_user.hashed_password = get_password_hash(user_in.password)
+        current_user.hashed_password = get_password_hash_pooled(user_in.password)
     
     if user_in.full_name:
         current_user.full_name = user_in.full_name
@@ -9,6 +9,9 @@ from app.models.pet import Pet
 from app.models.booking import Booking, BookingStatus
 from app.models.caregiver import CaregiverProfile
 from app.utils import email as email_utils
+from app.utils.availability import ACTIVE_BOOKING_STATUSES, commit_booking, ensure_capacity
+from app.utils.pagination import NEXT_CURSOR_HEADER, keyset_paginate
+from app.utils.serialization import serialize_response
 from datetime import datetime, timedelta
 from uuid import UUID
 
@@ -39,72 +42,84 @@ def create_booking_response(booking: Booking, current_user: User) -> Dict:
 @router.post("/", response_model=booking_schemas.BookingResponse)
 async def create_booking(
     *,
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_async_db),
     booking_in: booking_schemas.BookingCreate,
     current_user: User = Depends(deps.get_current_active_user)
 ) -> Any:
     """Create a new booking with email notifications."""
-    # Verify pet ownership with eager loading
-    pet = db.query(Pet).filter(Pet.id == booking_in.pet_id).first()
-    if not pet or pet.owner_id != current_user.id:
-        raise HTTPException(status_code=404, detail="Pet not found or not owned by user")
-
-    # Verify caregiver exists and is available
-    caregiver = db.query(CaregiverProfile).options(
-        joinedload(CaregiverProfile.user)
-    ).filter(
-        CaregiverProfile.id == booking_in.caregiver_id,
-        CaregiverProfile.is_available == True
-    ).first()
-    if not caregiver:
-        raise HTTPException(status_code=404, detail="Caregiver not found or not available")
-
-    # Calculate total price
-    total_price = calculate_booking_price(
-        booking_in.service_type,
-        booking_in.start_date,
-        booking_in.end_date,
-        caregiver
-    )
-
-    # Create booking
-    booking = Booking(
-        pet_id=booking_in.pet_id,
-        owner_id=current_user.id,
-        caregiver_id=booking_in.caregiver_id,
-        service_type=booking_in.service_type,
-        start_date=booking_in.start_date,
-        end_date=booking_in.end_date,
-        status=BookingStatus.PENDING,
-        total_price=total_price,
-        special_instructions=booking_in.special_instructions
-    )
-    
-    db.add(booking)
-    db.commit()
-    db.refresh(booking)
+    def _create(session: Session):
+        # Verify pet ownership with eager loading
+        pet = session.query(Pet).filter(Pet.id == booking_in.pet_id).first()
+        if not pet or pet.owner_id != current_user.id:
+            raise HTTPException(status_code=404, detail="Pet not found or not owned by user")
+
+        # Verify caregiver exists and is available
+        caregiver = session.query(CaregiverProfile).options(
+            joinedload(CaregiverProfile.user)
+        ).filter(
+            CaregiverProfile.id == booking_in.caregiver_id,
+            CaregiverProfile.is_available == True
+        ).first()
+        if not caregiver:
+            raise HTTPException(status_code=404, detail="Caregiver not found or not available")
+
+        if booking_in.end_date <= booking_in.start_date:
+            raise HTTPException(status_code=400, detail="end_date must be after start_date")
+
+        # Holds the caregiver's booking lock until the commit below; the pet's
+        # overlapping bookings are rejected by a database constraint instead.
+        # Waiting for it happens off the event loop (see run_db).
+        ensure_capacity(session, caregiver, booking_in.start_date, booking_in.end_date)
+
+        # Calculate total price
+        total_price = calculate_booking_price(
+            booking_in.service_type,
+            booking_in.start_date,
+            booking_in.end_date,
+            caregiver
+        )
+
+        # Create booking
+        booking = Booking(
+            pet_id=booking_in.pet_id,
+            owner_id=current_user.id,
+            caregiver_id=booking_in.caregiver_id,
+            service_type=booking_in.service_type,
+            start_date=booking_in.start_date,
+            end_date=booking_in.end_date,
+            status=BookingStatus.PENDING,
+            total_price=total_price,
+            special_instructions=booking_in.special_instructions
+        )
 
-    # Load relationships for response
-    db.refresh(booking, ['pet', 'owner', 'caregiver'])
+        session.add(booking)
+        commit_booking(session)
+        session.refresh(booking)
 
-    # Prepare booking details for emails
-    booking_details = {
-        "id": str(booking.id),
-        "pet_name": pet.name,
-        "pet_type": pet.pet_type,
-        "service_type": booking.service_type,
-        "start_date": booking.start_date.strftime("%Y-%m-%d %H:%M"),
-        "end_date": booking.end_date.strftime("%Y-%m-%d %H:%M"),
-        "owner_name": current_user.full_name,
-        "caregiver_name": caregiver.user.full_name,
-        "total_price": total_price,
-        "special_instructions": booking.special_instructions
-    }
+        # Load relationships for response
+        session.refresh(booking, ['pet', 'owner', 'caregiver'])
+
+        # Prepare booking details for emails
+        booking_details = {
+            "id": str(booking.id),
+            "pet_name": pet.name,
+            "pet_type": pet.pet_type,
+            "service_type": booking.service_type,
+            "start_date": booking.start_date.strftime("%Y-%m-%d %H:%M"),
+            "end_date": booking.end_date.strftime("%Y-%m-%d %H:%M"),
+            "owner_name": current_user.full_name,
+            "caregiver_name": caregiver.user.full_name,
+            "total_price": total_price,
+            "special_instructions": booking.special_instructions
+        }
+        return create_booking_response(booking, current_user), booking_details, caregiver.user.email
+
+    response, booking_details, caregiver_email = await deps.run_db(db, _create)
 
     try:
         # Send email to caregiver
         await email_utils.send_booking_notification_to_caregiver(
-            caregiver.user.email,
+            caregiver_email,
             booking_details
         )
         
@@ -116,43 +131,53 @@ async def create_booking(
     except Exception as e:
         print(f"Error sending booking emails: {str(e)}")
 
-    return create_booking_response(booking, current_user)
+    return response
 
 @router.get("/", response_model=List[booking_schemas.BookingResponse])
 async def list_bookings(
     *,
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_read_db),
     status: Optional[BookingStatus] = Query(None),
-    skip: int = 0,
-    limit: int = 20,
+    cursor: Optional[str] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
     current_user: User = Depends(deps.get_current_active_user)
 ) -> Any:
-    """List bookings for current user."""
-    query = db.query(Booking).options(
-        joinedload(Booking.pet),
-        joinedload(Booking.owner),
-        joinedload(Booking.caregiver).joinedload(CaregiverProfile.user)
-    )
-
-    if current_user.is_admin:
-        pass  # Admins can see all bookings
-    elif current_user.user_type == "caregiver":
-        caregiver = db.query(CaregiverProfile).filter(
-            CaregiverProfile.user_id == current_user.id
-        ).first()
-        if not caregiver:
-            raise HTTPException(status_code=404, detail="Caregiver profile not found")
-        query = query.filter(Booking.caregiver_id == caregiver.id)
-    else:
-        query = query.filter(Booking.owner_id == current_user.id)
+    """List bookings for current user, newest first (cursor paging via X-Next-Cursor)."""
+    def _list(session: Session):
+        query = session.query(Booking).options(
+            joinedload(Booking.pet),
+            joinedload(Booking.owner),
+            joinedload(Booking.caregiver).joinedload(CaregiverProfile.user)
+        )
 
-    if status:
-        query = query.filter(Booking.status == status)
+        if current_user.is_admin:
+            pass  # Admins can see all bookings
+        elif current_user.user_type == "caregiver":
+            caregiver = session.query(CaregiverProfile).filter(
+                CaregiverProfile.user_id == current_user.id
+            ).first()
+            if not caregiver:
+                raise HTTPException(status_code=404, detail="Caregiver profile not found")
+            query = query.filter(Booking.caregiver_id == caregiver.id)
+        else:
+            query = query.filter(Booking.owner_id == current_user.id)
+
+        if status:
+            query = query.filter(Booking.status == status)
+
+        bookings, next_cursor = keyset_paginate(
+            query, Booking.created_at, Booking.id, cursor, skip, limit
+        )
 
-    query = query.order_by(Booking.created_at.desc())
-    bookings = query.offset(skip).limit(limit).all()
+        # Build responses while the session is still bound to this call
+        return [create_booking_response(booking, current_user) for booking in bookings], next_cursor
 
-    return [create_booking_response(booking, current_user) for booking in bookings]
+    bookings, next_cursor = await deps.run_db(db, _list)
+    response = serialize_response(booking_schemas.booking_response_list_adapter, bookings)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return response
 
 @router.get("/{booking_id}", response_model=booking_schemas.BookingResponse)
 async def get_booking(
@@ -184,52 +209,60 @@ async def get_booking(
 @router.put("/{booking_id}/status", response_model=booking_schemas.BookingResponse)
 async def update_booking_status(
     *,
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_async_db),
     booking_id: UUID,
     status: BookingStatus,
     current_user: User = Depends(deps.get_current_active_user)
 ) -> Any:
     """Update booking status."""
-    booking = db.query(Booking).options(
-        joinedload(Booking.pet),
-        joinedload(Booking.owner),
-        joinedload(Booking.caregiver).joinedload(CaregiverProfile.user)
-    ).filter(Booking.id == booking_id).first()
-
-    if not booking:
-        raise HTTPException(status_code=404, detail="Booking not found")
+    def _update(session: Session):
+        booking = session.query(Booking).options(
+            joinedload(Booking.pet),
+            joinedload(Booking.owner),
+            joinedload(Booking.caregiver).joinedload(CaregiverProfile.user)
+        ).filter(Booking.id == booking_id).first()
+
+        if not booking:
+            raise HTTPException(status_code=404, detail="Booking not found")
+
+        if not current_user.is_admin:
+            caregiver = session.query(CaregiverProfile).filter(
+                CaregiverProfile.user_id == current_user.id,
+                CaregiverProfile.id == booking.caregiver_id
+            ).first()
+            if not caregiver:
+                raise HTTPException(status_code=403, detail="Not enough permissions")
+
+        # Re-activating a cancelled/rejected booking takes a slot again
+        if status in ACTIVE_BOOKING_STATUSES and booking.status not in ACTIVE_BOOKING_STATUSES:
+            ensure_capacity(
+                session, booking.caregiver, booking.start_date, booking.end_date, exclude_booking_id=booking.id
+            )
+
+        booking.status = status
+        commit_booking(session)
+        session.refresh(booking)
 
-    if not current_user.is_admin:
-        caregiver = db.query(CaregiverProfile).filter(
-            CaregiverProfile.user_id == current_user.id,
-            CaregiverProfile.id == booking.caregiver_id
-        ).first()
-        if not caregiver:
-            raise HTTPException(status_code=403, detail="Not enough permissions")
+        booking_details = {
+            "id": str(booking.id),
+            "pet_name": booking.pet.name,
+            "service_type": booking.service_type,
+            "start_date": booking.start_date.strftime("%Y-%m-%d %H:%M"),
+            "end_date": booking.end_date.strftime("%Y-%m-%d %H:%M"),
+            "owner_name": booking.owner.full_name,
+            "caregiver_name": booking.caregiver.user.full_name,
+            "total_price": booking.total_price
+        }
+        return create_booking_response(booking, current_user), booking_details, booking.owner.email
 
-    booking.status = status
-    db.commit()
-    db.refresh(booking)
+    response, booking_details, owner_email = await deps.run_db(db, _update)
 
     try:
-        await email_utils.send_booking_status_update(
-            booking.owner.email,
-            {
-                "id": str(booking.id),
-                "pet_name": booking.pet.name,
-                "service_type": booking.service_type,
-                "start_date": booking.start_date.strftime("%Y-%m-%d %H:%M"),
-                "end_date": booking.end_date.strftime("%Y-%m-%d %H:%M"),
-                "owner_name": booking.owner.full_name,
-                "caregiver_name": booking.caregiver.user.full_name,
-                "total_price": booking.total_price
-            },
-            status.value
-        )
+        await email_utils.send_booking_status_update(owner_email, booking_details, status.value)
     except Exception as e:
         print(f"Error sending status update email: {str(e)}")
 
-    return create_booking_response(booking, current_user)
+    return response
 
 @router.post("/{booking_id}/cancel", response_model=booking_schemas.BookingResponse)
 async def cancel_booking(
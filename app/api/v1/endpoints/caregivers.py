@@ -1,15 +1,31 @@
 # app/api/v1/endpoints/caregivers.py
-from typing import List, Optional, Any
-from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List, Literal, Optional, Any
+from datetime import date, datetime, timedelta
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 from app.api import deps
 from app.schemas import caregiver as caregiver_schemas
 from app.models.user import User, UserType
+from app.models.booking import Booking
 from app.models.caregiver import CaregiverProfile
+from app.models.caregiver_service_price import CaregiverServicePrice
+from app.models.search_version import CAREGIVER_PROFILES_VERSION, SearchVersion
 from uuid import UUID
-from sqlalchemy import cast, String, or_
-from sqlalchemy.dialects.postgresql import ARRAY
-from sqlalchemy.orm import joinedload
+from sqlalchemy import func, null, select
+from app.core.config import settings
+from app.utils.caregiver_search import (
+    after_distance_cursor, after_rank_cursor, distance_km, facet_counts, facet_counts_query, facet_filters,
+    matches_text, normalize_search_params, offered_price, radius_filters, search_cache_for, search_cache_key,
+    search_filters, service_key, text_query, text_rank
+)
+from app.utils.availability import (
+    availability_calendar, cache_calendar, cached_calendar, has_capacity, overlaps, validate_window,
+)
+from app.utils.ranking import DISTANCE, RANKED_SORTS, candidate_columns, candidate_matrix, rank_page, sort_keys
+from app.utils.etag import etag_matches, make_etag, not_modified, set_etag
+from app.utils.geocoding import geocode
+from app.utils.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor, keyset_paginate
+from app.utils.serialization import serialize_response
 
 router = APIRouter()
 
@@ -44,49 +60,310 @@ async def create_caregiver_profile(
     db.refresh(profile)
     return profile
 
+def _search_version(session: Session, window) -> tuple:
+    """
+    Every profile write that changes what a search can return bumps the
+    caregiver_profiles search version in the same transaction, so that one
+    primary-key lookup versions every possible search result. Name, picture and image changes reach it too: the card
+    triggers write through caregiver_profiles.
+    """
+    version = (session.execute(
+        select(SearchVersion.version).where(SearchVersion.name == CAREGIVER_PROFILES_VERSION)
+    ).scalar(),)
+    if window:
+        # Bookings entering, leaving or changing status inside the window
+        version = (*version, *session.execute(
+            select(func.count(Booking.id), func.max(Booking.updated_at)).where(overlaps(*window))
+        ).one())
+    return tuple(version)
+
+
+def _cached_response(request: Request, cached) -> Response:
+    etag, body, next_cursor = cached
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response = Response(content=body, media_type="application/json")
+    set_etag(response, etag)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return response
+
+
 @router.get("/search", response_model=List[caregiver_schemas.CaregiverPublicProfile])
 async def search_caregivers(
     *,
-    db: Session = Depends(deps.get_db),
+    request: Request,
+    db: Session = Depends(deps.get_read_db),
+    q: Optional[str] = Query(None, max_length=200),
     service_type: Optional[str] = None,
     pet_type: Optional[str] = None,
     max_price: Optional[float] = None,
     pet_size: Optional[str] = None,
     location: Optional[str] = None,
-    skip: int = 0,
-    limit: int = 20,
+    radius_km: Optional[float] = Query(None, gt=0, le=settings.SEARCH_MAX_RADIUS_KM),
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    sort: Optional[Literal["relevance", "price", "rating", "distance"]] = None,
+    cursor: Optional[str] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
     current_user: User = Depends(deps.get_current_active_user)
 ) -> Any:
     """
     Search for caregivers with filters.
+
+    Results are newest caregivers first; with `location` ("lat,lng" or a
+    known city) they are limited to `radius_km` and sorted nearest first.
+    `q` matches bio and home type text (web search syntax: "phrases", OR,
+    -word) and sorts best match first.
+    With `start_date` and `end_date`, caregivers whose active bookings
+    (PENDING, PAYMENT_REQUIRED, CONFIRMED) in that window already reach
+    `maximum_pets` are left out.
+    `sort` overrides the order: relevance (price fit, review-weighted
+    rating, experience, distance and recency), price (for `service_type`),
+    rating, or distance (requires `location`). `max_price` applies to the
+    price of `service_type`, or to any offered service without one.
+    Pass the X-Next-Cursor header of a response back as `cursor` to get the
+    following page. Pages are cached in-process until a caregiver profile,
+    caregiver user or review changes.
     """
-    query = db.query(CaregiverProfile).options(joinedload(CaregiverProfile.user))
-    query = query.filter(CaregiverProfile.is_available == True)
-    
-    if service_type:
-        query = query.filter(
-            CaregiverProfile.services_offered.any(cast(service_type, String))
-        )
-    if pet_type:
-        query = query.filter(
-            CaregiverProfile.accepted_pet_types.any(cast(pet_type, String))
-        )
-    if max_price:
-        query = query.filter(or_(
-            CaregiverProfile.price_per_night <= max_price,
-            CaregiverProfile.price_per_day <= max_price,
-            CaregiverProfile.price_per_walk <= max_price
+    point = geocode(location) if location else None
+    radius = radius_km or settings.SEARCH_DEFAULT_RADIUS_KM
+    if sort == "distance" and point is None:
+        raise HTTPException(status_code=400, detail="sort=distance requires a location")
+    service_type, pet_type, max_price, pet_size, q = normalize_search_params(
+        service_type, pet_type, max_price, pet_size, q
+    )
+    # Cheapest-first for a known service is an index scan; everything else ranked is scored
+    price_service = service_key(service_type) if sort == "price" else None
+    ranked = sort in RANKED_SORTS and not price_service
+    after = decode_cursor(cursor, float, UUID) if cursor and (point or ranked or q) else None
+    window = validate_window(start_date, end_date)
+    cache = search_cache_for(window)
+
+    cache_key = None
+    if settings.SEARCH_CACHE_ENABLED:
+        cache_key = search_cache_key(
+            service_type, pet_type, max_price, pet_size, point, radius, cursor, skip, limit, window, sort, q
+        )
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return _cached_response(request, cached)
+
+    def _search(session: Session):
+        version = _search_version(session, window)
+        etag = make_etag(
+            "caregiver-search", version, q,
+            service_type, pet_type, max_price, pet_size, point, radius, window, sort, cursor, skip, limit
+        )
+        if etag_matches(request, etag):
+            return etag, None, None
+
+        # The price-ordered path applies max_price on its own join instead
+        criteria = search_filters(service_type, pet_type, None if price_service else max_price, pet_size)
+        if window:
+            criteria.append(has_capacity(*window))
+        tsquery = text_query(q) if q else None
+        if tsquery is not None:
+            criteria.append(matches_text(tsquery))
+
+        if price_service:
+            return (etag, *_by_service_price(session, criteria))
+        if ranked:
+            return (etag, *_ranked(session, criteria, tsquery))
+
+        if point is None and tsquery is None:
+            query = session.query(CaregiverProfile).filter(*criteria)
+            profiles, next_cursor = keyset_paginate(
+                query, CaregiverProfile.created_at, CaregiverProfile.id, cursor, skip, limit
+            )
+            return etag, profiles, next_cursor
+
+        distance = None
+        if point is not None:
+            distance = distance_km(*point)
+            criteria.extend(radius_filters(*point, radius, distance))
+        if tsquery is not None and sort != "distance":
+            # Best text match first; a location still limits and reports distance
+            key = text_rank(tsquery)
+            seek, order = after_rank_cursor, key.desc()
+        else:
+            key = distance
+            seek, order = after_distance_cursor, distance
+        query = session.query(
+            CaregiverProfile, key, distance if distance is not None else null()
+        ).filter(*criteria)
+        if after:
+            query = query.filter(seek(key, *after))
+        else:
+            query = query.offset(skip)
+        # One row past the page says whether there is a next one
+        rows = query.order_by(order, CaregiverProfile.id).limit(limit + 1).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        profiles = []
+        for profile, _, km in rows:
+            if km is not None:
+                profile.distance_km = round(km, 2)
+            profiles.append(profile)
+        next_cursor = encode_cursor(rows[-1][1], rows[-1][0].id) if has_more else None
+        return etag, profiles, next_cursor
+
+    def _by_service_price(session: Session, criteria):
+        # Walk ix_caregiver_service_prices_service_type_price_available in price
+        # order and join each row back to its profile
+        distance = distance_km(*point) if point else None
+        query = session.query(
+            CaregiverProfile,
+            CaregiverServicePrice.price,
+            CaregiverServicePrice.caregiver_id,
+            distance if distance is not None else null()
+        ).join(
+            CaregiverServicePrice, CaregiverServicePrice.caregiver_id == CaregiverProfile.id
+        ).filter(
+            CaregiverServicePrice.service_type == price_service,
+            CaregiverServicePrice.is_available == True,
+            *criteria
+        )
+        if max_price:
+            query = query.filter(CaregiverServicePrice.price <= max_price)
+        if point:
+            query = query.filter(*radius_filters(*point, radius, distance))
+        rows, next_cursor = keyset_paginate(
+            query, CaregiverServicePrice.price, CaregiverServicePrice.caregiver_id,
+            cursor, skip, limit, descending=False
+        )
+        profiles = []
+        for profile, _, _, km in rows:
+            if km is not None:
+                profile.distance_km = round(km, 2)
+            profiles.append(profile)
+        return profiles, next_cursor
+
+    def _ranked(session: Session, criteria, tsquery):
+        # Score the newest matching candidates column-wise, then load only the page
+        distance = distance_km(*point) if point else None
+        rank = text_rank(tsquery) if tsquery is not None else None
+        query = select(*candidate_columns(service_type, distance, rank)).where(*criteria)
+        if point:
+            query = query.where(*radius_filters(*point, radius, distance))
+        rows = session.execute(
+            query.order_by(CaregiverProfile.created_at.desc(), CaregiverProfile.id.desc())
+            .limit(settings.SEARCH_RANK_MAX_CANDIDATES)
+        ).all()
+        ids, matrix = candidate_matrix(rows)
+        keys = sort_keys(matrix, sort, max_price, radius if point else None)
+        positions, page_keys = rank_page(ids, keys, after, skip, limit + 1)
+        has_more = len(positions) > limit
+        positions, page_keys = positions[:limit], page_keys[:limit]
+
+        loaded = {
+            profile.id: profile
+            for profile in session.query(CaregiverProfile).filter(
+                CaregiverProfile.id.in_([ids[i] for i in positions])
+            )
+        }
+        profiles = []
+        for i in positions:
+            profile = loaded.get(ids[i])
+            if profile is None:
+                continue
+            if point:
+                profile.distance_km = round(float(matrix[i, DISTANCE]), 2)
+            profiles.append(profile)
+        next_cursor = (
+            encode_cursor(page_keys[-1], ids[positions[-1]]) if has_more else None
+        )
+        return profiles, next_cursor
+
+    etag, profiles, next_cursor = await deps.run_db(db, _search)
+    if profiles is None:
+        return not_modified(etag)
+    response = serialize_response(caregiver_schemas.caregiver_public_list_adapter, profiles)
+    if cache_key is not None:
+        cache.set(cache_key, (etag, response.body, next_cursor))
+    set_etag(response, etag)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return response
+
+@router.get("/search/facets", response_model=caregiver_schemas.CaregiverSearchFacets)
+async def search_caregiver_facets(
+    *,
+    request: Request,
+    db: Session = Depends(deps.get_read_db),
+    q: Optional[str] = Query(None, max_length=200),
+    service_type: Optional[str] = None,
+    pet_type: Optional[str] = None,
+    max_price: Optional[float] = None,
+    pet_size: Optional[str] = None,
+    location: Optional[str] = None,
+    radius_km: Optional[float] = Query(None, gt=0, le=settings.SEARCH_MAX_RADIUS_KM),
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    current_user: User = Depends(deps.get_current_active_user)
+) -> Any:
+    """
+    Counts per service type, pet type, pet size and price bucket for the
+    same filters as /search. Each facet is counted with every filter except
+    its own, so the counts show what choosing another value would return;
+    `total` applies all of them. Price buckets use the available
+    `service_type` price (or the cheapest available one), the same price
+    max_price filters on.
+    """
+    point = geocode(location) if location else None
+    radius = radius_km or settings.SEARCH_DEFAULT_RADIUS_KM
+    window = validate_window(start_date, end_date)
+    service_type, pet_type, max_price, pet_size, q = normalize_search_params(
+        service_type, pet_type, max_price, pet_size, q
+    )
+    cache = search_cache_for(window)
+
+    cache_key = None
+    if settings.SEARCH_CACHE_ENABLED:
+        cache_key = ("facets", search_cache_key(
+            service_type, pet_type, max_price, pet_size, point, radius, None, 0, 0, window, None, q
         ))
-    if pet_size:
-        query = query.filter(
-            CaregiverProfile.preferred_pet_size.any(cast(pet_size, String))
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return _cached_response(request, cached)
+
+    width = settings.SEARCH_FACET_PRICE_BUCKET_WIDTH
+    buckets = settings.SEARCH_FACET_PRICE_BUCKETS
+
+    def _facets(session: Session):
+        etag = make_etag(
+            "caregiver-facets", _search_version(session, window), q,
+            service_type, pet_type, max_price, pet_size, point, radius, window, width, buckets
         )
-    if location:
-        # For future implementation with geocoding
-        pass
-    
-    caregivers = query.offset(skip).limit(limit).all()
-    return caregivers
+        if etag_matches(request, etag):
+            return etag, None
+
+        base = [CaregiverProfile.is_available == True]
+        if window:
+            base.append(has_capacity(*window))
+        if q:
+            base.append(matches_text(text_query(q)))
+        if point:
+            base.extend(radius_filters(*point, radius, distance_km(*point)))
+        statement = facet_counts_query(
+            base,
+            facet_filters(service_type, pet_type, max_price, pet_size),
+            offered_price(service_type),
+            width,
+            buckets,
+        )
+        return etag, facet_counts(session.execute(statement).all(), width, buckets)
+
+    etag, facets = await deps.run_db(db, _facets)
+    if facets is None:
+        return not_modified(etag)
+    response = serialize_response(caregiver_schemas.caregiver_search_facets_adapter, facets)
+    if cache_key is not None:
+        cache.set(cache_key, (etag, response.body, None))
+    set_etag(response, etag)
+    return response
 
 @router.get("/profile/me", response_model=caregiver_schemas.CaregiverProfile)
 async def get_my_caregiver_profile(
@@ -113,12 +390,25 @@ async def get_my_caregiver_profile(
 @router.get("/{caregiver_id}", response_model=caregiver_schemas.CaregiverPublicProfile)
 async def get_caregiver_profile(
     caregiver_id: UUID,
+    request: Request,
+    response: Response,
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_active_user)
 ) -> Any:
     """
     Get specific caregiver's public profile.
     """
+    # Version probe: the card triggers bump updated_at on user and image changes,
+    # so one timestamp from a primary key lookup covers the whole response
+    updated_at = db.execute(
+        select(CaregiverProfile.updated_at).where(CaregiverProfile.id == caregiver_id)
+    ).scalar()
+    if updated_at is not None:
+        etag = make_etag("caregiver", caregiver_id, updated_at)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        set_etag(response, etag)
+
     profile = db.query(CaregiverProfile).filter(CaregiverProfile.id == caregiver_id).first()
     if not profile:
         raise HTTPException(
@@ -127,6 +417,60 @@ async def get_caregiver_profile(
         )
     return profile
 
+@router.get("/{caregiver_id}/availability", response_model=caregiver_schemas.CaregiverAvailability)
+async def get_caregiver_availability(
+    caregiver_id: UUID,
+    request: Request,
+    db: Session = Depends(deps.get_read_db),
+    from_date: Optional[date] = Query(None, alias="from"),
+    to_date: Optional[date] = Query(None, alias="to"),
+    current_user: User = Depends(deps.get_current_active_user)
+) -> Any:
+    """
+    Remaining capacity per day from `from` to `to` inclusive (default: the
+    next AVAILABILITY_DEFAULT_DAYS days), clipped to the caregiver's
+    available_from/available_to. A day's `booked` is the most pets staying
+    at any one moment of it, so a checkout and a check-in on the same day
+    share a slot.
+    """
+    from_date = from_date or datetime.utcnow().date()
+    to_date = to_date or from_date + timedelta(days=settings.AVAILABILITY_DEFAULT_DAYS - 1)
+    if to_date < from_date:
+        raise HTTPException(status_code=400, detail="'to' must not be before 'from'")
+    if (to_date - from_date).days >= settings.AVAILABILITY_MAX_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.AVAILABILITY_MAX_DAYS} days can be requested at once"
+        )
+
+    cache_key = (from_date, to_date)
+    if settings.AVAILABILITY_CACHE_ENABLED:
+        cached = cached_calendar(caregiver_id, cache_key)
+        if cached is not None:
+            return _cached_response(request, (*cached, None))
+
+    def _calendar(session: Session):
+        caregiver = session.get(CaregiverProfile, caregiver_id)
+        if caregiver is None:
+            return None
+        return availability_calendar(session, caregiver, from_date, to_date)
+
+    calendar = await deps.run_db(db, _calendar)
+    if calendar is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Caregiver profile not found"
+        )
+    response = serialize_response(caregiver_schemas.caregiver_availability_adapter, calendar)
+    # The body is small, so tag what was actually computed
+    etag = make_etag("caregiver-availability", response.body)
+    if settings.AVAILABILITY_CACHE_ENABLED:
+        cache_calendar(caregiver_id, cache_key, (etag, response.body))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    return response
+
 @router.put("/profile", response_model=caregiver_schemas.CaregiverProfile)
 async def update_caregiver_profile(
     *,
@@ -1,12 +1,13 @@
 # app/api/v1/endpoints/messages.py
-from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect, status, Query, Response
+from sqlalchemy.orm import Session, selectinload
 from typing import List, Optional
 from uuid import UUID
 import json
 import logging
 
-from app.core.database import get_db
+from app.api import deps
+from app.core.database import get_db, run_db
 from app.core.security import get_current_user, get_current_user_ws
 from app.core.websockets import manager
 from app.models.user import User
@@ -20,6 +21,7 @@ from app.schemas.message import (
     MessageRead
 )
 from app.utils.message import MessageValidator
+from app.utils.pagination import NEXT_CURSOR_HEADER, keyset_paginate
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -64,28 +66,29 @@ async def create_chat_room(
 @router.get("/chat-rooms/{chat_room_id}/messages/", response_model=List[MessageSchema])
 async def get_messages(
     chat_room_id: UUID,
+    response: Response,
+    cursor: Optional[str] = None,
     skip: int = Query(0, ge=0),
-    limit: int = Query(50, le=100),
+    limit: int = Query(50, ge=1, le=100),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(deps.get_read_db)
 ):
-    """Get messages from a specific chat room"""
-    chat_room = db.query(ChatRoom).filter(ChatRoom.id == chat_room_id).first()
-    if not chat_room:
-        raise HTTPException(status_code=404, detail="Chat room not found")
-    
-    if chat_room.booking:
-        if current_user.id != chat_room.booking.owner_id and current_user.id != chat_room.booking.caregiver_id:
-            raise HTTPException(status_code=403, detail="Not authorized to access this chat room")
-    
-    messages = (
-        db.query(Message)
-        .filter(Message.chat_room_id == chat_room_id)
-        .order_by(Message.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+    """Get messages from a specific chat room, newest first (cursor paging via X-Next-Cursor)"""
+    def _get_messages(session: Session):
+        chat_room = session.query(ChatRoom).filter(ChatRoom.id == chat_room_id).first()
+        if not chat_room:
+            raise HTTPException(status_code=404, detail="Chat room not found")
+
+        if chat_room.booking:
+            if current_user.id != chat_room.booking.owner_id and current_user.id != chat_room.booking.caregiver_id:
+                raise HTTPException(status_code=403, detail="Not authorized to access this chat room")
+
+        query = session.query(Message).filter(Message.chat_room_id == chat_room_id)
+        return keyset_paginate(query, Message.created_at, Message.id, cursor, skip, limit)
+
+    messages, next_cursor = await run_db(db, _get_messages)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     return messages
 
 @router.get("/chat-rooms/", response_model=List[ChatRoomSchema])
@@ -96,6 +99,7 @@ async def get_user_chat_rooms(
     """Get all chat rooms for the current user"""
     chat_rooms = (
         db.query(ChatRoom)
+        .options(selectinload(ChatRoom.messages))
         .join(Booking)
         .filter(
             (Booking.owner_id == current_user.id) | 
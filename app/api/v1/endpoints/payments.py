@@ -1,5 +1,5 @@
 # app/api/v1/endpoints/payments.py
-from fastapi import APIRouter, Depends, HTTPException, Request, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, BackgroundTasks
 from sqlalchemy.orm import Session
 from app.api import deps
 from app.utils.stripe import StripeService
@@ -9,7 +9,9 @@ from app.models.booking import Booking, BookingStatus
 from app.models.user import User
 from app.schemas import payment as payment_schemas
 from app.utils import email as email_utils
-from typing import Any, Dict, List
+from app.utils.pagination import NEXT_CURSOR_HEADER, keyset_paginate
+from app.utils.serialization import serialize_response
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 from uuid import UUID
 
@@ -355,25 +357,33 @@ async def list_refunds(
 @router.get("/history", response_model=payment_schemas.PaymentListResponse)
 async def get_payment_history(
     *,
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_read_db),
     current_user: User = Depends(deps.get_current_active_user),
-    skip: int = 0,
-    limit: int = 20
+    cursor: Optional[str] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100)
 ) -> Any:
-    """Get payment history for current user."""
-    # Build base query
-    query = db.query(Payment)
-    
-    # Filter based on user role
-    if not current_user.is_admin:
-        query = query.filter(
-            (Payment.payer_id == current_user.id) | 
-            (Payment.recipient_id == current_user.id)
-        )
-    
-    # Get total count and items
-    total = query.count()
-    items = query.order_by(Payment.created_at.desc()).offset(skip).limit(limit).all()
+    """Get payment history for current user, newest first (cursor paging via X-Next-Cursor)."""
+    def _history(session: Session) -> Dict[str, Any]:
+        # Build base query
+        query = session.query(Payment)
+
+        # Filter based on user role
+        if not current_user.is_admin:
+            query = query.filter(
+                (Payment.payer_id == current_user.id) |
+                (Payment.recipient_id == current_user.id)
+            )
+
+        # Cursor pages skip the count: it re-scans every matching row per page,
+        # and next_cursor already says whether another page exists
+        total = None if cursor else query.count()
+        items, next_cursor = keyset_paginate(query, Payment.created_at, Payment.id, cursor, skip, limit)
+        return {"total": total, "items": items, "next_cursor": next_cursor}
+
+    result = await deps.run_db(db, _history)
+    total = result["total"]
+    items = result["items"]
     
     # Calculate summary
     summary = {
@@ -386,11 +396,15 @@ async def get_payment_history(
         "pending_payments": sum(1 for item in items if item.status == PaymentStatus.PENDING)
     }
     
-    return {
+    response = serialize_response(payment_schemas.payment_list_response_adapter, {
         "items": items,
         "total": total,
+        "has_more": result["next_cursor"] is not None,
         "summary": payment_schemas.PaymentSummary(**summary)
-    }
+    })
+    if result["next_cursor"]:
+        response.headers[NEXT_CURSOR_HEADER] = result["next_cursor"]
+    return response
 
 @router.get("/booking/{booking_id}", response_model=payment_schemas.PaymentResponse)
 async def get_booking_payment(
@@ -1,7 +1,8 @@
 # app/api/v1/endpoints/pets.py
-from typing import List, Any
-from fastapi import APIRouter, Depends, HTTPException, status, Request
-from sqlalchemy.orm import Session
+from typing import List, Any, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status, Request
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, selectinload
 from app.api import deps
 from app.schemas import pet as pet_schemas
 from app.models.user import User
@@ -10,6 +11,9 @@ from app.models.image import Image
 from uuid import UUID
 import logging
 from fastapi.responses import Response
+from app.utils.etag import etag_matches, make_etag, not_modified, set_etag
+from app.utils.pagination import NEXT_CURSOR_HEADER, keyset_paginate
+from app.utils.serialization import serialize_response
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -99,24 +103,27 @@ def create_pet(
 async def read_pets(
     request: Request,
     db: Session = Depends(deps.get_db),
-    skip: int = 0,
-    limit: int = 100,
+    cursor: Optional[str] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=100),
     current_user: User = Depends(deps.get_current_active_user)
 ) -> Any:
-    """Retrieve all pets."""
+    """Retrieve all pets, oldest first (cursor paging via X-Next-Cursor)."""
     try:
         logger.info(f"Fetching pets for user: {current_user.id}")
-        if current_user.is_admin:
-            pets = db.query(Pet).offset(skip).limit(limit).all()
-        else:
-            pets = (
-                db.query(Pet)
-                .filter(Pet.owner_id == current_user.id)
-                .offset(skip)
-                .limit(limit)
-                .all()
-            )
-        return pets
+        # images are serialized for every pet; load them in one extra query
+        query = db.query(Pet).options(selectinload(Pet.images))
+        if not current_user.is_admin:
+            query = query.filter(Pet.owner_id == current_user.id)
+        pets, next_cursor = keyset_paginate(
+            query, Pet.created_at, Pet.id, cursor, skip, limit, descending=False
+        )
+        response = serialize_response(pet_schemas.pet_list_adapter, pets)
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
+        return response
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching pets: {str(e)}")
         raise HTTPException(
@@ -128,12 +135,28 @@ async def read_pets(
 async def read_pet(
     pet_id: UUID,
     request: Request,
+    response: Response,
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_active_user)
 ) -> Any:
     """Get specific pet by ID."""
     try:
         logger.info(f"Fetching pet {pet_id} for user: {current_user.id}")
+        # Version probe: owner for the permission check, plus everything the
+        # representation depends on (the pet row and its images)
+        pet_images = (Image.entity_id == Pet.id) & (Image.entity_type == "pet")
+        image_count = select(func.count(Image.id)).where(pet_images).correlate(Pet).scalar_subquery()
+        image_version = select(func.max(Image.updated_at)).where(pet_images).correlate(Pet).scalar_subquery()
+        version = db.execute(
+            select(Pet.owner_id, Pet.updated_at, image_count, image_version)
+            .where(Pet.id == pet_id)
+        ).first()
+        if version is not None and (current_user.is_admin or version.owner_id == current_user.id):
+            etag = make_etag("pet", pet_id, *version)
+            if etag_matches(request, etag):
+                return not_modified(etag)
+            set_etag(response, etag)
+
         pet = db.query(Pet).filter(Pet.id == pet_id).first()
         
         if not pet:
@@ -1,6 +1,7 @@
 # app/api/v1/endpoints/reviews.py
 from typing import List, Any, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session, joinedload
 from app.api import deps
 from app.schemas import review as review_schemas
@@ -9,6 +10,9 @@ from app.models.review import Review
 from app.models.booking import Booking, BookingStatus
 from app.models.caregiver import CaregiverProfile
 from app.utils import email as email_utils
+from app.utils.etag import etag_matches, make_etag, not_modified, set_etag
+from app.utils.pagination import NEXT_CURSOR_HEADER, keyset_paginate
+from app.utils.serialization import serialize_response
 from datetime import datetime, timedelta
 from uuid import UUID
 
@@ -91,21 +95,51 @@ async def create_review(
 @router.get("/caregiver/{caregiver_id}", response_model=List[review_schemas.Review])
 async def list_caregiver_reviews(
     *,
-    db: Session = Depends(deps.get_db),
+    request: Request,
+    db: Session = Depends(deps.get_read_db),
     caregiver_id: UUID,
-    skip: int = 0,
-    limit: int = 20,
+    cursor: Optional[str] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
     current_user: User = Depends(deps.get_current_active_user)
 ) -> Any:
-    """List all reviews for a caregiver."""
-    reviews = db.query(Review).filter(
-        Review.caregiver_id == caregiver_id
-    ).options(
-        joinedload(Review.reviewer),
-        joinedload(Review.caregiver)
-    ).offset(skip).limit(limit).all()
-
-    return reviews
+    """List all reviews for a caregiver, newest first (cursor paging via X-Next-Cursor)."""
+    def _list(session: Session):
+        # Version probe over the caregiver's reviews and their reviewers' names
+        version = session.execute(
+            select(
+                func.count(Review.id),
+                func.max(Review.updated_at),
+                func.max(User.updated_at)
+            ).join(User, Review.reviewer_id == User.id)
+            .where(Review.caregiver_id == caregiver_id)
+        ).one()
+        caregiver_version = session.execute(
+            select(User.updated_at)
+            .join(CaregiverProfile, CaregiverProfile.user_id == User.id)
+            .where(CaregiverProfile.id == caregiver_id)
+        ).scalar()
+        etag = make_etag("reviews", caregiver_id, tuple(version), caregiver_version, cursor, skip, limit)
+        if etag_matches(request, etag):
+            return etag, None, None
+
+        query = session.query(Review).filter(
+            Review.caregiver_id == caregiver_id
+        ).options(
+            joinedload(Review.reviewer),
+            joinedload(Review.caregiver)
+        )
+        reviews, next_cursor = keyset_paginate(query, Review.created_at, Review.id, cursor, skip, limit)
+        return etag, reviews, next_cursor
+
+    etag, reviews, next_cursor = await deps.run_db(db, _list)
+    if reviews is None:
+        return not_modified(etag)
+    response = serialize_response(review_schemas.review_list_adapter, reviews)
+    set_etag(response, etag)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return response
 
 @router.get("/booking/{booking_id}", response_model=review_schemas.Review)
 async def get_booking_review(
@@ -0,0 +1,176 @@
+# app/core/cache.py
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional
+from app.core.config import settings
+import threading
+import time
+
+
+class CacheBackend(ABC):
+    """
+    Interface the application caches are written against. The in-process
+    TTLCache is the only implementation today; a shared backend (e.g. Redis)
+    can be added by implementing these methods and registering a factory in
+    CACHE_BACKENDS. Keys are hashable tuples; a shared backend is expected to
+    serialize them (and the values) itself, and to implement `clear` cheaply,
+    e.g. by bumping a namespace generation rather than scanning keys.
+
+    A backend built with `settle_seconds` ignores `set` for that long after
+    the key was deleted or the cache cleared: the value being stored may have
+    been read from a replica that has not replayed the invalidating write yet.
+    """
+
+    @abstractmethod
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        ...
+
+    @abstractmethod
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, key: Hashable) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """At least hits, misses, evictions, size and hit_rate."""
+
+
+class TTLCache(CacheBackend):
+    """
+    Bounded in-process LRU cache whose entries expire after a TTL.
+    Safe to share between the event loop and threadpool workers.
+    """
+
+    def __init__(self, max_size: int, ttl: float, settle_seconds: float = 0.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.settle_seconds = settle_seconds
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        # Recently deleted keys -> monotonic deletion time, oldest first
+        self._settling: "OrderedDict[Hashable, float]" = OrderedDict()
+        self._cleared_at = float("-inf")
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store `value`; `ttl` overrides the cache default for this entry."""
+        now = time.monotonic()
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            if self._is_settling(key, now):
+                return
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+            if self.settle_seconds:
+                self._settling.pop(key, None)
+                self._settling[key] = time.monotonic()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._settling.clear()
+            self._cleared_at = time.monotonic()
+
+    def _is_settling(self, key: Hashable, now: float) -> bool:
+        if not self.settle_seconds:
+            return False
+        horizon = now - self.settle_seconds
+        while self._settling and next(iter(self._settling.values())) <= horizon:
+            self._settling.popitem(last=False)
+        return self._cleared_at > horizon or key in self._settling
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+# CACHE_BACKEND name -> factory(name, max_size, ttl, settle_seconds)
+CACHE_BACKENDS: Dict[str, Callable[[str, int, float, float], CacheBackend]] = {
+    "memory": lambda name, max_size, ttl, settle_seconds: TTLCache(
+        max_size=max_size, ttl=ttl, settle_seconds=settle_seconds
+    ),
+}
+
+# How long a cache filled from read_session() stays unfilled after an
+# invalidation: the same window writers are kept on the primary for, which is
+# what the replica is expected to catch up within. Without a replica every
+# read sees the committed write, so there is nothing to wait for.
+REPLICA_SETTLE_SECONDS = settings.DB_READ_YOUR_WRITES_SECONDS if settings.DATABASE_REPLICA_URL else 0
+
+caches: Dict[str, CacheBackend] = {}
+
+
+def register_cache(name: str, cache: CacheBackend) -> CacheBackend:
+    """Make a cache visible to /metrics and /internal/cache."""
+    caches[name] = cache
+    return cache
+
+
+def create_cache(name: str, max_size: int, ttl: float, settle_seconds: float = 0.0) -> CacheBackend:
+    """Build a cache on the configured CACHE_BACKEND and register it."""
+    try:
+        factory = CACHE_BACKENDS[settings.CACHE_BACKEND]
+    except KeyError:
+        raise RuntimeError(f"Unknown CACHE_BACKEND {settings.CACHE_BACKEND!r}")
+    return register_cache(name, factory(name, max_size, ttl, settle_seconds))
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: cache.stats() for name, cache in caches.items()}
+
+
+def cache_metric_lines() -> List[str]:
+    """Hit/miss/eviction counters and entry counts per cache, in Prometheus text format."""
+    stats = cache_stats()
+    series = (
+        ("cache_hits_total", "Cache lookups that found a live entry.", "counter", "hits"),
+        ("cache_misses_total", "Cache lookups that found nothing or an expired entry.", "counter", "misses"),
+        ("cache_evictions_total", "Entries dropped to stay within max_size.", "counter", "evictions"),
+        ("cache_entries", "Entries currently held.", "gauge", "size"),
+    )
+    lines: List[str] = []
+    for name, documentation, kind, key in series:
+        lines += [f"# HELP {name} {documentation}", f"# TYPE {name} {kind}"]
+        lines += [f'{name}{{cache="{cache}"}} {values[key]}' for cache, values in stats.items()]
+    return lines
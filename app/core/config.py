@@ -14,11 +14,83 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str
+    DATABASE_ASYNC_ENABLED: bool = False
+    ASYNC_DATABASE_URL: Optional[str] = None  # Derived from DATABASE_URL when unset
+    DATABASE_REPLICA_URL: Optional[str] = None  # Read-only routes use this when set
+    DB_READ_YOUR_WRITES_SECONDS: int = 5  # Keep a user's reads on the primary after a write
+
+    # Connection pool (per engine, per worker process)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # seconds before a connection is replaced
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_WAIT_WARN_MS: int = 100
+
+    # Access log (one line per request; 5xx and slow requests are never sampled out)
+    ACCESS_LOG_ENABLED: bool = True
+    ACCESS_LOG_LEVEL: str = "INFO"
+    ACCESS_LOG_SAMPLE_RATE: float = 1.0
+    ACCESS_LOG_SLOW_MS: int = 1000
+
+    # Per-request SQL statistics (debug headers; 0 disables the N+1 warning)
+    DB_QUERY_DEBUG_HEADERS: bool = False
+    DB_QUERY_WARN_THRESHOLD: int = 20
+
+    # Response compression (brotli is used only if the package is installed)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 5
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_BROTLI_ENABLED: bool = True
+
+    # Caregiver location search
+    GEOCODING_PROVIDER: str = "offline"  # see app/utils/geocoding.py
+    SEARCH_DEFAULT_RADIUS_KM: float = 25.0
+    SEARCH_MAX_RADIUS_KM: float = 200.0
+    SEARCH_RANK_MAX_CANDIDATES: int = 10000  # newest matches scored by sort=relevance|price|rating
+    SEARCH_FACET_PRICE_BUCKET_WIDTH: float = 50.0
+    SEARCH_FACET_PRICE_BUCKETS: int = 10  # plus one open-ended bucket above the last
+
+    # Application caches ("memory" is per worker process; see app/core/cache.py)
+    CACHE_BACKEND: str = "memory"
+    SEARCH_CACHE_ENABLED: bool = True
+    SEARCH_CACHE_TTL_SECONDS: int = 60
+    SEARCH_CACHE_MAX_SIZE: int = 2000
+    AVAILABILITY_CACHE_ENABLED: bool = True
+    AVAILABILITY_CACHE_TTL_SECONDS: int = 300
+    AVAILABILITY_CACHE_MAX_SIZE: int = 5000  # caregivers, each holding a few date ranges
+
+    # Caregiver availability calendar (GET /caregivers/{id}/availability)
+    AVAILABILITY_DEFAULT_DAYS: int = 30
+    AVAILABILITY_MAX_DAYS: int = 366
+
+    # Serve JSON with orjson when it is installed
+    ORJSON_RESPONSES: bool = True
+
+    # Prometheus-style /metrics endpoint; scrapers send "Authorization: Bearer <METRICS_TOKEN>"
+    METRICS_ENABLED: bool = False
+    METRICS_TOKEN: Optional[str] = None  # unset: no token required (keep the endpoint off the public network)
+
+    # Internal operational endpoints (pool stats etc.); admin users only
+    INTERNAL_ENDPOINTS_ENABLED: bool = False
 
     # JWT
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24  # 24 hours
+
+    # Verified-token cache; entries expire at the token's own `exp`
+    JWT_CACHE_ENABLED: bool = True
+    JWT_CACHE_MAX_SIZE: int = 10000
+
+    # Password hashing runs on its own bounded pool; excess logins get a 429
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 32
+
+    # Authenticated-user cache (per worker; TTL bounds staleness across workers)
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_MAX_SIZE: int = 10000
     
     # Email
     MAIL_USERNAME: str
@@ -1,8 +1,21 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from starlette.concurrency import run_in_threadpool
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncGenerator, AsyncIterator, Callable, Dict, Optional, TypeVar, Union
 from dotenv import load_dotenv
+from app.core.config import settings
+from app.core.db_metrics import instrumented_pool_class, pool_metric_lines
+from app.core.metrics import registry
+import hashlib
+import hmac
 import os
+import threading
+import time
 
 load_dotenv()
 
@@ -10,13 +23,230 @@ SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL")
 if SQLALCHEMY_DATABASE_URL is None:
     raise Exception("DATABASE_URL not found in environment variables")
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+
+def pool_options() -> dict:
+    """Pool sizing shared by every engine we build."""
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+def to_async_database_url(url: str) -> str:
+    """Rewrite a sync PostgreSQL URL so it uses the asyncpg driver."""
+    scheme, sep, rest = url.partition("://")
+    if scheme in ("postgres", "postgresql") or scheme.startswith("postgresql+"):
+        return f"postgresql+asyncpg{sep}{rest}"
+    return url
+
+
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    poolclass=instrumented_pool_class("primary"),
+    **pool_options()
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+# Read replica; without one, reads simply go to the primary
+replica_engine = None
+ReplicaSessionLocal = SessionLocal
+if settings.DATABASE_REPLICA_URL:
+    replica_engine = create_engine(
+        settings.DATABASE_REPLICA_URL,
+        poolclass=instrumented_pool_class("replica"),
+        **pool_options()
+    )
+    ReplicaSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=replica_engine)
+
+T = TypeVar("T")
+
+# Async engines, only built when enabled so asyncpg stays an optional install
+async_engine = None
+async_replica_engine = None
+AsyncSessionLocal = None
+AsyncReplicaSessionLocal = None
+if settings.DATABASE_ASYNC_ENABLED:
+    async_engine = create_async_engine(
+        settings.ASYNC_DATABASE_URL or to_async_database_url(SQLALCHEMY_DATABASE_URL),
+        poolclass=instrumented_pool_class("primary_async", AsyncAdaptedQueuePool),
+        **pool_options()
+    )
+    AsyncSessionLocal = async_sessionmaker(
+        bind=async_engine,
+        autoflush=False,
+        expire_on_commit=False
+    )
+    AsyncReplicaSessionLocal = AsyncSessionLocal
+    if settings.DATABASE_REPLICA_URL:
+        async_replica_engine = create_async_engine(
+            to_async_database_url(settings.DATABASE_REPLICA_URL),
+            poolclass=instrumented_pool_class("replica_async", AsyncAdaptedQueuePool),
+            **pool_options()
+        )
+        AsyncReplicaSessionLocal = async_sessionmaker(
+            bind=async_replica_engine,
+            autoflush=False,
+            expire_on_commit=False
+        )
+
+
+def engines() -> dict:
+    """Named engines, for pool reporting."""
+    return {
+        "primary": engine,
+        "replica": replica_engine,
+        "primary_async": async_engine.sync_engine if async_engine is not None else None,
+        "replica_async": async_replica_engine.sync_engine if async_replica_engine is not None else None,
+    }
+
+
+registry.register_collector(lambda: pool_metric_lines(engines()))
+
+
+class RecentWriters:
+    """
+    Users who committed a write in the last DB_READ_YOUR_WRITES_SECONDS.
+    Their reads stay on the primary so replica lag can't hide their own writes.
+    Tracked per worker process; the signed last-write marker below covers
+    follow-up requests that land on another worker.
+    """
+
+    def __init__(self, window_seconds: float, max_entries: int = 100_000):
+        self.window_seconds = window_seconds
+        self.max_entries = max_entries
+        self._deadlines: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def mark(self, user_id: Any) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if len(self._deadlines) >= self.max_entries:
+                self._deadlines = {k: v for k, v in self._deadlines.items() if v > now}
+            self._deadlines[str(user_id)] = now + self.window_seconds
+
+    def wrote_recently(self, user_id: Any) -> bool:
+        deadline = self._deadlines.get(str(user_id))
+        return deadline is not None and deadline > time.monotonic()
+
+
+recent_writers = RecentWriters(settings.DB_READ_YOUR_WRITES_SECONDS)
+
+# Last-write marker handed to the client (cookie and header) by
+# ReadYourWritesMiddleware and sent back on its next requests
+LAST_WRITE_COOKIE = "last_write"
+LAST_WRITE_HEADER = "X-Last-Write"
+
+# Per-request dict the middleware installs; the commit hook fills in who wrote and when
+write_marker: ContextVar[Optional[Dict[str, Any]]] = ContextVar("write_marker", default=None)
+
+
+def _marker_signature(payload: str) -> str:
+    return hmac.new(settings.SECRET_KEY.encode(), payload.encode(), hashlib.sha256).hexdigest()
+
+
+def encode_write_marker(user_id: Any, at: float) -> str:
+    """`<user id>:<unix time>:<HMAC>`, so a client can't pin itself to the primary."""
+    payload = f"{user_id}:{at:.3f}"
+    return f"{payload}:{_marker_signature(payload)}"
+
+
+def marker_is_recent(marker: Optional[str], user_id: Any) -> bool:
+    """True for a genuine marker of `user_id` from the last DB_READ_YOUR_WRITES_SECONDS."""
+    if not marker:
+        return False
+    payload, _, signature = marker.rpartition(":")
+    marked_user, _, at = payload.partition(":")
+    if marked_user != str(user_id) or not hmac.compare_digest(signature, _marker_signature(payload)):
+        return False
+    try:
+        age = time.time() - float(at)
+    except ValueError:
+        return False
+    # Workers' clocks may disagree slightly, so a marker from "the future" still counts
+    return -settings.DB_READ_YOUR_WRITES_SECONDS < age < settings.DB_READ_YOUR_WRITES_SECONDS
+
+
+@event.listens_for(Session, "after_flush")
+def _flag_writes(session: Session, flush_context) -> None:
+    session.info["has_writes"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _track_writer(session: Session) -> None:
+    # `user_id` is stamped on the request session by get_current_user
+    if session.info.pop("has_writes", False) and session.info.get("user_id"):
+        recent_writers.mark(session.info["user_id"])
+        marker = write_marker.get()
+        if marker is not None:
+            marker.update(user_id=session.info["user_id"], at=time.time())
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_writes(session: Session) -> None:
+    session.info.pop("has_writes", None)
+
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+@asynccontextmanager
+async def _open_session(
+    sync_factory: sessionmaker,
+    async_factory: Optional[async_sessionmaker]
+) -> AsyncIterator[Union[AsyncSession, Session]]:
+    if async_factory is None:
+        db = sync_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+    else:
+        async with async_factory() as db:
+            yield db
+
+
+async def get_async_db() -> AsyncGenerator[Union[AsyncSession, Session], None]:
+    """
+    Session dependency for endpoints that run their queries through `run_db`.
+    Yields an AsyncSession when DATABASE_ASYNC_ENABLED is set, otherwise a
+    regular Session whose work `run_db` moves off the event loop.
+    """
+    async with _open_session(SessionLocal, AsyncSessionLocal) as db:
+        yield db
+
+
+def read_session(user_id: Any = None, last_write: Optional[str] = None):
+    """
+    Session for read-only work: the replica, unless `user_id` wrote recently,
+    either on this worker or according to the client's `last_write` marker.
+    Same sync/async selection as `get_async_db`.
+    """
+    if user_id is not None and (
+        recent_writers.wrote_recently(user_id) or marker_is_recent(last_write, user_id)
+    ):
+        return _open_session(SessionLocal, AsyncSessionLocal)
+    return _open_session(ReplicaSessionLocal, AsyncReplicaSessionLocal)
+
+
+async def run_db(
+    db: Union[AsyncSession, Session],
+    fn: Callable[..., T],
+    *args: Any,
+    **kwargs: Any
+) -> T:
+    """
+    Run sync ORM code `fn(session, *args, **kwargs)` without blocking the loop.
+    AsyncSessions run it on their greenlet bridge, sync Sessions in the threadpool.
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args, **kwargs)
+    return await run_in_threadpool(fn, db, *args, **kwargs)
@@ -0,0 +1,215 @@
+# app/core/db_metrics.py
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+from typing import Any, Dict, List, Tuple, Type
+import logging
+import threading
+import time
+
+try:
+    # Async engines check out connections inside per-task greenlets that share a thread
+    from greenlet import getcurrent as _current_task
+except ImportError:  # pragma: no cover - greenlet ships with SQLAlchemy's asyncio extra
+    _current_task = threading.get_ident
+
+from app.core.config import settings
+from app.core.metrics import histogram_lines
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the checkout-wait histogram buckets
+WAIT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0
+)
+WARN_INTERVAL_SECONDS = 10.0
+
+
+class PoolMetrics:
+    """Checkout wait and connection-creation statistics for one connection pool."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.bucket_counts = [0] * len(WAIT_BUCKETS)
+        self.wait_count = 0
+        self.wait_sum = 0.0
+        self.wait_max = 0.0
+        self.last_wait = 0.0
+        self.waiting = 0
+        self.timeouts = 0
+        self.connect_count = 0
+        self.connect_sum = 0.0
+        self.connect_max = 0.0
+        self._last_warning = 0.0
+
+    def start_wait(self) -> None:
+        with self._lock:
+            self.waiting += 1
+
+    def end_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.waiting -= 1
+            self.wait_count += 1
+            self.wait_sum += seconds
+            self.last_wait = seconds
+            self.wait_max = max(self.wait_max, seconds)
+            if timed_out:
+                self.timeouts += 1
+            for i, bound in enumerate(WAIT_BUCKETS):
+                if seconds <= bound:
+                    self.bucket_counts[i] += 1
+                    break
+
+    def record_connect(self, seconds: float) -> None:
+        with self._lock:
+            self.connect_count += 1
+            self.connect_sum += seconds
+            self.connect_max = max(self.connect_max, seconds)
+
+    def should_warn(self) -> bool:
+        """Rate-limit saturation warnings so a burst logs once, not per checkout."""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_warning < WARN_INTERVAL_SECONDS:
+                return False
+            self._last_warning = now
+            return True
+
+    def snapshot(self, pool: QueuePool) -> Dict:
+        with self._lock:
+            cumulative, histogram = 0, []
+            for bound, count in zip(WAIT_BUCKETS, self.bucket_counts):
+                cumulative += count
+                histogram.append({"le": bound, "count": cumulative})
+            histogram.append({"le": "+Inf", "count": self.wait_count})
+            return {
+                "pool": self.name,
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": pool.overflow(),
+                "max_overflow": pool._max_overflow,
+                "waiting": self.waiting,
+                "timeouts": self.timeouts,
+                "wait_seconds_last": self.last_wait,
+                "wait_seconds_max": self.wait_max,
+                "wait_seconds_sum": self.wait_sum,
+                "wait_seconds_count": self.wait_count,
+                "wait_seconds_histogram": histogram,
+                "connect_seconds_max": self.connect_max,
+                "connect_seconds_sum": self.connect_sum,
+                "connect_seconds_count": self.connect_count,
+            }
+
+
+pool_metrics: Dict[str, PoolMetrics] = {}
+
+
+def instrumented_pool_class(name: str, base: Type[QueuePool] = QueuePool) -> Type[QueuePool]:
+    """
+    Build a pool class that times every checkout under `pool_metrics[name]`.
+    A subclass (rather than an attribute on the pool) survives pool.recreate().
+    The wait is time spent queueing for a connection; opening a new one
+    during the checkout is timed separately as connect time.
+    """
+    metrics = pool_metrics.setdefault(name, PoolMetrics(name))
+    # Task -> seconds spent opening connections during its current checkout
+    checkouts: Dict[Any, float] = {}
+
+    class InstrumentedPool(base):
+        def _create_connection(self):
+            start = time.perf_counter()
+            try:
+                return super()._create_connection()
+            finally:
+                seconds = time.perf_counter() - start
+                metrics.record_connect(seconds)
+                task = _current_task()
+                if task in checkouts:
+                    checkouts[task] += seconds
+
+        def _do_get(self):
+            task = _current_task()
+            if task in checkouts:
+                # QueuePool retries by calling _do_get again; only the outer call is timed
+                return super()._do_get()
+            checkouts[task] = 0.0
+            metrics.start_wait()
+            start = time.perf_counter()
+            timed_out = False
+            try:
+                return super()._do_get()
+            except exc.TimeoutError:
+                timed_out = True
+                raise
+            finally:
+                waited = time.perf_counter() - start - checkouts.pop(task)
+                metrics.end_wait(waited, timed_out)
+                if (
+                    (timed_out or waited * 1000 >= settings.DB_POOL_WAIT_WARN_MS)
+                    and metrics.should_warn()
+                ):
+                    logger.warning(
+                        f"DB pool '{name}' checkout waited {waited * 1000:.0f}ms "
+                        f"(checked out {self.checkedout()}, overflow {self.overflow()}, "
+                        f"timed out: {timed_out})"
+                    )
+
+    InstrumentedPool.__name__ = f"Instrumented{base.__name__}"
+    return InstrumentedPool
+
+
+def pool_status(engines: Dict[str, object]) -> Dict[str, Dict]:
+    """Gauges and wait histogram for each named engine's pool."""
+    status = {}
+    for name, engine in engines.items():
+        metrics = pool_metrics.get(name)
+        if engine is None or metrics is None:
+            continue
+        status[name] = metrics.snapshot(engine.pool)
+    return status
+
+
+def pool_metric_lines(engines: Dict[str, object]) -> List[str]:
+    """Pool gauges and checkout-wait histogram in Prometheus text format."""
+    status = pool_status(engines)
+    gauges = (
+        ("db_pool_size", "Configured pool size.", "size"),
+        ("db_pool_checked_out", "Connections currently checked out.", "checked_out"),
+        ("db_pool_overflow", "Connections open beyond pool_size.", "overflow"),
+        ("db_pool_waiting", "Callers waiting for a connection.", "waiting"),
+        ("db_pool_wait_seconds_max", "Longest checkout wait seen.", "wait_seconds_max"),
+        ("db_pool_connect_seconds_max", "Slowest new connection seen.", "connect_seconds_max"),
+    )
+    lines: List[str] = []
+    for name, documentation, key in gauges:
+        lines += [f"# HELP {name} {documentation}", f"# TYPE {name} gauge"]
+        lines += [f'{name}{{pool="{pool}"}} {values[key]}' for pool, values in status.items()]
+    lines += ["# HELP db_pool_timeouts_total Checkouts that hit pool_timeout.", "# TYPE db_pool_timeouts_total counter"]
+    lines += [f'db_pool_timeouts_total{{pool="{pool}"}} {values["timeouts"]}' for pool, values in status.items()]
+    lines += [
+        "# HELP db_pool_connect_seconds Time spent opening new connections, excluded from checkout wait.",
+        "# TYPE db_pool_connect_seconds summary",
+    ]
+    for pool, values in status.items():
+        lines += [
+            f'db_pool_connect_seconds_sum{{pool="{pool}"}} {values["connect_seconds_sum"]}',
+            f'db_pool_connect_seconds_count{{pool="{pool}"}} {values["connect_seconds_count"]}',
+        ]
+
+    lines += [
+        "# HELP db_pool_checkout_wait_seconds Time spent queueing for a pooled connection.",
+        "# TYPE db_pool_checkout_wait_seconds histogram",
+    ]
+    for pool, values in status.items():
+        buckets = values["wait_seconds_histogram"][:-1]
+        lines += histogram_lines(
+            "db_pool_checkout_wait_seconds",
+            ("pool",),
+            (pool,),
+            [bucket["le"] for bucket in buckets],
+            [bucket["count"] for bucket in buckets],
+            values["wait_seconds_sum"],
+            values["wait_seconds_count"],
+        )
+    return lines
@@ -1,21 +1,11 @@
 # app/core/email.py
-from fastapi_mail import FastMail, MessageSchema, ConnectionConfig
 from pydantic import EmailStr, BaseModel
 from typing import List, Dict, Any
 from app.core.config import settings
+from app.utils.email import send_html
 import jwt
 from datetime import datetime, timedelta
 
-conf = ConnectionConfig(
-    MAIL_USERNAME=settings.MAIL_USERNAME,
-    MAIL_PASSWORD=settings.MAIL_PASSWORD,
-    MAIL_FROM=settings.MAIL_FROM,
-    MAIL_PORT=settings.MAIL_PORT,
-    MAIL_SERVER=settings.MAIL_SERVER,
-    MAIL_STARTTLS=True,
-    MAIL_SSL_TLS=False,
-    USE_CREDENTIALS=True
-)
 
 class EmailSchema(BaseModel):
     email: List[EmailStr]
@@ -31,15 +21,7 @@ async def send_verification_email(email: str, token: str):
         <p>If you didn't register for PetBnB, please ignore this email.</p>
     """
     
-    message = MessageSchema(
-        subject="Verify your PetBnB email",
-        recipients=[email],
-        body=html,
-        subtype="html"
-    )
-    
-    fm = FastMail(conf)
-    await fm.send_message(message)
+    await send_html("Verify your PetBnB email", [email], html)
 
 async def send_reset_password_email(email: str, token: str):
     """Send password reset email"""
@@ -52,12 +34,4 @@ async def send_reset_password_email(email: str, token: str):
         <p>If you didn't request this, please ignore this email.</p>
     """
     
-    message = MessageSchema(
-        subject="Reset your PetBnB password",
-        recipients=[email],
-        body=html,
-        subtype="html"
-    )
-    
-    fm = FastMail(conf)
-    await fm.send_message(message)
\ No newline at end of file
+    await send_html("Reset your PetBnB password", [email], html)
\ No newline at end of file
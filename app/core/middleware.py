@@ -0,0 +1,359 @@
+# app/core/middleware.py
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.database import LAST_WRITE_COOKIE, LAST_WRITE_HEADER, encode_write_marker, write_marker
+from app.core.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS_IN_FLIGHT, HTTP_REQUESTS_TOTAL
+from typing import Optional, Tuple
+import gzip
+import logging
+import random
+import time
+import uuid
+import zlib
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+# Content types worth compressing; images, archives and the like already are
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+
+class AccessLogMiddleware:
+    """
+    Pure ASGI access log: one line per request, written after the response.
+    Adds an X-Request-ID header (reusing the client's if it sent one) and keeps
+    it in `request.state.request_id`. Successful fast requests are sampled at
+    `sample_rate`; 5xx responses and requests slower than `slow_ms` are
+    always logged.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        logger_name: str = "app.access",
+        level: str = "INFO",
+        sample_rate: float = 1.0,
+        slow_ms: int = 1000,
+    ):
+        self.app = app
+        self.logger = logging.getLogger(logger_name)
+        self.level = logging.getLevelName(level.upper())
+        self.sample_rate = sample_rate
+        self.slow_ms = slow_ms
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")[:64]
+                break
+        if not request_id:
+            request_id = uuid.uuid4().hex
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append(REQUEST_ID_HEADER, request_id)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self._log(scope, request_id, status_code, (time.perf_counter() - start) * 1000)
+
+    def _log(self, scope: Scope, request_id: str, status_code: int, duration_ms: float) -> None:
+        if status_code >= 500:
+            level = logging.ERROR
+        elif duration_ms >= self.slow_ms:
+            level = logging.WARNING
+        elif self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return
+        else:
+            level = self.level
+
+        if not self.logger.isEnabledFor(level):
+            return
+        client = scope.get("client")
+        self.logger.log(
+            level,
+            "request_id=%s method=%s path=%s status=%d duration_ms=%.1f client=%s",
+            request_id,
+            scope["method"],
+            scope["path"],
+            status_code,
+            duration_ms,
+            client[0] if client else "-",
+            extra={
+                "request_id": request_id,
+                "method": scope["method"],
+                "path": scope["path"],
+                "status_code": status_code,
+                "duration_ms": duration_ms,
+            },
+        )
+
+
+class ReadYourWritesMiddleware:
+    """
+    After a request that committed a write, sends the client a signed
+    last-write marker as a cookie and an X-Last-Write header. get_read_db
+    keeps the client's reads on the primary while the marker is fresh, on
+    whichever worker they land. The in-process RecentWriters only sees
+    writes made on its own worker.
+    """
+
+    def __init__(self, app: ASGIApp, window_seconds: int):
+        self.app = app
+        self.window_seconds = window_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Mutated in place by the commit hook, including from threadpool copies of this context
+        marker = {}
+        token = write_marker.set(marker)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and marker.get("user_id"):
+                value = encode_write_marker(marker["user_id"], marker["at"])
+                headers = MutableHeaders(scope=message)
+                headers.append(LAST_WRITE_HEADER, value)
+                headers.append(
+                    "set-cookie",
+                    f"{LAST_WRITE_COOKIE}={value}; Max-Age={self.window_seconds}; Path=/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            write_marker.reset(token)
+
+
+class MetricsMiddleware:
+    """
+    Records per-route latency, status counts and in-flight requests.
+    Routes are labelled by their template (e.g. /api/v1/pets/{pet_id}), which
+    the router leaves in `scope["route"]`, so label cardinality stays bounded.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            route = scope.get("route")
+            template = getattr(route, "path", None) or "<unmatched>"
+            method = scope["method"]
+            HTTP_REQUEST_DURATION.observe(elapsed, (method, template))
+            HTTP_REQUESTS_TOTAL.inc((method, template, str(status_code)))
+
+
+
+def parse_accept_encoding(header: str) -> dict:
+    """Map each coding in an Accept-Encoding header to its q-value."""
+    codings = {}
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        codings[name] = q
+    return codings
+
+
+class CompressionMiddleware:
+    """
+    gzip / brotli response compression for JSON and text bodies.
+
+    Brotli is preferred when the client accepts it and the `brotli` package is
+    installed. Bodies smaller than `minimum_size`, WebSocket traffic, event
+    streams, non-compressible content types and responses that already carry a
+    Content-Encoding pass through untouched. `gzip_level` and `brotli_quality`
+    are the CPU budget: the defaults trade a little ratio for much less CPU
+    than the maximum levels. Single-message bodies (every JSON response) are
+    compressed in one shot with an exact Content-Length; streamed bodies are
+    compressed chunk by chunk.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 5,
+        brotli_quality: int = 4,
+        brotli_enabled: bool = True,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.brotli_enabled = brotli_enabled and brotli is not None
+
+    def choose_encoding(self, scope: Scope) -> Optional[str]:
+        header = ""
+        for name, value in scope["headers"]:
+            if name == b"accept-encoding":
+                header = value.decode("latin-1")
+                break
+        if not header:
+            return None
+        codings = parse_accept_encoding(header)
+        wildcard = codings.get("*", 0.0)
+        if self.brotli_enabled and codings.get("br", wildcard) > 0:
+            return "br"
+        if codings.get("gzip", wildcard) > 0:
+            return "gzip"
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = self.choose_encoding(scope)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressingResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressingResponder:
+    """Per-request state for CompressionMiddleware."""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.downstream = send
+        self.start_message: Optional[Message] = None
+        self.passthrough = False
+        self.compressor = None
+
+    @staticmethod
+    def _eligible(headers: MutableHeaders) -> bool:
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "").lower()
+        if content_type.startswith("text/event-stream"):
+            return False
+        return content_type.startswith(COMPRESSIBLE_TYPES)
+
+    def _compress_once(self, body: bytes) -> bytes:
+        if self.encoding == "br":
+            return brotli.compress(body, quality=self.middleware.brotli_quality)
+        return gzip.compress(body, compresslevel=self.middleware.gzip_level, mtime=0)
+
+    def _stream_compressor(self) -> Tuple:
+        """Return (compress(chunk), flush()) callables for a streamed body."""
+        if self.encoding == "br":
+            compressor = brotli.Compressor(quality=self.middleware.brotli_quality)
+            return compressor.process, compressor.finish
+        compressor = zlib.compressobj(self.middleware.gzip_level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+        return compressor.compress, compressor.flush
+
+    def _set_encoded_headers(self, headers: MutableHeaders) -> None:
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        # The encoded bytes differ from the identity representation
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+
+    async def send(self, message: Message) -> None:
+        if self.passthrough:
+            await self.downstream(message)
+            return
+
+        if message["type"] == "http.response.start":
+            headers = MutableHeaders(raw=message["headers"])
+            if not self._eligible(headers):
+                self.passthrough = True
+                await self.downstream(message)
+                return
+            self.start_message = message
+            return
+
+        if message["type"] != "http.response.body":
+            await self.downstream(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        headers = MutableHeaders(raw=self.start_message["headers"])
+
+        if self.compressor is None and not more_body:
+            # Whole body in one message: compress it in one shot, or not at all
+            if len(body) < self.middleware.minimum_size:
+                headers.add_vary_header("Accept-Encoding")
+                self.passthrough = True
+                await self.downstream(self.start_message)
+                await self.downstream(message)
+                return
+            compressed = self._compress_once(body)
+            self._set_encoded_headers(headers)
+            headers["Content-Length"] = str(len(compressed))
+            self.passthrough = True
+            await self.downstream(self.start_message)
+            await self.downstream({"type": "http.response.body", "body": compressed})
+            return
+
+        if self.compressor is None:
+            # Streamed body; the final length is unknown
+            self.compressor = self._stream_compressor()
+            self._set_encoded_headers(headers)
+            if "content-length" in headers:
+                del headers["content-length"]
+            await self.downstream(self.start_message)
+
+        compress, flush = self.compressor
+        chunk = compress(body)
+        if not more_body:
+            chunk += flush()
+        if chunk or not more_body:
+            await self.downstream({"type": "http.response.body", "body": chunk, "more_body": more_body})
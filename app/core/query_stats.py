@@ -0,0 +1,164 @@
+# app/core/query_stats.py
+"""
+Per-request SQL statistics.
+
+Engine-level cursor events count every statement and its time into the
+QueryStats of the current request (a ContextVar, which follows the request
+into the threadpool and the async greenlet bridge). QueryStatsMiddleware
+opens the per-request stats, optionally reports them in response headers and
+logs statement fingerprints when a request exceeds the query threshold.
+"""
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
+import logging
+import re
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+MAX_RECORDED_STATEMENTS = 1000
+
+
+class QueryStats:
+    __slots__ = ("count", "seconds", "statements")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.statements: List[str] = []
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        if len(self.statements) < MAX_RECORDED_STATEMENTS:
+            self.statements.append(statement)
+
+    def top_fingerprints(self, limit: int = 5) -> List[tuple]:
+        return Counter(fingerprint(s) for s in self.statements).most_common(limit)
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_PARAM = re.compile(r"%\(\w+\)s|\$\d+|__\[POSTCOMPILE_\w+\]|\b\d+(?:\.\d+)?\b")
+_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+
+
+def fingerprint(statement: str) -> str:
+    """Statement shape with literals and bind parameters collapsed to `?`."""
+    shape = _WHITESPACE.sub(" ", statement)
+    shape = _STRING.sub("?", shape)
+    shape = _PARAM.sub("?", shape)
+    return _LIST.sub("(?)", shape).strip()
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info.setdefault("query_start_times", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_query(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    starts = conn.info.get("query_start_times")
+    if stats is None or not starts:
+        return
+    stats.record(statement, time.perf_counter() - starts.pop())
+
+
+@event.listens_for(Engine, "handle_error")
+def _record_failed_query(context):
+    # A failed statement never reaches after_cursor_execute; pop its start time
+    # here, or the next statement on this connection would be timed from it
+    conn = context.connection
+    if conn is None or context.execution_context is None:
+        return
+    starts = conn.info.get("query_start_times")
+    if not starts:
+        return
+    started = starts.pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(context.statement, time.perf_counter() - started)
+
+
+class QueryStatsMiddleware:
+    """
+    Counts queries and DB time per HTTP request. With `headers` set, adds
+    X-DB-Query-Count and X-DB-Time-Ms; with `warn_threshold` > 0, logs the
+    most repeated statement fingerprints of requests that exceed it.
+    """
+
+    def __init__(self, app: ASGIApp, headers: bool = False, warn_threshold: int = 0):
+        self.app = app
+        self.headers = headers
+        self.warn_threshold = warn_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _current_stats.set(stats)
+
+        async def send_wrapper(message: Message) -> None:
+            if self.headers and message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("X-DB-Query-Count", str(stats.count))
+                headers.append("X-DB-Time-Ms", f"{stats.seconds * 1000:.1f}")
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_stats.reset(token)
+            if self.warn_threshold and stats.count > self.warn_threshold:
+                top = "; ".join(f"{count}x {shape[:200]}" for shape, count in stats.top_fingerprints())
+                logger.warning(
+                    f"{scope['method']} {scope['path']} ran {stats.count} queries "
+                    f"({stats.seconds * 1000:.1f}ms), threshold {self.warn_threshold}. Top: {top}"
+                )
+
+
+@contextmanager
+def assert_query_budget(max_queries: int, engine: Optional[Engine] = None) -> Iterator[List[str]]:
+    """
+    Test helper: fail if the block runs more than `max_queries` statements.
+    Listens on the engine directly, so it also sees queries issued from
+    TestClient's worker thread:
+
+        with assert_query_budget(3):
+            client.get(f"/api/v1/caregivers/{caregiver_id}", headers=auth)
+    """
+    statements: List[str] = []
+    target = engine if engine is not None else Engine
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(target, "after_cursor_execute", _count)
+    try:
+        yield statements
+    finally:
+        event.remove(target, "after_cursor_execute", _count)
+
+    if len(statements) > max_queries:
+        shapes = Counter(fingerprint(s) for s in statements).most_common()
+        detail = "\n".join(f"  {count}x {shape}" for shape, count in shapes)
+        raise AssertionError(
+            f"Query budget exceeded: {len(statements)} queries, budget {max_queries}\n{detail}"
+        )
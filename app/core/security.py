@@ -5,18 +5,44 @@ from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status, WebSocket, Security
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+from app.core.cache import TTLCache, register_cache
 from app.core.config import settings
 from app.core.database import get_db
 from app.models.user import User
 from uuid import UUID
+from concurrent.futures import Future, ThreadPoolExecutor
+import asyncio
+import hashlib
 import logging
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
+# Verified JWT payloads keyed by the token's SHA-256 digest
+token_cache = register_cache("jwt", TTLCache(
+    max_size=settings.JWT_CACHE_MAX_SIZE,
+    ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+))
+
+# Authenticated-user snapshots keyed by the token's `sub`
+user_cache = register_cache("user", TTLCache(
+    max_size=settings.USER_CACHE_MAX_SIZE,
+    ttl=settings.USER_CACHE_TTL_SECONDS
+))
+
+# bcrypt is CPU-bound: keep it off the event loop and the shared threadpool
+_password_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash"
+)
+_password_slots = threading.BoundedSemaphore(settings.PASSWORD_HASH_MAX_PENDING)
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against a hashed password."""
     return pwd_context.verify(plain_password, hashed_password)
@@ -25,6 +51,46 @@ def get_password_hash(password: str) -> str:
     """Generate a password hash."""
     return pwd_context.hash(password)
 
+def _submit_password_job(fn, *args) -> Future:
+    """
+    Queue a hashing job on the password pool. Once PASSWORD_HASH_MAX_PENDING jobs
+    are queued or running, reject immediately with 429 instead of queueing.
+    """
+    if not _password_slots.acquire(blocking=False):
+        logger.warning("Password hashing queue full, rejecting request")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many authentication requests, please retry shortly",
+            headers={"Retry-After": "1"},
+        )
+    try:
+        future = _password_executor.submit(fn, *args)
+    except BaseException:
+        _password_slots.release()
+        raise
+    # Release on completion, not on await, so a cancelled request keeps its slot until the job ends
+    future.add_done_callback(lambda _: _password_slots.release())
+    return future
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the bounded password pool (for `async def` handlers)."""
+    return await asyncio.wrap_future(_submit_password_job(verify_password, plain_password, hashed_password))
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password on the bounded password pool (for `async def` handlers)."""
+    return await asyncio.wrap_future(_submit_password_job(get_password_hash, password))
+
+def verify_password_pooled(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password on the bounded password pool, blocking the calling
+    thread. For sync handlers, which FastAPI already runs in its threadpool.
+    """
+    return _submit_password_job(verify_password, plain_password, hashed_password).result()
+
+def get_password_hash_pooled(password: str) -> str:
+    """Hash a password on the bounded password pool from a sync handler."""
+    return _submit_password_job(get_password_hash, password).result()
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a new access token."""
     to_encode = data.copy()
@@ -40,77 +106,118 @@ def decode_jwt_token(token: str) -> Tuple[bool, Optional[Dict], Optional[str]]:
     """
     Decode and validate JWT token.
     Returns: (is_valid, payload, error_message)
+    Verified payloads are cached until the token's `exp`, so repeat
+    requests with the same token skip signature verification.
     """
     try:
         # Remove 'Bearer ' if present
         token = token.replace('Bearer ', '')
+        digest = hashlib.sha256(token.encode()).digest() if settings.JWT_CACHE_ENABLED else None
+        if digest is not None:
+            payload = token_cache.get(digest)
+            if payload is not None:
+                return True, dict(payload), None
+
         payload = jwt.decode(
             token, 
             settings.SECRET_KEY, 
             algorithms=[settings.ALGORITHM]
         )
+
+        if digest is not None and isinstance(payload.get("exp"), (int, float)):
+            ttl = payload["exp"] - time.time()
+            if ttl > 0:
+                token_cache.set(digest, dict(payload), ttl=ttl)
         return True, payload, None
     except JWTError as e:
         return False, None, f"Invalid token: {str(e)}"
     except Exception as e:
         return False, None, f"Token validation error: {str(e)}"
 
+def _user_snapshot(user: User) -> Dict:
+    """Column values of a user, detached from any session."""
+    return {column.key: getattr(user, column.key) for column in User.__table__.columns}
+
+def _attach_snapshot(db: Session, snapshot: Dict) -> User:
+    """Turn a cached snapshot into a persistent User in `db` without a query."""
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return db.merge(user, load=False)
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_users(session: Session, flush_context) -> None:
+    # Covers update_user_me, password reset, deactivation and any other ORM
+    # write. Attribute history is still pre-flush here, so a changed email's
+    # old value (the legacy `sub` form) is collected too.
+    for obj in (*session.dirty, *session.deleted):
+        if isinstance(obj, User):
+            keys = session.info.setdefault("stale_user_keys", set())
+            keys.add(str(obj.id))
+            keys.update(email for email in (obj.email, *inspect(obj).attrs.email.history.deleted) if email)
+
+@event.listens_for(Session, "after_commit")
+def _evict_changed_users(session: Session) -> None:
+    # Evict only once the write is visible; at flush time a concurrent
+    # request could re-cache the old row before the commit
+    for key in session.info.pop("stale_user_keys", ()):
+        user_cache.delete(key)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_users(session: Session) -> None:
+    session.info.pop("stale_user_keys", None)
+
+def resolve_user(db: Session, subject: str) -> Optional[User]:
+    """
+    Load the user a token's `sub` refers to, serving repeat lookups from the
+    user cache. `sub` is the user's UUID; older tokens carry the email instead.
+    """
+    snapshot = user_cache.get(subject)
+    if snapshot is not None:
+        user = _attach_snapshot(db, snapshot)
+    else:
+        try:
+            user = db.query(User).filter(User.id == UUID(subject)).first()
+        except (ValueError, TypeError):
+            user = db.query(User).filter(User.email == subject).first()
+        if user is None:
+            return None
+        user_cache.set(subject, _user_snapshot(user))
+
+    # Lets the session's commit hooks attribute writes to this user
+    db.info["user_id"] = user.id
+    return user
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
 ) -> User:
     """Get current user from token."""
-    logger.info("=== Token Validation Start ===")
-    logger.info(f"Raw token received: {token[:20]}...")  # Log only first 20 chars for security
-    
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    
-    try:
-        # Clean token if needed
-        token = token.strip()
-        if token.startswith('Bearer '):
-            token = token[7:]
-        
-        logger.info("Attempting to decode token")
-        is_valid, payload, error = decode_jwt_token(token)
-        
-        if not is_valid:
-            logger.error(f"Token validation failed: {error}")
-            raise credentials_exception
-
-        logger.info("Token decoded successfully")
-        user_id = payload.get("sub")
-        if not user_id:
-            logger.error("No user_id in token payload")
-            raise credentials_exception
 
-        # Try to get user by UUID first
-        try:
-            logger.info(f"Looking up user with ID: {user_id}")
-            uuid_user_id = UUID(user_id)
-            user = db.query(User).filter(User.id == uuid_user_id).first()
-            if user:
-                logger.info(f"User found: {user.email}")
-                return user
-        except (ValueError, TypeError) as e:
-            logger.error(f"UUID conversion failed: {str(e)}")
-            # If UUID conversion fails, try email (backward compatibility)
-            user = db.query(User).filter(User.email == user_id).first()
-            if user:
-                logger.info(f"User found by email: {user.email}")
-                return user
-
-        logger.error("User not found in database")
+    is_valid, payload, error = decode_jwt_token(token.strip())
+    if not is_valid:
+        logger.error(f"Token validation failed: {error}")
         raise credentials_exception
+
+    user_id = payload.get("sub")
+    if not user_id:
+        logger.error("No user_id in token payload")
+        raise credentials_exception
+
+    try:
+        user = resolve_user(db, user_id)
     except Exception as e:
         logger.error(f"Authentication error: {str(e)}")
         raise credentials_exception
-    finally:
-        logger.info("=== Token Validation End ===")
+
+    if user is None:
+        logger.error(f"User not found for ID: {user_id}")
+        raise credentials_exception
+    return user
 
 async def get_current_active_user(
     current_user: User = Depends(get_current_user)
@@ -149,14 +256,7 @@ async def get_current_user_ws(
                 return None
 
         user_id = payload.get("sub")
-        try:
-            uuid_user_id = UUID(user_id)
-            user = db.query(User).filter(User.id == uuid_user_id).first()
-            if not user:
-                # Try email as fallback
-                user = db.query(User).filter(User.email == user_id).first()
-        except (ValueError, TypeError):
-            user = db.query(User).filter(User.email == user_id).first()
+        user = resolve_user(db, user_id) if user_id else None
 
         if not user:
             logger.error(f"User not found for ID: {user_id}")
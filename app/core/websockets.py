@@ -4,6 +4,7 @@ from fastapi import WebSocket
 from typing import Dict, Set, Optional
 import json
 from uuid import UUID
+from app.core.metrics import Gauge, registry
 
 class ConnectionManager:
     def __init__(self):
@@ -27,6 +28,16 @@ class ConnectionManager:
         if chat_room_id in self.active_connections:
             if user_id in self.active_connections[chat_room_id]:
                 del self.active_connections[chat_room_id][user_id]
+            if not self.active_connections[chat_room_id]:
+                del self.active_connections[chat_room_id]
+
+    def connection_count(self) -> int:
+        """Number of open WebSocket connections across all rooms."""
+        return sum(len(room) for room in self.active_connections.values())
+
+    def room_count(self) -> int:
+        """Number of chat rooms with at least one connection."""
+        return sum(1 for room in self.active_connections.values() if room)
                 
     async def send_personal_message(self, message: dict, websocket: WebSocket):
         """Send a message to a specific WebSocket connection."""
@@ -39,4 +50,16 @@ class ConnectionManager:
                 if user_id != exclude_user:
                     await connection.send_json(message)
 
-manager = ConnectionManager()
\ No newline at end of file
+manager = ConnectionManager()
+
+# Computed at scrape time, so they can't drift from the manager's state
+registry.register(Gauge(
+    "websocket_connections",
+    "Open chat WebSocket connections.",
+    callback=lambda: {(): manager.connection_count()},
+))
+registry.register(Gauge(
+    "websocket_chat_rooms",
+    "Chat rooms with at least one open connection.",
+    callback=lambda: {(): manager.room_count()},
+))
\ No newline at end of file
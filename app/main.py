@@ -1,13 +1,23 @@
-from fastapi import FastAPI, Request
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.websockets import WebSocket
 from app.core.config import settings
+from app.api.deps import get_current_admin_user
 from app.api.v1.api import api_router
-from app.models import *  # This will import all models
+from app.core.cache import cache_metric_lines, cache_stats
+from app.core.database import engines
+from app.core.db_metrics import pool_status
+from app.core.metrics import registry
+from app.core.middleware import (
+    AccessLogMiddleware, CompressionMiddleware, MetricsMiddleware, ReadYourWritesMiddleware,
+)
+from app.core.query_stats import QueryStatsMiddleware
+from app.utils.serialization import default_response_class
+import app.models  # noqa: F401  registers every model on Base.metadata
+import hmac
 import logging
 import time
-from typing import Callable
-import json
 
 # Configure detailed logging
 logging.basicConfig(
@@ -19,46 +29,10 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    default_response_class=default_response_class()
 )
 
-# Debug middleware to log request details
-@app.middleware("http")
-async def log_requests(request: Request, call_next: Callable):
-    # Generate request ID
-    request_id = str(time.time())
-    
-    # Log request details
-    logger.info(f"=== Incoming Request [{request_id}] ===")
-    logger.info(f"Method: {request.method}")
-    logger.info(f"URL: {request.url}")
-    logger.info(f"Client Host: {request.client.host}")
-    
-    # Log headers (excluding sensitive data)
-    safe_headers = dict(request.headers)
-    if 'authorization' in safe_headers:
-        safe_headers['authorization'] = 'Bearer <token omitted>'
-    logger.info(f"Headers: {json.dumps(safe_headers, indent=2)}")
-
-    # Process request and time it
-    start_time = time.time()
-    try:
-        response = await call_next(request)
-        
-        # Log response details
-        process_time = time.time() - start_time
-        logger.info(f"=== Response [{request_id}] ===")
-        logger.info(f"Status Code: {response.status_code}")
-        logger.info(f"Process Time: {process_time:.3f}s")
-        
-        return response
-    except Exception as e:
-        logger.error(f"=== Request Failed [{request_id}] ===")
-        logger.error(f"Error: {str(e)}")
-        raise
-    finally:
-        logger.info(f"=== Request Complete [{request_id}] ===")
-
 # CORS middleware with detailed configuration
 app.add_middleware(
     CORSMiddleware,
@@ -69,13 +43,45 @@ app.add_middleware(
     expose_headers=["*"],  # Added to ensure all headers are exposed
 )
 
+if settings.DB_QUERY_DEBUG_HEADERS or settings.DB_QUERY_WARN_THRESHOLD:
+    app.add_middleware(
+        QueryStatsMiddleware,
+        headers=settings.DB_QUERY_DEBUG_HEADERS,
+        warn_threshold=settings.DB_QUERY_WARN_THRESHOLD,
+    )
+
+# Only reads that could go to a replica need the last-write marker
+if settings.DATABASE_REPLICA_URL:
+    app.add_middleware(ReadYourWritesMiddleware, window_seconds=settings.DB_READ_YOUR_WRITES_SECONDS)
+
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+        brotli_enabled=settings.COMPRESSION_BROTLI_ENABLED,
+    )
+
+# Access log; added last so it wraps everything else and times the full request
+if settings.ACCESS_LOG_ENABLED:
+    app.add_middleware(
+        AccessLogMiddleware,
+        level=settings.ACCESS_LOG_LEVEL,
+        sample_rate=settings.ACCESS_LOG_SAMPLE_RATE,
+        slow_ms=settings.ACCESS_LOG_SLOW_MS,
+    )
+
 # API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
 # Enhanced health check endpoint
 @app.get("/health")
 async def health_check(request: Request):
-    logger.info(f"Health check from {request.client.host}")
+    logger.debug(f"Health check from {request.client.host}")
     return {
         "status": "healthy",
         "timestamp": time.time(),
@@ -83,6 +89,32 @@ async def health_check(request: Request):
         "cors_origins": settings.cors_origins
     }
 
+if settings.INTERNAL_ENDPOINTS_ENABLED:
+    @app.get("/internal/db/pool", dependencies=[Depends(get_current_admin_user)])
+    async def db_pool_status():
+        """Connection pool gauges and checkout-wait histogram per engine."""
+        return pool_status(engines())
+
+    @app.get("/internal/cache", dependencies=[Depends(get_current_admin_user)])
+    async def cache_status():
+        """Size, hits, misses, evictions and hit rate per application cache."""
+        return cache_stats()
+
+if settings.METRICS_ENABLED:
+    registry.register_collector(cache_metric_lines)
+
+    def require_metrics_token(request: Request) -> None:
+        if not settings.METRICS_TOKEN:
+            return
+        supplied = request.headers.get("authorization", "").removeprefix("Bearer ").strip()
+        if not hmac.compare_digest(supplied.encode(), settings.METRICS_TOKEN.encode()):
+            raise HTTPException(status_code=401, detail="Invalid metrics token", headers={"WWW-Authenticate": "Bearer"})
+
+    @app.get("/metrics", include_in_schema=False, dependencies=[Depends(require_metrics_token)])
+    async def metrics():
+        """Prometheus text exposition of this worker's metrics."""
+        return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
 if __name__ == "__main__":
     import uvicorn
     
@@ -3,8 +3,10 @@ from app.models.user import User
 from app.models.image import Image  # Add this import
 from app.models.pet import Pet
 from app.models.caregiver import CaregiverProfile
+from app.models.caregiver_service_price import CaregiverServicePrice
 from app.models.booking import Booking, BookingStatus, ServiceType
 from app.models.review import Review
+from app.models.search_version import SearchVersion
 from app.models.payment import Payment, PaymentStatus, PaymentType
 from app.models.message import (
     ChatRoom,
@@ -19,10 +21,12 @@ __all__ = [
     "Image",  # Add this
     "Pet",
     "CaregiverProfile",
+    "CaregiverServicePrice",
     "Booking",
     "BookingStatus",
     "ServiceType",
     "Review",
+    "SearchVersion",
     "Payment",
     "PaymentStatus",
     "PaymentType",
@@ -1,6 +1,6 @@
 # app/models/booking.py
-from sqlalchemy import Column, ForeignKey, DateTime, String, Float, Text, Enum
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, ForeignKey, DateTime, String, Float, Text, Enum, Index, CheckConstraint, func, text
+from sqlalchemy.dialects.postgresql import UUID, ExcludeConstraint
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 import uuid
@@ -36,6 +36,25 @@ class Booking(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Keyset pagination indexes (migration d9a2b5c7e1f3)
+    __table_args__ = (
+        Index("ix_bookings_owner_id_created_at_id", owner_id, created_at, id),
+        Index("ix_bookings_caregiver_id_created_at_id", caregiver_id, created_at, id),
+        Index("ix_bookings_created_at_id", created_at, id),
+        # tsrange() below can't take reversed dates (migration e4b7c1d8f2a6)
+        CheckConstraint(end_date >= start_date, name="check_booking_end_after_start"),
+        # Overlap lookups for availability search (migration e4b7c1d8f2a6, needs btree_gist)
+        Index("ix_bookings_caregiver_id_period", caregiver_id, func.tsrange(start_date, end_date),
+              postgresql_using="gist"),
+        # A pet can't be in two active bookings at once (migration c4f9a2e7b1d3)
+        ExcludeConstraint(
+            (pet_id, "="), (func.tsrange(start_date, end_date), "&&"),
+            name="ex_bookings_pet_id_period_active",
+            using="gist",
+            where=text("status IN ('PENDING', 'PAYMENT_REQUIRED', 'CONFIRMED')"),
+        ),
+    )
+
     # Existing Relationships
     pet = relationship("Pet", back_populates="bookings")
     owner = relationship("User", foreign_keys=[owner_id])
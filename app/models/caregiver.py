@@ -1,7 +1,7 @@
 # app/models/caregiver.py
-from sqlalchemy import Column, String, Integer, Float, Text, ForeignKey, Boolean, DateTime
-from sqlalchemy.dialects.postgresql import UUID, ARRAY
-from sqlalchemy.orm import relationship, column_property
+from sqlalchemy import Column, String, Integer, Float, Text, ForeignKey, Boolean, DateTime, Index, FetchedValue, text
+from sqlalchemy.dialects.postgresql import UUID, ARRAY, TSVECTOR
+from sqlalchemy.orm import relationship, column_property, deferred
 from sqlalchemy.ext.hybrid import hybrid_property
 from app.core.database import Base
 from app.models.image import Image
@@ -30,11 +30,46 @@ class CaregiverProfile(Base):
     emergency_transport = Column(Boolean, default=False)
     is_available = Column(Boolean, default=True)
     preferred_pet_size = Column(ARRAY(String(50)))
+    latitude = Column(Float)
+    longitude = Column(Float)
+    # Search card fields copied from users and images by triggers (migration b2e6d4a9f1c7),
+    # so listing caregivers never joins users
+    user_full_name = Column(String(255), server_default=FetchedValue(), server_onupdate=FetchedValue())
+    user_profile_picture = Column(String(255), server_default=FetchedValue(), server_onupdate=FetchedValue())
+    thumbnail_url = Column(String, server_default=FetchedValue(), server_onupdate=FetchedValue())
+    # home_type (weight A) + bio (weight B), kept current by a trigger (migration f1c5a9e3b7d2)
+    search_vector = deferred(Column(TSVECTOR, server_default=FetchedValue(), server_onupdate=FetchedValue()))
     rating = Column(Float, default=0.0)
     total_reviews = Column(Integer, default=0)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Partial search indexes, built concurrently by migration b7d41c9e2a15.
+    # The array filters must use @> (see app/utils/caregiver_search.py) to hit them.
+    __table_args__ = (
+        Index("ix_caregiver_profiles_services_offered_available", services_offered,
+              postgresql_using="gin", postgresql_where=text("is_available")),
+        Index("ix_caregiver_profiles_accepted_pet_types_available", accepted_pet_types,
+              postgresql_using="gin", postgresql_where=text("is_available")),
+        Index("ix_caregiver_profiles_preferred_pet_size_available", preferred_pet_size,
+              postgresql_using="gin", postgresql_where=text("is_available")),
+        Index("ix_caregiver_profiles_price_per_night_available", price_per_night,
+              postgresql_where=text("is_available")),
+        Index("ix_caregiver_profiles_price_per_day_available", price_per_day,
+              postgresql_where=text("is_available")),
+        Index("ix_caregiver_profiles_price_per_walk_available", price_per_walk,
+              postgresql_where=text("is_available")),
+        # Bounding-box radius search (migration c3e8f0a4d2b6)
+        Index("ix_caregiver_profiles_location_available", latitude, longitude,
+              postgresql_where=text("is_available AND latitude IS NOT NULL")),
+        # Keyset pagination of the default (newest first) search order (migration d9a2b5c7e1f3)
+        Index("ix_caregiver_profiles_created_at_id_available", created_at, id,
+              postgresql_where=text("is_available")),
+        # Full-text search over bio and home_type (migration f1c5a9e3b7d2)
+        Index("ix_caregiver_profiles_search_vector_available", "search_vector",
+              postgresql_using="gin", postgresql_where=text("is_available")),
+    )
+
     # Relationships
     user = relationship("User", back_populates="caregiver_profile")
     bookings = relationship("Booking", back_populates="caregiver")
@@ -47,13 +82,5 @@ class CaregiverProfile(Base):
             back_populates="caregiver"
         )
 
-    @property
-    def user_full_name(self) -> str:
-        return self.user.full_name if self.user else ""
-
-    @property
-    def user_profile_picture(self) -> Optional[str]:
-        return self.user.profile_picture if self.user else None
-
     def __repr__(self):
         return f"<CaregiverProfile {self.user_id}>"
\ No newline at end of file
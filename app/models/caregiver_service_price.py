@@ -0,0 +1,30 @@
+# app/models/caregiver_service_price.py
+from sqlalchemy import Boolean, Column, Float, ForeignKey, Index, String, text
+from sqlalchemy.dialects.postgresql import UUID
+from app.core.database import Base
+
+class CaregiverServicePrice(Base):
+    """
+    One row per (caregiver, offered service) with the price billed for it.
+    Written only by the caregiver_profiles trigger from migration
+    a8d3f6b2c9e4; the application reads it for price filters and sorting.
+    """
+    __tablename__ = "caregiver_service_prices"
+
+    caregiver_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("caregiver_profiles.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    service_type = Column(String(50), primary_key=True)  # upper-cased, e.g. BOARDING
+    price = Column(Float, nullable=False)
+    is_available = Column(Boolean, nullable=False)  # copy of the profile's flag
+
+    # Price ranges and cheapest-first pages per service, as one index range scan
+    __table_args__ = (
+        Index("ix_caregiver_service_prices_service_type_price_available", service_type, price, caregiver_id,
+              postgresql_where=text("is_available")),
+    )
+
+    def __repr__(self):
+        return f"<CaregiverServicePrice {self.caregiver_id} {self.service_type}>"
@@ -1,7 +1,7 @@
 # app/models/image.py
 from sqlalchemy import (
     Column, String, DateTime, Integer, 
-    CheckConstraint, ForeignKey
+    CheckConstraint, ForeignKey, Index
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
@@ -27,6 +27,8 @@ class Image(Base):
             entity_type.in_(['user', 'pet', 'caregiver']),
             name='check_valid_entity_type'
         ),
+        # First image per entity, e.g. the caregiver card thumbnail (migration b2e6d4a9f1c7)
+        Index("ix_images_entity_type_entity_id_order", entity_type, entity_id, order, created_at),
     )
 
     # Relationships without foreign key constraints
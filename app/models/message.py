@@ -1,6 +1,6 @@
 # app/models/message.py
 
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Boolean, Table
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Boolean, Table, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -45,6 +45,11 @@ class Message(Base):
     is_system_message = Column(Boolean, default=False)
     created_at = Column(DateTime(timezone=True), server_default=func.current_timestamp())
     updated_at = Column(DateTime(timezone=True), server_default=func.current_timestamp(), onupdate=func.current_timestamp())
+
+    # Keyset pagination indexes (migration d9a2b5c7e1f3)
+    __table_args__ = (
+        Index("ix_messages_chat_room_id_created_at_id", chat_room_id, created_at, id),
+    )
     
     # Relationships
     chat_room = relationship("ChatRoom", back_populates="messages")
@@ -1,5 +1,5 @@
 # app/models/payment.py
-from sqlalchemy import Column, ForeignKey, DateTime, Float, String, Enum, Text, ForeignKeyConstraint
+from sqlalchemy import Column, ForeignKey, DateTime, Float, String, Enum, Text, ForeignKeyConstraint, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship, foreign, remote
 from app.core.database import Base
@@ -46,6 +46,13 @@ class Payment(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     completed_at = Column(DateTime)
 
+    # Keyset pagination indexes (migration d9a2b5c7e1f3)
+    __table_args__ = (
+        Index("ix_payments_payer_id_created_at_id", payer_id, created_at, id),
+        Index("ix_payments_recipient_id_created_at_id", recipient_id, created_at, id),
+        Index("ix_payments_created_at_id", created_at, id),
+    )
+
     # Relationships
     booking = relationship("Booking", back_populates="payments")
     payer = relationship("User", foreign_keys=[payer_id])
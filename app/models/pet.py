@@ -1,5 +1,5 @@
 # app/models/pet.py
-from sqlalchemy import Column, String, Integer, Float, Text, ForeignKey, Boolean, Enum, DateTime
+from sqlalchemy import Column, String, Integer, Float, Text, ForeignKey, Boolean, Enum, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -34,6 +34,11 @@ class Pet(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Keyset pagination indexes (migration d9a2b5c7e1f3)
+    __table_args__ = (
+        Index("ix_pets_owner_id_created_at_id", owner_id, created_at, id),
+    )
+
     # Relationships
     owner = relationship("User", back_populates="pets")
     bookings = relationship("Booking", back_populates="pet")
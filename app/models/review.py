@@ -1,5 +1,5 @@
 # app/models/review.py
-from sqlalchemy import Column, ForeignKey, DateTime, Integer, Text
+from sqlalchemy import Column, ForeignKey, DateTime, Integer, Text, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -18,6 +18,11 @@ class Review(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Keyset pagination indexes (migration d9a2b5c7e1f3)
+    __table_args__ = (
+        Index("ix_reviews_caregiver_id_created_at_id", caregiver_id, created_at, id),
+    )
+
     # Relationships
     booking = relationship("Booking", back_populates="review")
     reviewer = relationship("User", foreign_keys=[reviewer_id])
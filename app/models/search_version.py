@@ -0,0 +1,22 @@
+# app/models/search_version.py
+from sqlalchemy import BigInteger, Column, String
+from app.core.database import Base
+
+# search_versions.name of the counter covering every caregiver search result
+CAREGIVER_PROFILES_VERSION = "caregiver_profiles"
+
+class SearchVersion(Base):
+    """
+    Write counters for cached search results, one row per source table.
+    Triggers (migration d6a1e8b3f5c2) bump the row inside any transaction
+    that adds, removes or changes a searched column of a caregiver, so a reader sees the new version exactly when
+    it sees the new rows. Reading it is a primary-key lookup, unlike an
+    aggregate over the table it versions.
+    """
+    __tablename__ = "search_versions"
+
+    name = Column(String(50), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<SearchVersion {self.name}={self.version}>"
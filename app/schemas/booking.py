@@ -1,9 +1,10 @@
 # app/schemas/booking.py
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+from typing import List, Optional
 from datetime import datetime
 from uuid import UUID
 from enum import Enum
+from app.utils.availability import to_naive_utc
 
 class BookingStatus(str, Enum):
     PENDING = "PENDING"
@@ -28,6 +29,11 @@ class BookingBase(BaseModel):
 class BookingCreate(BookingBase):
     caregiver_id: UUID
 
+    @field_validator('start_date', 'end_date')
+    @classmethod
+    def validate_naive_utc(cls, v: datetime) -> datetime:
+        return to_naive_utc(v)
+
 class BookingUpdate(BaseModel):
     special_instructions: Optional[str] = None
     status: Optional[BookingStatus] = None
@@ -67,4 +73,7 @@ class BookingResponse(BaseModel):
     can_review: bool
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+# Precompiled serializer for GET /bookings/
+booking_response_list_adapter = TypeAdapter(List[BookingResponse])
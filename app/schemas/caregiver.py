@@ -1,7 +1,7 @@
 # app/schemas/caregiver.py
-from pydantic import BaseModel, Field, constr
+from pydantic import BaseModel, Field, TypeAdapter, constr
 from typing import Optional, List
-from datetime import datetime
+from datetime import date, datetime
 from uuid import UUID
 
 class CaregiverProfileBase(BaseModel):
@@ -20,6 +20,8 @@ class CaregiverProfileBase(BaseModel):
     living_space_size: Optional[int] = Field(None, gt=0)
     emergency_transport: bool = False
     preferred_pet_size: List[str] = []
+    latitude: Optional[float] = Field(None, ge=-90, le=90)
+    longitude: Optional[float] = Field(None, ge=-180, le=180)
 
 class CaregiverProfileCreate(CaregiverProfileBase):
     pass
@@ -46,6 +48,39 @@ class CaregiverPublicProfile(CaregiverProfileBase):
     is_available: bool
     user_full_name: str
     user_profile_picture: Optional[str] = None
+    thumbnail_url: Optional[str] = None
+    distance_km: Optional[float] = None  # Only set by location searches
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class FacetCount(BaseModel):
+    value: str
+    count: int
+
+class PriceBucket(BaseModel):
+    min: float
+    max: Optional[float] = None  # None for the open-ended top bucket
+    count: int
+
+class CaregiverSearchFacets(BaseModel):
+    total: int
+    service_type: List[FacetCount]
+    pet_type: List[FacetCount]
+    pet_size: List[FacetCount]
+    price: List[PriceBucket]
+
+class AvailabilityDay(BaseModel):
+    date: date
+    booked: int  # most pets staying at any one moment of the day
+    remaining: int
+
+class CaregiverAvailability(BaseModel):
+    caregiver_id: UUID
+    maximum_pets: int
+    days: List[AvailabilityDay]  # only days inside available_from/available_to
+
+# Precompiled serializers for the search results list, its facets and the calendar
+caregiver_public_list_adapter = TypeAdapter(List[CaregiverPublicProfile])
+caregiver_search_facets_adapter = TypeAdapter(CaregiverSearchFacets)
+caregiver_availability_adapter = TypeAdapter(CaregiverAvailability)
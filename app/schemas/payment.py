@@ -1,5 +1,5 @@
 # app/schemas/payment.py
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 from typing import Optional, List
 from datetime import datetime
 from uuid import UUID
@@ -113,7 +113,7 @@ class PaymentHistoryResponse(BaseModel):
         from_attributes = True
 
 class PaymentSummary(BaseModel):
-    total_payments: int
+    total_payments: Optional[int]
     total_amount: float
     currency: str
     completed_payments: int
@@ -123,7 +123,9 @@ class PaymentSummary(BaseModel):
 
 class PaymentListResponse(BaseModel):
     items: List[PaymentResponse]
-    total: int
+    # Counted for offset pages and the first cursor page only; null when paging on
+    total: Optional[int]
+    has_more: bool
     summary: PaymentSummary
 
     class Config:
@@ -203,4 +205,7 @@ class PaymentErrorResponse(BaseModel):
     detailed_message: Optional[str]
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+# Precompiled serializer for GET /payments/history
+payment_list_response_adapter = TypeAdapter(PaymentListResponse)
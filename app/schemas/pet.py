@@ -1,5 +1,5 @@
 # app/schemas/pet.py
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from typing import Optional, List
 from datetime import datetime
 from uuid import UUID
@@ -70,4 +70,7 @@ class PetBasic(BaseModel):
     primary_image: Optional[str] = None
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+# Precompiled serializer for GET /pets/
+pet_list_adapter = TypeAdapter(List[Pet])
@@ -1,6 +1,6 @@
 # app/schemas/review.py
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+from typing import List, Optional
 from datetime import datetime
 from uuid import UUID
 
@@ -50,4 +50,7 @@ class Review(ReviewBase):
     )
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+# Precompiled serializer for a caregiver's review list
+review_list_adapter = TypeAdapter(List[Review])
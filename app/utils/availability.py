@@ -0,0 +1,276 @@
+# app/utils/availability.py
+from datetime import date, datetime, time, timedelta, timezone
+from fastapi import HTTPException
+from sqlalchemy import event, func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+from uuid import UUID
+from app.core.cache import REPLICA_SETTLE_SECONDS, create_cache
+from app.core.config import settings
+from app.models.booking import Booking, BookingStatus
+from app.models.caregiver import CaregiverProfile
+
+# Bookings that hold one of a caregiver's `maximum_pets` slots. A booking
+# awaiting payment keeps its slot, or it could be taken while the owner pays.
+# Matches the predicate of ex_bookings_pet_id_period_active.
+ACTIVE_BOOKING_STATUSES = (BookingStatus.PENDING, BookingStatus.PAYMENT_REQUIRED, BookingStatus.CONFIRMED)
+
+# First key of the two-key advisory locks taken per caregiver, so they can't
+# collide with advisory locks taken for anything else
+CAREGIVER_LOCK_NAMESPACE = 7301
+
+# Exclusion constraint keeping a pet's active bookings apart (migration c4f9a2e7b1d3)
+PET_OVERLAP_CONSTRAINT = "ex_bookings_pet_id_period_active"
+
+
+def booking_period() -> ColumnElement:
+    """`tsrange(start_date, end_date)`, the expression indexed by ix_bookings_caregiver_id_period."""
+    return func.tsrange(Booking.start_date, Booking.end_date)
+
+
+def overlaps(start: datetime, end: datetime) -> ColumnElement:
+    """Bookings whose [start_date, end_date) intersects [start, end)."""
+    return booking_period().op("&&")(func.tsrange(start, end))
+
+
+def to_naive_utc(value: datetime) -> datetime:
+    """
+    Booking dates are stored as naive UTC (`timestamp`, `tsrange`). An offset
+    given by the client is converted to UTC and dropped; comparing or binding
+    an aware datetime against those columns would fail instead.
+    """
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def validate_window(start: Optional[datetime], end: Optional[datetime]) -> Optional[Tuple[datetime, datetime]]:
+    """Both or neither of start/end, and a non-empty window; 400 otherwise. Returned as naive UTC."""
+    if start is None and end is None:
+        return None
+    if start is None or end is None:
+        raise HTTPException(status_code=400, detail="start_date and end_date must be given together")
+    start, end = to_naive_utc(start), to_naive_utc(end)
+    if end <= start:
+        raise HTTPException(status_code=400, detail="end_date must be after start_date")
+    return start, end
+
+
+def booked_count(start: datetime, end: datetime) -> ColumnElement:
+    """Correlated count of a caregiver's active bookings overlapping the window."""
+    return (
+        select(func.count(Booking.id))
+        .where(
+            Booking.caregiver_id == CaregiverProfile.id,
+            Booking.status.in_(ACTIVE_BOOKING_STATUSES),
+            overlaps(start, end),
+        )
+        .correlate(CaregiverProfile)
+        .scalar_subquery()
+    )
+
+
+def has_capacity(start: datetime, end: datetime) -> ColumnElement:
+    """
+    Caregivers with a free slot for [start, end). Runs inside the search
+    statement as one GiST probe per candidate on (caregiver_id, period).
+    Every overlapping booking counts against `maximum_pets`, even two that
+    do not overlap each other, so a caregiver is never shown as free when
+    they are not.
+    """
+    return booked_count(start, end) < func.coalesce(CaregiverProfile.maximum_pets, 1)
+
+
+def peak_occupancy(intervals: Iterable[Tuple[datetime, datetime]], start: datetime, end: datetime) -> int:
+    """
+    Most bookings running at the same instant within [start, end). A sweep
+    over the start/end events, so two bookings that overlap the window but
+    not each other take one slot, not two. Intervals are half-open: a stay
+    ending at noon frees its slot for one starting at noon.
+    """
+    events = []
+    for booked_start, booked_end in intervals:
+        booked_start, booked_end = max(booked_start, start), min(booked_end, end)
+        if booked_start < booked_end:
+            events.append((booked_start, 1))
+            events.append((booked_end, -1))
+    # At equal times -1 sorts first, so back-to-back bookings don't count as overlapping
+    events.sort()
+    peak = current = 0
+    for _, delta in events:
+        current += delta
+        peak = max(peak, current)
+    return peak
+
+
+def active_bookings(
+    session: Session,
+    caregiver_id: UUID,
+    start: datetime,
+    end: datetime,
+    exclude_booking_id: Optional[UUID] = None,
+) -> List[Tuple[datetime, datetime]]:
+    """(start_date, end_date) of the caregiver's active bookings overlapping the window."""
+    query = select(Booking.start_date, Booking.end_date).where(
+        Booking.caregiver_id == caregiver_id,
+        Booking.status.in_(ACTIVE_BOOKING_STATUSES),
+        overlaps(start, end),
+    )
+    if exclude_booking_id is not None:
+        query = query.where(Booking.id != exclude_booking_id)
+    return [tuple(row) for row in session.execute(query)]
+
+
+def lock_caregiver(session: Session, caregiver_id: UUID) -> None:
+    """
+    Transaction-scoped advisory lock on one caregiver. Requests booking the
+    same caregiver queue here until the holder commits or rolls back;
+    bookings for other caregivers, and the bookings table, stay unlocked.
+    """
+    session.execute(select(func.pg_advisory_xact_lock(
+        CAREGIVER_LOCK_NAMESPACE, func.hashtext(str(caregiver_id))
+    )))
+
+
+def ensure_capacity(
+    session: Session,
+    caregiver: CaregiverProfile,
+    start: datetime,
+    end: datetime,
+    exclude_booking_id: Optional[UUID] = None,
+) -> None:
+    """
+    Take the caregiver's lock, then 409 unless one more pet fits in
+    [start, end). The lock is held until the caller commits, so the check
+    and the insert (or status change) it guards are atomic.
+    """
+    lock_caregiver(session, caregiver.id)
+    booked = peak_occupancy(active_bookings(session, caregiver.id, start, end, exclude_booking_id), start, end)
+    if booked + 1 > (caregiver.maximum_pets or 1):
+        raise HTTPException(status_code=409, detail="Caregiver is fully booked for these dates")
+
+
+def commit_booking(session: Session) -> None:
+    """Commit, turning a violation of the pet overlap constraint into a 409."""
+    try:
+        session.commit()
+    except IntegrityError as e:
+        session.rollback()
+        diag = getattr(e.orig, "diag", None)
+        if getattr(diag, "constraint_name", None) == PET_OVERLAP_CONSTRAINT:
+            raise HTTPException(status_code=409, detail="Pet already has a booking for these dates")
+        raise
+
+
+def daily_occupancy(intervals: Iterable[Tuple[datetime, datetime]], first_day: date, last_day: date) -> List[int]:
+    """
+    peak_occupancy() for every day from first_day to last_day inclusive, from
+    one sort of the start/end events and a single pass over them and the
+    days: O(n log n + days) rather than a sweep per day.
+    """
+    events = sorted(
+        event
+        for booked_start, booked_end in intervals if booked_start < booked_end
+        for event in ((booked_start, 1), (booked_end, -1))
+    )
+    peaks = []
+    current = i = 0
+    day = first_day
+    while day <= last_day:
+        day_start = datetime.combine(day, time.min)
+        day_end = day_start + timedelta(days=1)
+        # Events up to and including midnight give the pets staying at 00:00
+        while i < len(events) and events[i][0] <= day_start:
+            current += events[i][1]
+            i += 1
+        peak = current
+        while i < len(events) and events[i][0] < day_end:
+            current += events[i][1]
+            i += 1
+            peak = max(peak, current)
+        peaks.append(peak)
+        day += timedelta(days=1)
+    return peaks
+
+
+def availability_calendar(
+    session: Session,
+    caregiver: CaregiverProfile,
+    first_day: date,
+    last_day: date,
+) -> Dict[str, Any]:
+    """
+    Remaining capacity per day, clipped to the caregiver's
+    available_from/available_to. One GiST range query for the active
+    bookings overlapping the whole range, then daily_occupancy().
+    """
+    capacity = caregiver.maximum_pets or 1
+    if caregiver.available_from:
+        first_day = max(first_day, caregiver.available_from.date())
+    if caregiver.available_to:
+        last_day = min(last_day, caregiver.available_to.date())
+
+    days = []
+    if caregiver.is_available and first_day <= last_day:
+        start = datetime.combine(first_day, time.min)
+        end = datetime.combine(last_day + timedelta(days=1), time.min)
+        peaks = daily_occupancy(active_bookings(session, caregiver.id, start, end), first_day, last_day)
+        days = [
+            {"date": first_day + timedelta(days=offset), "booked": booked, "remaining": max(capacity - booked, 0)}
+            for offset, booked in enumerate(peaks)
+        ]
+    return {"caregiver_id": caregiver.id, "maximum_pets": capacity, "days": days}
+
+
+# Serialized calendars, one entry per caregiver holding {(from, to): (etag, body)},
+# so a booking change drops every range cached for that caregiver with one delete.
+# Like the search caches, a dropped caregiver is not refilled until the
+# replica has caught up with the booking that dropped it.
+availability_cache = create_cache(
+    "caregiver_availability",
+    max_size=settings.AVAILABILITY_CACHE_MAX_SIZE,
+    ttl=settings.AVAILABILITY_CACHE_TTL_SECONDS,
+    settle_seconds=REPLICA_SETTLE_SECONDS
+)
+
+# Date ranges kept per caregiver; the oldest is dropped beyond this
+CALENDAR_RANGES_PER_CAREGIVER = 8
+
+
+def cached_calendar(caregiver_id: UUID, key: Hashable) -> Optional[Tuple[str, bytes]]:
+    return (availability_cache.get(caregiver_id) or {}).get(key)
+
+
+def cache_calendar(caregiver_id: UUID, key: Hashable, value: Tuple[str, bytes]) -> None:
+    # Copy rather than mutate: the entry may be shared with a concurrent reader.
+    # Two racing writers can lose one range, which only costs a miss.
+    ranges = dict(availability_cache.get(caregiver_id) or {})
+    ranges.pop(key, None)
+    ranges[key] = value
+    while len(ranges) > CALENDAR_RANGES_PER_CAREGIVER:
+        del ranges[next(iter(ranges))]
+    availability_cache.set(caregiver_id, ranges)
+
+
+@event.listens_for(Session, "after_flush")
+def _flag_calendar_writes(session: Session, flush_context) -> None:
+    # Bookings created or changing status, and profile edits to maximum_pets,
+    # available_from/available_to or is_available
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Booking):
+            session.info.setdefault("calendars_dirty", set()).add(obj.caregiver_id)
+        elif isinstance(obj, CaregiverProfile):
+            session.info.setdefault("calendars_dirty", set()).add(obj.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_calendars_after_commit(session: Session) -> None:
+    for caregiver_id in session.info.pop("calendars_dirty", ()):
+        availability_cache.delete(caregiver_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_calendar_writes(session: Session) -> None:
+    session.info.pop("calendars_dirty", None)
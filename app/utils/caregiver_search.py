@@ -0,0 +1,420 @@
+# app/utils/caregiver_search.py
+from sqlalchemy import Float, String, and_, cast, event, func, literal, null, or_, select, true, union_all
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.selectable import CompoundSelect, Select
+from datetime import datetime
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+from app.core.cache import REPLICA_SETTLE_SECONDS, create_cache
+from app.core.config import settings
+from app.models.booking import Booking
+from app.models.caregiver import CaregiverProfile
+from app.models.caregiver_service_price import CaregiverServicePrice
+from app.models.image import Image
+from app.models.review import Review
+from app.models.user import User, UserType
+import math
+
+# Element type of the ARRAY columns; the literal must match it for @> to use the GIN index
+TAG_ARRAY = ARRAY(String(50))
+
+# Text search configuration of caregiver_profiles.search_vector (migration f1c5a9e3b7d2)
+TEXT_SEARCH_CONFIG = "english"
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE_LAT = 111.045
+
+
+def has_tag(column, value: str) -> ColumnElement:
+    """`column @> ARRAY[value]`: containment is GIN-indexable, `value = ANY(column)` is not."""
+    return column.contains(cast([value], TAG_ARRAY))
+
+
+# Price column each service is billed by
+SERVICE_PRICE_COLUMNS = {
+    "BOARDING": CaregiverProfile.price_per_night,
+    "DAYCARE": CaregiverProfile.price_per_day,
+    "WALKING": CaregiverProfile.price_per_walk,
+}
+
+
+def service_key(service_type: Optional[str]) -> Optional[str]:
+    """`service_type` as stored in caregiver_service_prices, or None if it has no price column."""
+    key = (service_type or "").strip().upper()
+    return key if key in SERVICE_PRICE_COLUMNS else None
+
+
+def _offered_prices(column: ColumnElement, service_type: Optional[str]) -> Select:
+    """`column` over the caregiver's available caregiver_service_prices rows for `service_type` (or any)."""
+    prices = select(column).where(
+        CaregiverServicePrice.caregiver_id == CaregiverProfile.id,
+        CaregiverServicePrice.is_available == True,
+    )
+    service = service_key(service_type)
+    if service:
+        prices = prices.where(CaregiverServicePrice.service_type == service)
+    return prices.correlate(CaregiverProfile)
+
+
+def price_filter(max_price: float, service_type: Optional[str] = None) -> ColumnElement:
+    """
+    Caregivers charging at most `max_price` for `service_type`, or for any
+    service they offer when no (known) service is given. An EXISTS over
+    caregiver_service_prices; with a service it is a range scan on
+    ix_caregiver_service_prices_service_type_price_available.
+    """
+    return _offered_prices(CaregiverServicePrice.caregiver_id, service_type).where(
+        CaregiverServicePrice.price <= max_price
+    ).exists()
+
+
+def offered_price(service_type: Optional[str] = None) -> ColumnElement:
+    """
+    The price price_filter compares with max_price: the caregiver's available
+    `service_type` price, or the cheapest available one. Bucketing by it
+    keeps the price facet consistent with what picking a bucket returns.
+    """
+    return _offered_prices(func.min(CaregiverServicePrice.price), service_type).scalar_subquery()
+
+
+def facet_filters(
+    service_type: Optional[str] = None,
+    pet_type: Optional[str] = None,
+    max_price: Optional[float] = None,
+    pet_size: Optional[str] = None,
+) -> Dict[str, Optional[ColumnElement]]:
+    """The predicate of each facet filter, keyed by facet name; None when not filtered."""
+    return {
+        "service_type": has_tag(CaregiverProfile.services_offered, service_type) if service_type else None,
+        "pet_type": has_tag(CaregiverProfile.accepted_pet_types, pet_type) if pet_type else None,
+        "price": price_filter(max_price, service_type) if max_price else None,
+        "pet_size": has_tag(CaregiverProfile.preferred_pet_size, pet_size) if pet_size else None,
+    }
+
+
+def search_filters(
+    service_type: Optional[str] = None,
+    pet_type: Optional[str] = None,
+    max_price: Optional[float] = None,
+    pet_size: Optional[str] = None,
+) -> List[ColumnElement]:
+    """
+    WHERE criteria for caregiver search. `is_available` comes first and
+    matches the predicate of the partial indexes in migration b7d41c9e2a15,
+    so every filter below can be answered from those indexes.
+    """
+    criteria = [CaregiverProfile.is_available == True]
+    facets = facet_filters(service_type, pet_type, max_price, pet_size)
+    criteria.extend(predicate for predicate in facets.values() if predicate is not None)
+    return criteria
+
+
+# Tag facets and the array column each one unnests
+TAG_FACETS = {
+    "service_type": CaregiverProfile.services_offered,
+    "pet_type": CaregiverProfile.accepted_pet_types,
+    "pet_size": CaregiverProfile.preferred_pet_size,
+}
+FACETS = (*TAG_FACETS, "price")
+
+
+def facet_counts_query(
+    base_criteria: List[ColumnElement],
+    filters: Dict[str, Optional[ColumnElement]],
+    price: ColumnElement,
+    bucket_width: float,
+    buckets: int,
+) -> CompoundSelect:
+    """
+    Every facet count for one filter set as a single statement: a CTE reads
+    the matching caregivers once, with a flag per facet filter, and UNION ALL
+    branches aggregate it per facet. Each facet is counted under all the
+    *other* facet filters, so the UI can show what picking another value
+    would return. Rows are (facet, value, count); the price value is the
+    width_bucket number, and the "total" row has no value.
+    """
+    flags = {name: (filters.get(name) if filters.get(name) is not None else true()).label(f"{name}_ok")
+             for name in FACETS}
+    base = select(
+        *(column.label(name) for name, column in TAG_FACETS.items()),
+        price.label("price"),
+        *flags.values(),
+    ).where(*base_criteria).cte("facet_base")
+
+    def matching(*names: str) -> ColumnElement:
+        return and_(*(base.c[f"{name}_ok"] for name in names))
+
+    def others(facet: str) -> ColumnElement:
+        return matching(*(name for name in FACETS if name != facet))
+
+    parts = []
+    for name in TAG_FACETS:
+        values = select(func.unnest(base.c[name]).label("value")).where(others(name)).subquery()
+        parts.append(
+            select(literal(name, String).label("facet"), values.c.value, func.count().label("count"))
+            .group_by(values.c.value)
+        )
+    bucket = func.width_bucket(base.c.price, 0, bucket_width * buckets, buckets)
+    parts.append(
+        select(literal("price", String), cast(bucket, String), func.count())
+        .where(others("price"), base.c.price.isnot(None))
+        .group_by(bucket)
+    )
+    parts.append(
+        select(literal("total", String), cast(null(), String), func.count()).where(matching(*FACETS))
+    )
+    return union_all(*parts)
+
+
+def facet_counts(rows: Iterable[Tuple[str, Optional[str], int]], bucket_width: float, buckets: int) -> Dict[str, Any]:
+    """Shape facet_counts_query rows for CaregiverSearchFacets, most common values first."""
+    result: Dict[str, Any] = {"total": 0, "price": [], **{name: [] for name in TAG_FACETS}}
+    for facet, value, count in rows:
+        if facet == "total":
+            result["total"] = count
+        elif facet == "price":
+            # width_bucket: 1..buckets are [(b - 1) * width, b * width), buckets + 1 is everything above
+            number = max(int(value), 1)
+            result["price"].append({
+                "min": (number - 1) * bucket_width,
+                "max": number * bucket_width if number <= buckets else None,
+                "count": count,
+            })
+        else:
+            result[facet].append({"value": value, "count": count})
+    for name in TAG_FACETS:
+        result[name].sort(key=lambda item: (-item["count"], item["value"]))
+    result["price"].sort(key=lambda item: item["min"])
+    return result
+
+
+def text_query(q: str) -> ColumnElement:
+    """Parse user input as a web-style query: quoted phrases, OR and -negation, never a syntax error."""
+    return func.websearch_to_tsquery(TEXT_SEARCH_CONFIG, q)
+
+
+def matches_text(query: ColumnElement) -> ColumnElement:
+    """`search_vector @@ query`, answered by the partial GIN index on search_vector."""
+    return CaregiverProfile.search_vector.op("@@")(query)
+
+
+def text_rank(query: ColumnElement) -> ColumnElement:
+    """
+    Cover-density rank scaled into [0, 1) (normalization 32). Cast to double
+    precision so the value round-trips exactly through a keyset cursor.
+    """
+    return cast(func.ts_rank_cd(CaregiverProfile.search_vector, query, 32), Float)
+
+
+def after_rank_cursor(rank: ColumnElement, last_rank: float, last_id) -> ColumnElement:
+    """Keyset predicate for ORDER BY rank DESC, id: rows strictly after the cursor."""
+    return or_(
+        rank < last_rank,
+        and_(rank == last_rank, CaregiverProfile.id > last_id)
+    )
+
+
+def bounding_box(lat: float, lng: float, radius_km: float) -> Tuple[float, float, float, float]:
+    """(min_lat, max_lat, min_lng, max_lng) enclosing the circle; clamped at the poles and the antimeridian."""
+    lat_delta = radius_km / KM_PER_DEGREE_LAT
+    min_lat, max_lat = max(lat - lat_delta, -90.0), min(lat + lat_delta, 90.0)
+    # Longitude degrees shrink with latitude; use the widest latitude in the band
+    widest = max(abs(min_lat), abs(max_lat))
+    if widest >= 89.0:
+        return min_lat, max_lat, -180.0, 180.0
+    lng_delta = radius_km / (KM_PER_DEGREE_LAT * math.cos(math.radians(widest)))
+    return min_lat, max_lat, max(lng - lng_delta, -180.0), min(lng + lng_delta, 180.0)
+
+
+def distance_km(lat: float, lng: float) -> ColumnElement:
+    """Great-circle (haversine) distance in km from (lat, lng) to each caregiver."""
+    dlat = func.radians(CaregiverProfile.latitude - lat)
+    dlng = func.radians(CaregiverProfile.longitude - lng)
+    a = (
+        func.power(func.sin(dlat / 2), 2)
+        + math.cos(math.radians(lat))
+        * func.cos(func.radians(CaregiverProfile.latitude))
+        * func.power(func.sin(dlng / 2), 2)
+    )
+    return 2 * EARTH_RADIUS_KM * func.asin(func.least(1.0, func.sqrt(a)))
+
+
+def radius_filters(lat: float, lng: float, radius_km: float, distance: ColumnElement) -> List[ColumnElement]:
+    """
+    Bounding-box range on (latitude, longitude), which the partial btree index
+    answers, then the exact distance check on the few rows left in the box.
+    """
+    min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, radius_km)
+    return [
+        CaregiverProfile.latitude.between(min_lat, max_lat),
+        CaregiverProfile.longitude.between(min_lng, max_lng),
+        distance <= radius_km,
+    ]
+
+
+def after_distance_cursor(distance: ColumnElement, last_distance: float, last_id) -> ColumnElement:
+    """Keyset predicate for ORDER BY distance, id: rows strictly after the cursor."""
+    return or_(
+        distance > last_distance,
+        and_(distance == last_distance, CaregiverProfile.id > last_id)
+    )
+
+
+# Serialized search pages: (etag, body bytes, next cursor) keyed by search_cache_key().
+# Pages are read from the replica, so a clear holds off refills until it has
+# caught up; otherwise a lagging replica would re-cache the pre-write results
+# for the whole TTL.
+search_cache = create_cache(
+    "caregiver_search",
+    max_size=settings.SEARCH_CACHE_MAX_SIZE,
+    ttl=settings.SEARCH_CACHE_TTL_SECONDS,
+    settle_seconds=REPLICA_SETTLE_SECONDS
+)
+
+# Searches with a start_date/end_date window also depend on bookings, which
+# change far more often than profiles; keeping them apart means a new booking
+# does not throw away the undated pages
+dated_search_cache = create_cache(
+    "caregiver_search_dated",
+    max_size=settings.SEARCH_CACHE_MAX_SIZE,
+    ttl=settings.SEARCH_CACHE_TTL_SECONDS,
+    settle_seconds=REPLICA_SETTLE_SECONDS
+)
+
+
+def _clean(value: Optional[str]) -> Optional[str]:
+    value = value.strip() if value else None
+    return value or None
+
+
+def normalize_search_params(
+    service_type: Optional[str],
+    pet_type: Optional[str],
+    max_price: Optional[float],
+    pet_size: Optional[str],
+    q: Optional[str],
+) -> Tuple[Optional[str], Optional[str], Optional[float], Optional[str], Optional[str]]:
+    """
+    Search inputs in the one form both the SQL and the cache key are built
+    from: surrounding whitespace dropped and empty strings meaning "no
+    filter", the price to the cent, and `q` lower-cased with its whitespace
+    collapsed (the english text search configuration folds case anyway).
+    Building both from the same values keeps two requests that would run
+    different SQL from sharing a cache entry.
+    """
+    q = " ".join(q.lower().split()) if q else None
+    return (
+        _clean(service_type),
+        _clean(pet_type),
+        round(max_price, 2) if max_price else None,
+        _clean(pet_size),
+        q or None,
+    )
+
+
+def search_cache_key(
+    service_type: Optional[str],
+    pet_type: Optional[str],
+    max_price: Optional[float],
+    pet_size: Optional[str],
+    point: Optional[Tuple[float, float]],
+    radius_km: float,
+    cursor: Optional[str],
+    skip: int,
+    limit: int,
+    window: Optional[Tuple[datetime, datetime]] = None,
+    sort: Optional[str] = None,
+    q: Optional[str] = None,
+) -> Hashable:
+    """
+    Filter tuple + page, from normalize_search_params() output. The location
+    is keyed by its geocoded point, so equivalent requests share an entry.
+    """
+    return (
+        service_type,
+        pet_type,
+        max_price,
+        pet_size,
+        point,
+        radius_km if point else None,
+        cursor,
+        skip if not cursor else 0,
+        limit,
+        window,
+        sort,
+        q,
+    )
+
+
+def search_cache_for(window: Optional[Tuple[datetime, datetime]]):
+    return dated_search_cache if window else search_cache
+
+
+def invalidate_search_cache() -> None:
+    search_cache.clear()
+    dated_search_cache.clear()
+
+
+# User columns copied onto the caregiver card (migration b2e6d4a9f1c7)
+CARD_USER_FIELDS = ("full_name", "profile_picture")
+
+# Profile columns searches filter, sort or show; the same list the search
+# version trigger watches (migration d6a1e8b3f5c2)
+SEARCHED_PROFILE_FIELDS = (
+    "bio", "years_of_experience", "services_offered", "accepted_pet_types",
+    "price_per_night", "price_per_walk", "price_per_day", "available_from", "available_to",
+    "maximum_pets", "home_type", "has_fenced_yard", "living_space_size", "emergency_transport",
+    "is_available", "preferred_pet_size", "latitude", "longitude",
+    "user_full_name", "user_profile_picture", "thumbnail_url", "rating", "total_reviews", "created_at",
+)
+
+
+def _changes_any(session: Session, obj, fields) -> bool:
+    # Checked after the flush, when the instance flags already read as
+    # flushed but session.new/deleted still hold the pre-flush sets
+    if obj in session.new or obj in session.deleted:
+        return True
+    state = inspect(obj)
+    return any(state.attrs[field].history.has_changes() for field in fields)
+
+
+def _affects_search(session: Session, obj) -> bool:
+    if isinstance(obj, Review):
+        return True
+    if isinstance(obj, CaregiverProfile):
+        return _changes_any(session, obj, SEARCHED_PROFILE_FIELDS)
+    # The card's thumbnail is the caregiver's first image
+    if isinstance(obj, Image):
+        return obj.entity_type == "caregiver"
+    # and its name and picture come from the user; logins etc. don't matter
+    if isinstance(obj, User) and obj.user_type == UserType.CAREGIVER:
+        return _changes_any(session, obj, CARD_USER_FIELDS)
+    return False
+
+
+@event.listens_for(Session, "after_flush")
+def _flag_search_writes(session: Session, flush_context) -> None:
+    changed = (*session.new, *session.dirty, *session.deleted)
+    if any(_affects_search(session, obj) for obj in changed):
+        session.info["search_dirty"] = True
+    elif any(isinstance(obj, Booking) for obj in changed):
+        session.info["bookings_dirty"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    # Clear only once the write is visible, so a concurrent search can't
+    # re-cache the pre-commit rows
+    bookings_dirty = session.info.pop("bookings_dirty", False)
+    if session.info.pop("search_dirty", False):
+        invalidate_search_cache()
+    elif bookings_dirty:
+        dated_search_cache.clear()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_search_writes(session: Session) -> None:
+    session.info.pop("search_dirty", None)
+    session.info.pop("bookings_dirty", None)
@@ -1,20 +1,44 @@
 # app/utils/email.py
-from fastapi_mail import FastMail, MessageSchema, ConnectionConfig
 from pydantic import EmailStr
+from functools import lru_cache
 from typing import List, Dict, Any
 from app.core.config import settings
 
-conf = ConnectionConfig(
-    MAIL_USERNAME=settings.MAIL_USERNAME,
-    MAIL_PASSWORD=settings.MAIL_PASSWORD,
-    MAIL_FROM=settings.MAIL_FROM,
-    MAIL_PORT=settings.MAIL_PORT,
-    MAIL_SERVER=settings.MAIL_SERVER,
-    MAIL_STARTTLS=True,
-    MAIL_SSL_TLS=False,
-    USE_CREDENTIALS=True,
-    VALIDATE_CERTS=True
-)
+
+@lru_cache(maxsize=None)
+def _get_mailer():
+    """Build the FastMail client on first send.
+
+    fastapi_mail drags in aiosmtplib, jinja2 and its own settings model, none
+    of which are needed until an email actually goes out.
+    """
+    from fastapi_mail import FastMail, ConnectionConfig
+
+    conf = ConnectionConfig(
+        MAIL_USERNAME=settings.MAIL_USERNAME,
+        MAIL_PASSWORD=settings.MAIL_PASSWORD,
+        MAIL_FROM=settings.MAIL_FROM,
+        MAIL_PORT=settings.MAIL_PORT,
+        MAIL_SERVER=settings.MAIL_SERVER,
+        MAIL_STARTTLS=True,
+        MAIL_SSL_TLS=False,
+        USE_CREDENTIALS=True,
+        VALIDATE_CERTS=True
+    )
+    return FastMail(conf)
+
+
+async def send_html(subject: str, recipients: List[str], html: str) -> None:
+    """Send an HTML email through the shared FastMail client."""
+    from fastapi_mail import MessageSchema
+
+    message = MessageSchema(
+        subject=subject,
+        recipients=recipients,
+        body=html,
+        subtype="html"
+    )
+    await _get_mailer().send_message(message)
 
 # Authentication related emails
 async def send_verification_email(email: str, token: str):
@@ -31,15 +55,7 @@ async def send_verification_email(email: str, token: str):
         <p style="background-color: #f0f0f0; padding: 10px; word-break: break-all;">{token}</p>
     """
     
-    message = MessageSchema(
-        subject="Verify your PetBnB email",
-        recipients=[email],
-        body=html,
-        subtype="html"
-    )
-    
-    fm = FastMail(conf)
-    await fm.send_message(message)
+    await send_html("Verify your PetBnB email", [email], html)
 
 async def send_reset_password_email(email: str, token: str):
     """Send password reset email"""
@@ -56,15 +72,7 @@ async def send_reset_password_email(email: str, token: str):
         <p style="background-color: #f0f0f0; padding: 10px; word-break: break-all;">{token}</p>
     """
     
-    message = MessageSchema(
-        subject="Reset your PetBnB password",
-        recipients=[email],
-        body=html,
-        subtype="html"
-    )
-    
-    fm = FastMail(conf)
-    await fm.send_message(message)
+    await send_html("Reset your PetBnB password", [email], html)
 
 # Generic email sender
 async def send_email(
@@ -73,15 +81,7 @@ async def send_email(
     html_content: str
 ):
     """Generic function to send any email"""
-    message = MessageSchema(
-        subject=subject,
-        recipients=recipients,
-        body=html_content,
-        subtype="html"
-    )
-    
-    fm = FastMail(conf)
-    await fm.send_message(message)
+    await send_html(subject, recipients, html_content)
 
 # Booking related emails
 async def send_booking_confirmation_email(
@@ -105,15 +105,7 @@ async def send_booking_confirmation_email(
         <p>Best regards,<br>The PetBnB Team</p>
     """
     
-    message = MessageSchema(
-        subject="PetBnB Booking Confirmation",
-        recipients=[owner_email],
-        body=html,
-        subtype="html"
-    )
-    
-    fm = FastMail(conf)
-    await fm.send_message(message)
+    await send_html("PetBnB Booking Confirmation", [owner_email], html)
 
 async def send_booking_notification_to_caregiver(
     caregiver_email: str,
@@ -137,15 +129,7 @@ async def send_booking_notification_to_caregiver(
         <p>Best regards,<br>The PetBnB Team</p>
     """
     
-    message = MessageSchema(
-        subject="PetBnB - New Booking Request",
-        recipients=[caregiver_email],
-        body=html,
-        subtype="html"
-    )
-    
-    fm = FastMail(conf)
-    await fm.send_message(message)
+    await send_html("PetBnB - New Booking Request", [caregiver_email], html)
 
 async def send_booking_status_update(
     email: str,
@@ -168,15 +152,7 @@ async def send_booking_status_update(
         <p>Best regards,<br>The PetBnB Team</p>
     """
     
-    message = MessageSchema(
-        subject=f"PetBnB Booking {status.capitalize()}",
-        recipients=[email],
-        body=html,
-        subtype="html"
-    )
-    
-    fm = FastMail(conf)
-    await fm.send_message(message)
+    await send_html(f"PetBnB Booking {status.capitalize()}", [email], html)
 
 # Payment related emails
 async def send_payment_confirmation(
@@ -198,15 +174,7 @@ async def send_payment_confirmation(
         <p>Best regards,<br>The PetBnB Team</p>
     """
     
-    message = MessageSchema(
-        subject="PetBnB Payment Confirmation",
-        recipients=[email_to],
-        body=html,
-        subtype="html"
-    )
-    
-    fm = FastMail(conf)
-    await fm.send_message(message)
+    await send_html("PetBnB Payment Confirmation", [email_to], html)
 
 async def send_payment_failed(
     email_to: str,
@@ -223,15 +191,7 @@ async def send_payment_failed(
         <p>Best regards,<br>The PetBnB Team</p>
     """
     
-    message = MessageSchema(
-        subject="PetBnB Payment Failed",
-        recipients=[email_to],
-        body=html,
-        subtype="html"
-    )
-    
-    fm = FastMail(conf)
-    await fm.send_message(message)
+    await send_html("PetBnB Payment Failed", [email_to], html)
 
 async def send_payment_required(
     email_to: str,
@@ -248,15 +208,7 @@ async def send_payment_required(
         <p>Best regards,<br>The PetBnB Team</p>
     """
     
-    message = MessageSchema(
-        subject="PetBnB Payment Required",
-        recipients=[email_to],
-        body=html,
-        subtype="html"
-    )
-    
-    fm = FastMail(conf)
-    await fm.send_message(message)
+    await send_html("PetBnB Payment Required", [email_to], html)
 
 async def send_refund_confirmation(
     email_to: str,
@@ -277,15 +229,7 @@ async def send_refund_confirmation(
         <p>Best regards,<br>The PetBnB Team</p>
     """
     
-    message = MessageSchema(
-        subject="PetBnB Refund Confirmation",
-        recipients=[email_to],
-        body=html,
-        subtype="html"
-    )
-    
-    fm = FastMail(conf)
-    await fm.send_message(message)
+    await send_html("PetBnB Refund Confirmation", [email_to], html)
 
 # New function for payout notifications
 async def send_payout_notification(
@@ -307,12 +251,4 @@ async def send_payout_notification(
         <p>Best regards,<br>The PetBnB Team</p>
     """
     
-    message = MessageSchema(
-        subject="PetBnB Payout Processed",
-        recipients=[email_to],
-        body=html,
-        subtype="html"
-    )
-    
-    fm = FastMail(conf)
-    await fm.send_message(message)
\ No newline at end of file
+    await send_html("PetBnB Payout Processed", [email_to], html)
\ No newline at end of file
@@ -0,0 +1,39 @@
+# app/utils/etag.py
+from fastapi import Request, Response
+from typing import Any
+import hashlib
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Strong ETag from the values a representation depends on: a resource kind,
+    ids, updated_at / version columns, counts and the query parameters that
+    shape the response. Cheap version probes produce these parts, so the tag
+    can be checked before the full object graph is loaded.
+    """
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """True when If-None-Match names `etag` (weak comparison, as RFC 9110 requires)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # Compression middleware may have weakened the tag the client holds
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in header.split(","))
+
+
+def set_etag(response: Response, etag: str) -> None:
+    """Attach the ETag; private + no-cache makes clients revalidate with it every time."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 carrying the same validator headers as the 200 would have."""
+    response = Response(status_code=304)
+    set_etag(response, etag)
+    return response
@@ -0,0 +1,73 @@
+# app/utils/geocoding.py
+from fastapi import HTTPException
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+from app.core.config import settings
+import re
+
+Point = Tuple[float, float]
+
+_COORDINATES = re.compile(r"^\s*(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)\s*$")
+
+
+class OfflineGeocoder:
+    """
+    Resolves "lat,lng" strings and a fixed table of cities without any network
+    access. It is the default provider, so local runs and tests behave the
+    same with no API keys. A hosted provider can be plugged in by adding a
+    class with the same `geocode` method and selecting it via
+    GEOCODING_PROVIDER.
+    """
+
+    CITIES: Dict[str, Point] = {
+        "kuala lumpur": (3.1390, 101.6869),
+        "petaling jaya": (3.1073, 101.6067),
+        "subang jaya": (3.0438, 101.5806),
+        "shah alam": (3.0733, 101.5185),
+        "klang": (3.0449, 101.4456),
+        "putrajaya": (2.9264, 101.6964),
+        "cyberjaya": (2.9213, 101.6559),
+        "george town": (5.4141, 100.3288),
+        "penang": (5.4164, 100.3327),
+        "ipoh": (4.5975, 101.0901),
+        "melaka": (2.1896, 102.2501),
+        "johor bahru": (1.4927, 103.7414),
+        "kota kinabalu": (5.9804, 116.0735),
+        "kuching": (1.5533, 110.3592),
+        "singapore": (1.3521, 103.8198),
+    }
+
+    def geocode(self, location: str) -> Optional[Point]:
+        match = _COORDINATES.match(location)
+        if match:
+            lat, lng = float(match.group(1)), float(match.group(2))
+            if -90 <= lat <= 90 and -180 <= lng <= 180:
+                return lat, lng
+            return None
+        name = location.strip().lower()
+        for suffix in (", malaysia", ", singapore"):
+            if name.endswith(suffix):
+                name = name[:-len(suffix)]
+        return self.CITIES.get(name)
+
+
+PROVIDERS = {
+    "offline": OfflineGeocoder,
+}
+
+
+@lru_cache(maxsize=1)
+def get_geocoder():
+    try:
+        return PROVIDERS[settings.GEOCODING_PROVIDER]()
+    except KeyError:
+        raise RuntimeError(f"Unknown GEOCODING_PROVIDER {settings.GEOCODING_PROVIDER!r}")
+
+
+@lru_cache(maxsize=4096)
+def geocode(location: str) -> Point:
+    """Resolve a search `location` to (lat, lng), or 400 if it cannot be resolved."""
+    point = get_geocoder().geocode(location)
+    if point is None:
+        raise HTTPException(status_code=400, detail=f"Could not resolve location: {location}")
+    return point
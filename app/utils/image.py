@@ -1,18 +1,27 @@
 from fastapi import UploadFile, HTTPException
-import cloudinary
-import cloudinary.uploader
+from functools import lru_cache
 from typing import Optional, List
 import uuid
 from app.core.config import settings, StatusMessage
 from datetime import datetime
 
+
+@lru_cache(maxsize=None)
+def _get_cloudinary():
+    """Import and configure the Cloudinary SDK on first use."""
+    import cloudinary
+    import cloudinary.uploader
+
+    cloudinary.config(
+        cloud_name=settings.CLOUDINARY_CLOUD_NAME,
+        api_key=settings.CLOUDINARY_API_KEY,
+        api_secret=settings.CLOUDINARY_API_SECRET
+    )
+    return cloudinary
+
+
 class CloudinaryService:
-    def __init__(self):
-        cloudinary.config(
-            cloud_name=settings.CLOUDINARY_CLOUD_NAME,
-            api_key=settings.CLOUDINARY_API_KEY,
-            api_secret=settings.CLOUDINARY_API_SECRET
-        )
+    """Cheap to construct; the SDK is only imported by the first upload/delete."""
 
     async def upload_image(
         self,
@@ -28,6 +37,7 @@ class CloudinaryService:
                 detail=StatusMessage.INVALID_FILE_TYPE
             )
 
+        cloudinary = _get_cloudinary()
         try:
             # Generate a unique identifier for the image
             unique_id = str(uuid.uuid4())[:8]
@@ -68,6 +78,7 @@ class CloudinaryService:
 
     async def delete_image(self, public_id: str) -> bool:
         """Delete image from Cloudinary."""
+        cloudinary = _get_cloudinary()
         try:
             result = cloudinary.uploader.destroy(public_id)
             return result.get('result') == 'ok'
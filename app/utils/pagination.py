@@ -0,0 +1,86 @@
+# app/utils/pagination.py
+from fastapi import HTTPException
+from datetime import datetime
+from sqlalchemy import literal, tuple_
+from sqlalchemy.orm import Query
+from typing import Any, Callable, List, Optional, Tuple
+from uuid import UUID
+import base64
+import json
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def encode_cursor(*values: Any) -> str:
+    """Opaque keyset cursor: the (sort key..., id) of the last row served."""
+    raw = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, *types: Callable[[Any], Any]) -> Tuple:
+    """
+    Decode a cursor produced by encode_cursor, converting each value with the
+    matching callable in `types` (e.g. float, UUID, datetime.fromisoformat).
+    Anything malformed is the client's fault: 400, never a 500.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("wrong number of values")
+        return tuple(convert(value) for convert, value in zip(types, values))
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+# How each sort-key type is rebuilt from its JSON form
+_PARSERS = {datetime: datetime.fromisoformat, UUID: UUID, float: float, int: int, str: str}
+
+
+def keyset_paginate(
+    query: Query,
+    sort_column,
+    id_column,
+    cursor: Optional[str],
+    skip: int,
+    limit: int,
+    descending: bool = True,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Page `query` by (sort_column, id_column). With a cursor, seek past the
+    last row served using a row-value comparison that a composite
+    (..., sort_column, id) index answers directly, so page 10,000 costs the
+    same as page 1. Without one, fall back to `skip` for existing clients.
+    Returns the rows and the cursor for the next page (None on the last page).
+    One extra row is fetched to tell the two apart, so callers never need a
+    count(*) just to know whether to offer another page.
+    """
+    if cursor:
+        parsers = [_PARSERS[column.type.python_type] for column in (sort_column, id_column)]
+        last_sort, last_id = decode_cursor(cursor, *parsers)
+        key = tuple_(sort_column, id_column)
+        bound = tuple_(literal(last_sort, sort_column.type), literal(last_id, id_column.type))
+        query = query.filter(key < bound if descending else key > bound)
+
+    if descending:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column, id_column)
+    if not cursor:
+        query = query.offset(skip)
+    rows = query.limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
+    return rows, next_cursor
@@ -0,0 +1,204 @@
+# app/utils/ranking.py
+from __future__ import annotations
+
+from sqlalchemy import func, literal
+from sqlalchemy.sql.elements import ColumnElement
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
+from uuid import UUID
+from app.models.caregiver import CaregiverProfile
+from app.utils.caregiver_search import offered_price
+import time
+
+# NumPy is imported by the functions that use it: only ranked searches need
+# it, and it is a sizeable share of the app's import time otherwise
+if TYPE_CHECKING:
+    import numpy as np
+
+SORTS = ("relevance", "price", "rating", "distance")
+
+# Sorts served by ranking the candidate set in NumPy; the default and
+# distance orders stay plain SQL ORDER BYs
+RANKED_SORTS = ("relevance", "price", "rating")
+
+# Relevance = weighted sum of components that each lie in [0, 1]
+WEIGHTS = {
+    "price": 0.25,
+    "rating": 0.35,
+    "experience": 0.10,
+    "distance": 0.20,
+    "recency": 0.10,
+    "text": 0.30,
+}
+
+# Bayesian rating: a caregiver starts with this many virtual reviews at the
+# candidates' mean rating, so 5.0 from one review doesn't beat 4.8 from 200
+RATING_PRIOR_REVIEWS = 5.0
+RATING_PRIOR_FALLBACK = 3.5
+EXPERIENCE_SCALE_YEARS = 5.0
+RECENCY_HALF_LIFE_DAYS = 180.0
+
+# Column order of the numeric candidate matrix
+PRICE, RATING, REVIEWS, YEARS, CREATED, DISTANCE, TEXT_RANK = range(7)
+
+
+def candidate_columns(
+    service_type: Optional[str],
+    distance: Optional[ColumnElement] = None,
+    text_rank: Optional[ColumnElement] = None,
+) -> List[ColumnElement]:
+    """
+    SELECT list for rank(): the id, then the candidate matrix columns in order.
+    The price is offered_price(), the one max_price filters on and facets bucket by.
+    """
+    return [
+        CaregiverProfile.id,
+        offered_price(service_type),
+        CaregiverProfile.rating,
+        CaregiverProfile.total_reviews,
+        CaregiverProfile.years_of_experience,
+        func.extract("epoch", CaregiverProfile.created_at),
+        distance if distance is not None else literal(None),
+        text_rank if text_rank is not None else literal(None),
+    ]
+
+
+def candidate_matrix(rows: Sequence[Sequence[Any]]) -> Tuple[List[UUID], np.ndarray]:
+    """Split candidate rows into their ids and an (n, 7) float matrix; NULL becomes NaN."""
+    import numpy as np
+
+    ids = [row[0] for row in rows]
+    if not rows:
+        return ids, np.empty((0, 7))
+    return ids, np.array([row[1:] for row in rows], dtype=float)
+
+
+def _normalized(values: np.ndarray) -> np.ndarray:
+    """Min-max scale to [0, 1]; all-equal or all-NaN columns become 0."""
+    import numpy as np
+
+    finite = np.isfinite(values)
+    if not finite.any():
+        return np.zeros_like(values)
+    low, high = values[finite].min(), values[finite].max()
+    if high == low:
+        return np.where(finite, 1.0, 0.0)
+    return np.where(finite, (values - low) / (high - low), 0.0)
+
+
+def bayesian_rating(matrix: np.ndarray) -> np.ndarray:
+    import numpy as np
+
+    ratings = np.nan_to_num(matrix[:, RATING])
+    reviews = np.nan_to_num(matrix[:, REVIEWS])
+    total = reviews.sum()
+    prior = (ratings * reviews).sum() / total if total else RATING_PRIOR_FALLBACK
+    return (RATING_PRIOR_REVIEWS * prior + ratings * reviews) / (RATING_PRIOR_REVIEWS + reviews)
+
+
+def relevance(
+    matrix: np.ndarray,
+    max_price: Optional[float] = None,
+    radius_km: Optional[float] = None,
+    now: Optional[float] = None,
+) -> np.ndarray:
+    """Relevance score per candidate, higher is better, computed column-wise."""
+    import numpy as np
+
+    prices = matrix[:, PRICE]
+    if max_price:
+        # Within budget: the further under it the better
+        price_fit = np.clip(1.0 - prices / max_price, 0.0, 1.0)
+    else:
+        price_fit = 1.0 - _normalized(prices)
+    # Caregivers without a price for the service get no credit for it
+    price_fit = np.where(np.isfinite(prices), price_fit, 0.0)
+
+    rating = bayesian_rating(matrix) / 5.0
+    experience = 1.0 - np.exp(-np.nan_to_num(matrix[:, YEARS]) / EXPERIENCE_SCALE_YEARS)
+
+    # Whole UTC days, so keys (and the cursors built from them) hold still
+    # between pages instead of drifting with the clock
+    today = (now or time.time()) // 86400
+    age_days = today - np.floor_divide(np.nan_to_num(matrix[:, CREATED]), 86400)
+    recency = np.exp2(-np.clip(age_days, 0.0, None) / RECENCY_HALF_LIFE_DAYS)
+
+    score = (
+        WEIGHTS["price"] * price_fit
+        + WEIGHTS["rating"] * rating
+        + WEIGHTS["experience"] * experience
+        + WEIGHTS["recency"] * recency
+    )
+    distances = matrix[:, DISTANCE]
+    if radius_km and np.isfinite(distances).any():
+        score += WEIGHTS["distance"] * np.where(
+            np.isfinite(distances), np.clip(1.0 - distances / radius_km, 0.0, 1.0), 0.0
+        )
+    # ts_rank_cd(..., 32) is already in [0, 1); only present for `q` searches
+    score += WEIGHTS["text"] * np.nan_to_num(matrix[:, TEXT_RANK])
+    return score
+
+
+def sort_keys(
+    matrix: np.ndarray,
+    sort: str,
+    max_price: Optional[float] = None,
+    radius_km: Optional[float] = None,
+    now: Optional[float] = None,
+) -> np.ndarray:
+    """Ascending keys for `sort` (best first); candidates with no value go last."""
+    import numpy as np
+
+    if sort == "relevance":
+        return -relevance(matrix, max_price, radius_km, now)
+    if sort == "price":
+        prices = matrix[:, PRICE]
+        return np.where(np.isfinite(prices), prices, np.inf)
+    if sort == "rating":
+        return -bayesian_rating(matrix)
+    raise ValueError(f"not a ranked sort: {sort!r}")
+
+
+def _uuid_words(ids: Sequence[UUID]) -> Tuple[np.ndarray, np.ndarray]:
+    """High and low 64 bits of each id; (high, low) order is UUID order."""
+    import numpy as np
+
+    values = [i.int for i in ids]
+    return (
+        np.array([v >> 64 for v in values], dtype=np.uint64),
+        np.array([v & 0xFFFFFFFFFFFFFFFF for v in values], dtype=np.uint64),
+    )
+
+
+def rank_page(
+    ids: List[UUID],
+    keys: np.ndarray,
+    after: Optional[Tuple[float, UUID]],
+    skip: int,
+    limit: int,
+) -> Tuple[List[int], List[float]]:
+    """
+    Positions (into `ids`) and keys of one page in (key, id) order. `after` is the (key, id)
+    keyset cursor of the previous page; without it, `skip` rows are skipped.
+    A partition picks the best skip + limit keys (plus ties) out of the
+    candidate set, and only those are fully sorted, so per-row Python work
+    is limited to ties and the page itself.
+    """
+    import numpy as np
+
+    if after:
+        last_key, last_id = after
+        keep = keys > last_key
+        ties = np.flatnonzero(keys == last_key)
+        keep[ties] = [ids[i] > last_id for i in ties]
+        positions = np.flatnonzero(keep)
+        skip = 0
+    else:
+        positions = np.arange(len(ids))
+
+    wanted = skip + limit
+    if wanted < len(positions):
+        bound = np.partition(keys[positions], wanted - 1)[wanted - 1]
+        positions = positions[keys[positions] <= bound]
+    high, low = _uuid_words([ids[i] for i in positions])
+    order = positions[np.lexsort((low, high, keys[positions]))][skip:wanted]
+    return order.tolist(), keys[order].tolist()
@@ -0,0 +1,34 @@
+# app/utils/serialization.py
+from typing import Any, Type
+
+from fastapi.responses import JSONResponse, Response
+from pydantic import TypeAdapter
+
+from app.core.config import settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+def default_response_class() -> Type[JSONResponse]:
+    """ORJSONResponse when orjson is installed and enabled, else the stdlib encoder."""
+    if settings.ORJSON_RESPONSES and orjson is not None:
+        from fastapi.responses import ORJSONResponse
+        return ORJSONResponse
+    return JSONResponse
+
+
+def serialize_response(adapter: TypeAdapter, data: Any, status_code: int = 200) -> Response:
+    """
+    Validate `data` against a precompiled TypeAdapter and encode it in one pass.
+
+    FastAPI would otherwise validate the response_model, walk the result with
+    jsonable_encoder and hand it to json.dumps; here pydantic-core does the
+    validation and the JSON encoding itself. ORM objects are read with
+    from_attributes, so relationships the schema needs must already be loaded.
+    Keep response_model on the route so the OpenAPI schema is unchanged.
+    """
+    content = adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+    return Response(content=content, status_code=status_code, media_type="application/json")
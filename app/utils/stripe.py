@@ -1,13 +1,28 @@
 # app/utils/stripe.py
+from __future__ import annotations
+
 from fastapi import HTTPException
-from stripe.error import StripeError, CardError, InvalidRequestError
-import stripe
+from functools import lru_cache
 from app.core.config import settings, ErrorMessage
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, TYPE_CHECKING
 from decimal import Decimal
 from datetime import datetime
 
-stripe.api_key = settings.STRIPE_SECRET_KEY
+if TYPE_CHECKING:
+    import stripe
+
+
+@lru_cache(maxsize=None)
+def _get_stripe():
+    """Import and configure the Stripe SDK on first use.
+
+    The SDK pulls in every API resource module when imported, which is a
+    noticeable share of cold start for a client only the payment endpoints use.
+    """
+    import stripe
+
+    stripe.api_key = settings.STRIPE_SECRET_KEY
+    return stripe
 
 class StripeService:
     @staticmethod
@@ -19,6 +34,7 @@ class StripeService:
         transfer_data: Optional[Dict[str, Any]] = None
     ) -> stripe.PaymentIntent:
         """Create a Stripe PaymentIntent."""
+        stripe = _get_stripe()
         try:
             payment_data = {
                 "amount": int(amount * 100),  # Convert to cents
@@ -34,12 +50,12 @@ class StripeService:
                 payment_data["transfer_data"] = transfer_data
 
             return stripe.PaymentIntent.create(**payment_data)
-        except CardError as e:
+        except stripe.error.CardError as e:
             raise HTTPException(
                 status_code=400,
                 detail=f"Card error: {str(e)}"
             )
-        except StripeError as e:
+        except stripe.error.StripeError as e:
             raise HTTPException(
                 status_code=400,
                 detail=f"{ErrorMessage.STRIPE_ERROR}: {str(e)}"
@@ -52,6 +68,7 @@ class StripeService:
         reason: Optional[str] = None
     ) -> stripe.Refund:
         """Create a refund for a payment."""
+        stripe = _get_stripe()
         try:
             refund_data = {
                 "payment_intent": payment_intent_id,
@@ -60,7 +77,7 @@ class StripeService:
             if amount:
                 refund_data["amount"] = int(amount * 100)
             return stripe.Refund.create(**refund_data)
-        except StripeError as e:
+        except stripe.error.StripeError as e:
             raise HTTPException(
                 status_code=400,
                 detail=f"{ErrorMessage.REFUND_FAILED}: {str(e)}"
@@ -73,6 +90,7 @@ class StripeService:
         webhook_secret: str
     ) -> stripe.Event:
         """Verify Stripe webhook signature."""
+        stripe = _get_stripe()
         try:
             return stripe.Webhook.construct_event(
                 payload,
@@ -100,6 +118,7 @@ class StripeService:
         business_profile: Optional[Dict[str, Any]] = None
     ) -> stripe.Account:
         """Create a Stripe Connect account for caregivers."""
+        stripe = _get_stripe()
         try:
             account_data = {
                 "type": "express",
@@ -116,7 +135,7 @@ class StripeService:
                 account_data["business_profile"] = business_profile
 
             return stripe.Account.create(**account_data)
-        except StripeError as e:
+        except stripe.error.StripeError as e:
             raise HTTPException(
                 status_code=400,
                 detail=f"{ErrorMessage.ACCOUNT_CREATION_FAILED}: {str(e)}"
@@ -130,6 +149,7 @@ class StripeService:
         type: str = "account_onboarding"
     ) -> stripe.AccountLink:
         """Create an account link for Connect onboarding."""
+        stripe = _get_stripe()
         try:
             return stripe.AccountLink.create(
                 account=account_id,
@@ -137,7 +157,7 @@ class StripeService:
                 return_url=return_url,
                 type=type
             )
-        except StripeError as e:
+        except stripe.error.StripeError as e:
             raise HTTPException(
                 status_code=400,
                 detail=f"Failed to create account link: {str(e)}"
@@ -151,6 +171,7 @@ class StripeService:
         transfer_group: Optional[str] = None
     ) -> stripe.Transfer:
         """Create a transfer to a connected account."""
+        stripe = _get_stripe()
         try:
             transfer_data = {
                 "amount": int(amount * 100),
@@ -162,7 +183,7 @@ class StripeService:
                 transfer_data["transfer_group"] = transfer_group
 
             return stripe.Transfer.create(**transfer_data)
-        except StripeError as e:
+        except stripe.error.StripeError as e:
             raise HTTPException(
                 status_code=400,
                 detail=f"{ErrorMessage.PAYOUT_FAILED}: {str(e)}"
@@ -175,6 +196,7 @@ class StripeService:
         type: Optional[str] = None
     ) -> List[stripe.BalanceTransaction]:
         """Retrieve balance transactions."""
+        stripe = _get_stripe()
         try:
             params = {"limit": limit}
             if starting_after:
@@ -183,7 +205,7 @@ class StripeService:
                 params["type"] = type
 
             return stripe.BalanceTransaction.list(**params)
-        except StripeError as e:
+        except stripe.error.StripeError as e:
             raise HTTPException(
                 status_code=400,
                 detail=f"Failed to retrieve balance transactions: {str(e)}"
@@ -192,9 +214,10 @@ class StripeService:
     @staticmethod
     async def get_payment_method(payment_method_id: str) -> stripe.PaymentMethod:
         """Retrieve a payment method."""
+        stripe = _get_stripe()
         try:
             return stripe.PaymentMethod.retrieve(payment_method_id)
-        except StripeError as e:
+        except stripe.error.StripeError as e:
             raise HTTPException(
                 status_code=400,
                 detail=f"Failed to retrieve payment method: {str(e)}"
@@ -207,6 +230,7 @@ class StripeService:
         billing_details: Optional[Dict[str, Any]] = None
     ) -> stripe.PaymentMethod:
         """Create a payment method."""
+        stripe = _get_stripe()
         try:
             payment_method_data = {
                 "type": type,
@@ -217,7 +241,7 @@ class StripeService:
                 payment_method_data["billing_details"] = billing_details
 
             return stripe.PaymentMethod.create(**payment_method_data)
-        except StripeError as e:
+        except stripe.error.StripeError as e:
             raise HTTPException(
                 status_code=400,
                 detail=f"Failed to create payment method: {str(e)}"
@@ -229,23 +253,25 @@ class StripeService:
         amounts: List[int]
     ) -> Any:
         """Verify bank account microdeposits for Connect accounts."""
+        stripe = _get_stripe()
         try:
             return stripe.Account.verify_external_account(
                 account_id,
                 amounts=amounts
             )
-        except StripeError as e:
+        except stripe.error.StripeError as e:
             raise HTTPException(
                 status_code=400,
                 detail=f"Failed to verify microdeposits: {str(e)}"
             )
 
     @staticmethod
-    def format_stripe_error(error: StripeError) -> str:
+    def format_stripe_error(error: stripe.error.StripeError) -> str:
         """Format Stripe error messages for consistent error handling."""
-        if isinstance(error, CardError):
+        stripe = _get_stripe()
+        if isinstance(error, stripe.error.CardError):
             return f"Card error: {error.error.message}"
-        elif isinstance(error, InvalidRequestError):
+        elif isinstance(error, stripe.error.InvalidRequestError):
             return f"Invalid request: {error.error.message}"
         else:
             return str(error)
\ No newline at end of file
@@ -0,0 +1,118 @@
+# benchmarks/bench_access_log.py
+"""
+Per-request overhead of request logging middleware.
+
+Drives a trivial Starlette app directly over ASGI (no server, no sockets) with:
+no middleware, the old BaseHTTPMiddleware `log_requests` (7 INFO lines and an
+indented JSON dump of the headers), and AccessLogMiddleware. Log records are
+formatted and written to os.devnull so formatting cost is included:
+
+    python -m benchmarks.bench_access_log --requests 20000
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import time
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from app.core.middleware import AccessLogMiddleware
+from benchmarks.common import print_table
+
+logger = logging.getLogger("bench.legacy")
+
+
+async def legacy_log_requests(request, call_next):
+    """The log_requests middleware that used to live in app/main.py."""
+    request_id = str(time.time())
+    logger.info(f"=== Incoming Request [{request_id}] ===")
+    logger.info(f"Method: {request.method}")
+    logger.info(f"URL: {request.url}")
+    logger.info(f"Client Host: {request.client.host}")
+    safe_headers = dict(request.headers)
+    if 'authorization' in safe_headers:
+        safe_headers['authorization'] = 'Bearer <token omitted>'
+    logger.info(f"Headers: {json.dumps(safe_headers, indent=2)}")
+    start_time = time.time()
+    try:
+        response = await call_next(request)
+        process_time = time.time() - start_time
+        logger.info(f"=== Response [{request_id}] ===")
+        logger.info(f"Status Code: {response.status_code}")
+        logger.info(f"Process Time: {process_time:.3f}s")
+        return response
+    finally:
+        logger.info(f"=== Request Complete [{request_id}] ===")
+
+
+async def endpoint(request):
+    return JSONResponse({"status": "ok"})
+
+
+def build_app(middleware):
+    return Starlette(routes=[Route("/ping", endpoint)], middleware=middleware)
+
+
+SCOPE_HEADERS = [
+    (b"host", b"api.petbnb.test"),
+    (b"user-agent", b"PetBnB/2.3 (iOS 17.4)"),
+    (b"accept", b"application/json"),
+    (b"accept-encoding", b"gzip, br"),
+    (b"authorization", b"Bearer eyJhbGciOiJIUzI1NiJ9.e30.signature"),
+    (b"x-platform", b"ios"),
+]
+
+
+async def drive(app, requests: int) -> float:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+            "method": "GET", "scheme": "http", "path": "/ping", "raw_path": b"/ping",
+            "query_string": b"", "root_path": "", "headers": list(SCOPE_HEADERS),
+            "client": ("10.0.0.1", 51000), "server": ("api.petbnb.test", 80),
+        }
+        await app(scope, receive, send)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    handler = logging.StreamHandler(open(os.devnull, "w"))
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    logging.basicConfig(level=logging.INFO, handlers=[handler])
+
+    variants = [
+        ("no middleware", []),
+        ("legacy log_requests", [Middleware(BaseHTTPMiddleware, dispatch=legacy_log_requests)]),
+        ("AccessLogMiddleware", [Middleware(AccessLogMiddleware)]),
+        ("AccessLogMiddleware 10% sample", [Middleware(AccessLogMiddleware, sample_rate=0.1)]),
+    ]
+    results = {}
+    for label, middleware in variants:
+        app = build_app(middleware)
+        asyncio.run(drive(app, 500))  # warm up
+        results[label] = asyncio.run(drive(app, args.requests)) / args.requests * 1e6
+
+    baseline = results["no middleware"]
+    rows = [(label, f"{us:.1f}", f"{us - baseline:.1f}") for label, us in results.items()]
+    print_table(f"Per-request cost over {args.requests} requests", ("variant", "us/request", "overhead us"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+# benchmarks/bench_compression.py
+"""
+Bytes on the wire against added latency for the main list endpoints.
+
+Each endpoint is requested with Accept-Encoding: identity, gzip and br against
+a running server (BENCH_BASE_URL, BENCH_TOKEN). urllib does not decode
+responses, so the byte counts are what actually crossed the network:
+
+    python -m benchmarks.bench_compression --requests 50
+    python -m benchmarks.bench_compression --path /api/v1/messages/chat-rooms/<id>/messages/
+
+`--levels` instead captures one identity response per endpoint and
+times gzip levels 1-9 and brotli qualities 1-11 on it locally, to pick
+COMPRESSION_GZIP_LEVEL / COMPRESSION_BROTLI_QUALITY for the CPU budget:
+
+    python -m benchmarks.bench_compression --levels
+"""
+import argparse
+import gzip
+import statistics
+import time
+import urllib.request
+from typing import Dict, List
+
+from benchmarks.common import BASE_URL, TOKEN, dump_json, http_get, percentile, print_table
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ENDPOINTS = [
+    "/api/v1/caregivers/search?limit=100",
+    "/api/v1/bookings/?limit=100",
+    "/api/v1/payments/history?limit=100",
+    "/api/v1/pets/",
+]
+
+
+def fetch_identity(path: str) -> bytes:
+    headers = {"Accept-Encoding": "identity"}
+    if TOKEN:
+        headers["Authorization"] = f"Bearer {TOKEN}"
+    with urllib.request.urlopen(urllib.request.Request(f"{BASE_URL}{path}", headers=headers)) as response:
+        return response.read()
+
+
+def time_codec(fn, body: bytes, repeat: int = 20) -> float:
+    """Best-of-`repeat` milliseconds for one compression of `body`."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(body)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def wire(args, endpoints: List[str]) -> List[Dict]:
+    encodings = ["identity", "gzip"] + (["br"] if args.brotli else [])
+    results = []
+    for path in endpoints:
+        for encoding in encodings:
+            latencies, sizes, statuses = [], [], set()
+            for _ in range(args.requests):
+                status, seconds, size = http_get(path, {"Accept-Encoding": encoding})
+                statuses.add(status)
+                latencies.append(seconds * 1000)
+                sizes.append(size)
+            results.append({
+                "path": path,
+                "encoding": encoding,
+                "status": sorted(statuses),
+                "bytes": int(statistics.median(sizes)),
+                "p50_ms": percentile(latencies, 50),
+                "p95_ms": percentile(latencies, 95),
+            })
+
+    print_table(
+        f"{BASE_URL}: {args.requests} requests per row",
+        ["endpoint", "encoding", "status", "bytes", "p50 ms", "p95 ms"],
+        [
+            [r["path"], r["encoding"], ",".join(map(str, r["status"])), r["bytes"],
+             f"{r['p50_ms']:.1f}", f"{r['p95_ms']:.1f}"]
+            for r in results
+        ],
+    )
+    return results
+
+
+def levels(endpoints: List[str]) -> List[Dict]:
+    results = []
+    for path in endpoints:
+        body = fetch_identity(path)
+        codecs = [(f"gzip-{level}", lambda b, level=level: gzip.compress(b, compresslevel=level, mtime=0))
+                  for level in range(1, 10)]
+        if brotli is not None:
+            codecs += [(f"br-{quality}", lambda b, quality=quality: brotli.compress(b, quality=quality))
+                       for quality in range(1, 12)]
+        for name, fn in codecs:
+            size = len(fn(body))
+            results.append({
+                "path": path,
+                "codec": name,
+                "raw_bytes": len(body),
+                "bytes": size,
+                "ratio": len(body) / size if size else 0.0,
+                "ms": time_codec(fn, body),
+            })
+
+    print_table(
+        "local compression cost per response body",
+        ["endpoint", "codec", "raw", "compressed", "ratio", "ms"],
+        [
+            [r["path"], r["codec"], r["raw_bytes"], r["bytes"], f"{r['ratio']:.1f}x", f"{r['ms']:.3f}"]
+            for r in results
+        ],
+    )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--levels", action="store_true", help="time compression levels locally instead")
+    parser.add_argument("--no-brotli", dest="brotli", action="store_false")
+    parser.add_argument("--path", action="append", default=[],
+                        help="extra endpoint to include, e.g. a chat room's message history")
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args()
+
+    endpoints = ENDPOINTS + args.path
+    results = levels(endpoints) if args.levels else wire(args, endpoints)
+    if args.json:
+        dump_json(args.json, {"base_url": BASE_URL, "results": results})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+# benchmarks/bench_db_latency.py
+"""
+Mixed-load latency benchmark for the async database mode.
+
+Against a running server, fires DB-backed list endpoints and the DB-free
+/health check concurrently and reports p50/p99 per endpoint. Run it once with
+DATABASE_ASYNC_ENABLED=false and once with it set to true (restart uvicorn in
+between, same worker count):
+
+    BENCH_TOKEN=<jwt> python -m benchmarks.bench_db_latency --label sync
+    BENCH_TOKEN=<jwt> python -m benchmarks.bench_db_latency --label async
+
+Both of those runs already go through `run_db`, so they compare the threadpool
+with AsyncSession, not against the code before it. `--inprocess` measures
+that before/after: it serves a small app in this process whose handlers run
+the same query three ways — a sync Session inline in an `async def` handler
+(the original pattern, blocking the loop), `run_db` with a sync Session
+(threadpool), and `run_db` with an AsyncSession — and loads each one
+alongside /health. Talks to the database directly (BENCH_DATABASE_URL,
+default: the app's DATABASE_URL):
+
+    python -m benchmarks.bench_db_latency --inprocess --query-ms 20
+
+With blocking queries on the loop, /health p99 tracks the slowest list query;
+off the loop it should stay close to its idle latency.
+"""
+import argparse
+import os
+import random
+import socket
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from benchmarks.common import dump_json, http_get, percentile, print_table
+
+MIXED_LOAD = [
+    ("/health", 4),
+    ("/api/v1/caregivers/search?limit=50", 3),
+    ("/api/v1/bookings/?limit=50", 2),
+    ("/api/v1/payments/history?limit=50", 1),
+]
+
+INPROCESS_MODES = ("inline", "threadpool", "async")
+
+
+def run(
+    requests: int,
+    concurrency: int,
+    load=MIXED_LOAD,
+    base_url: Optional[str] = None,
+) -> Dict[str, List[float]]:
+    paths = [path for path, weight in load for _ in range(weight)]
+    plan = [random.choice(paths) for _ in range(requests)]
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+
+    def fire(path: str) -> None:
+        status, seconds, _ = http_get(path, base_url=base_url)
+        if status >= 400:
+            errors[path] += 1
+        latencies[path].append(seconds * 1000)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(fire, plan))
+
+    for path, count in errors.items():
+        print(f"warning: {count} error responses from {path}")
+    return latencies
+
+
+def build_app(database_url: str, query_ms: float):
+    """/health plus one list handler per INPROCESS_MODES entry, all running the same query."""
+    from fastapi import FastAPI
+    from sqlalchemy import create_engine, func, select
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from sqlalchemy.orm import Session, sessionmaker
+
+    import app.models  # noqa: F401  configure every mapper CaregiverProfile relates to
+    from app.core.database import run_db, to_async_database_url
+    from app.models.caregiver import CaregiverProfile
+
+    sync_factory = sessionmaker(bind=create_engine(database_url, pool_size=20, max_overflow=20))
+    async_factory = async_sessionmaker(
+        bind=create_async_engine(to_async_database_url(database_url), pool_size=20, max_overflow=20),
+        expire_on_commit=False,
+    )
+
+    def _list(session: Session) -> int:
+        # pg_sleep stands in for a slow list query so the three modes differ only in where they wait
+        session.execute(select(func.pg_sleep(query_ms / 1000)))
+        return len(session.query(CaregiverProfile).limit(50).all())
+
+    bench_app = FastAPI()
+
+    @bench_app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+    @bench_app.get("/inline")
+    async def inline():
+        with sync_factory() as session:
+            return {"rows": _list(session)}
+
+    @bench_app.get("/threadpool")
+    async def threadpool():
+        with sync_factory() as session:
+            return {"rows": await run_db(session, _list)}
+
+    @bench_app.get("/async")
+    async def async_session():
+        async with async_factory() as session:
+            return {"rows": await run_db(session, _list)}
+
+    return bench_app
+
+
+def serve(bench_app) -> str:
+    """Start uvicorn for `bench_app` on a free local port in a daemon thread; returns its base URL."""
+    import uvicorn
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(bench_app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return f"http://127.0.0.1:{port}"
+
+
+def run_inprocess(requests: int, concurrency: int, query_ms: float) -> Dict[str, Dict[str, List[float]]]:
+    from app.core.database import SQLALCHEMY_DATABASE_URL
+
+    base_url = serve(build_app(os.getenv("BENCH_DATABASE_URL", SQLALCHEMY_DATABASE_URL), query_ms))
+    results = {}
+    for mode in INPROCESS_MODES:
+        http_get(f"/{mode}", base_url=base_url)  # warm the pool
+        results[mode] = run(requests, concurrency, [("/health", 1), (f"/{mode}", 1)], base_url)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--label", default="run", help="name for this run, e.g. sync or async")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--inprocess", action="store_true",
+                        help="compare inline / threadpool / async handlers in this process")
+    parser.add_argument("--query-ms", type=float, default=20, help="simulated query time for --inprocess")
+    args = parser.parse_args()
+
+    if args.inprocess:
+        results = run_inprocess(args.requests, args.concurrency, args.query_ms)
+        rows = [
+            (mode, path, len(samples), f"{percentile(samples, 50):.1f}", f"{percentile(samples, 99):.1f}")
+            for mode, latencies in results.items()
+            for path, samples in sorted(latencies.items())
+        ]
+        print_table(f"In-process handlers, {args.query_ms:g} ms query (ms)",
+                    ("mode", "endpoint", "n", "p50", "p99"), rows)
+        dump_json("bench_db_latency_inprocess.json", {
+            mode: {path: {"p50": percentile(s, 50), "p99": percentile(s, 99), "n": len(s)}
+                   for path, s in latencies.items()}
+            for mode, latencies in results.items()
+        })
+        return
+
+    latencies = run(args.requests, args.concurrency)
+    rows = [
+        (path, len(samples), f"{percentile(samples, 50):.1f}", f"{percentile(samples, 99):.1f}")
+        for path, samples in sorted(latencies.items())
+    ]
+    print_table(f"Mixed load [{args.label}] latency (ms)", ("endpoint", "n", "p50", "p99"), rows)
+    dump_json(f"bench_db_latency_{args.label}.json", {
+        path: {"p50": percentile(s, 50), "p99": percentile(s, 99), "n": len(s)}
+        for path, s in latencies.items()
+    })
+
+
+if __name__ == "__main__":
+    main()
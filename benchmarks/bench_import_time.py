@@ -0,0 +1,110 @@
+# benchmarks/bench_import_time.py
+"""
+Cold-start import cost of `app.main`, from `python -X importtime`.
+
+Each run spawns a fresh interpreter, so nothing is cached in-process. The
+importtime trace is grouped by top-level package and the biggest cumulative
+entries are listed, which is where stripe / cloudinary / fastapi_mail showed up
+before they were made lazy:
+
+    python -m benchmarks.bench_import_time --runs 5
+    python -m benchmarks.bench_import_time --module app.main --top 30 --json bench_import.json
+"""
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from benchmarks.common import dump_json, print_table
+
+# "import time: self [us] | cumulative | imported package"
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def run_once(module: str) -> Tuple[float, List[Tuple[str, int, int, int]]]:
+    """Import `module` in a fresh interpreter. Returns (wall seconds, parsed trace)."""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    elapsed = time.perf_counter() - start
+    if proc.returncode != 0:
+        sys.stderr.write(proc.stderr[-2000:])
+        raise SystemExit(f"importing {module} failed")
+
+    entries = []
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return elapsed, entries
+
+
+def by_package(entries: List[Tuple[str, int, int, int]]) -> Dict[str, int]:
+    """Sum self time per top-level package."""
+    totals: Dict[str, int] = defaultdict(int)
+    for name, self_us, _, _ in entries:
+        totals[name.split(".")[0]] += self_us
+    return totals
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args()
+
+    walls: List[float] = []
+    package_runs: Dict[str, List[int]] = defaultdict(list)
+    last_entries: List[Tuple[str, int, int, int]] = []
+    for _ in range(args.runs):
+        wall, entries = run_once(args.module)
+        walls.append(wall)
+        for package, self_us in by_package(entries).items():
+            package_runs[package].append(self_us)
+        last_entries = entries
+
+    packages = sorted(
+        ((name, statistics.median(samples)) for name, samples in package_runs.items()),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+    total_us = sum(us for _, us in packages) or 1
+    print_table(
+        f"import {args.module}: self time by top-level package (median of {args.runs} runs)",
+        ["package", "ms", "share"],
+        [[name, f"{us / 1000:.1f}", f"{us / total_us:.0%}"] for name, us in packages[:args.top]],
+    )
+
+    heaviest = sorted(last_entries, key=lambda entry: entry[2], reverse=True)[:args.top]
+    print_table(
+        "largest cumulative imports (last run)",
+        ["module", "cumulative ms", "self ms"],
+        [[name, f"{cum / 1000:.1f}", f"{own / 1000:.1f}"] for name, own, cum, _ in heaviest],
+    )
+
+    print(
+        f"\nwall time per interpreter start + import: median {statistics.median(walls) * 1000:.0f} ms, "
+        f"min {min(walls) * 1000:.0f} ms, max {max(walls) * 1000:.0f} ms"
+    )
+
+    if args.json:
+        dump_json(args.json, {
+            "module": args.module,
+            "runs": args.runs,
+            "wall_seconds": walls,
+            "packages_ms": {name: us / 1000 for name, us in packages},
+        })
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+# benchmarks/bench_jwt_decode.py
+"""
+Micro-benchmark of the JWT decode hot path with and without the verified-token
+cache. No database or server needed:
+
+    python -m benchmarks.bench_jwt_decode --iterations 50000
+"""
+import argparse
+import timeit
+from datetime import timedelta
+
+from app.core import security
+from benchmarks.common import print_table
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=50000)
+    args = parser.parse_args()
+
+    token = security.create_access_token(
+        {"sub": "6f1c1f8e-0d5e-4d8e-9a61-3f2b7f0c9a10", "email": "bench@example.com"},
+        expires_delta=timedelta(hours=1)
+    )
+
+    def uncached():
+        security.token_cache.clear()
+        security.decode_jwt_token(token)
+
+    def cached():
+        security.decode_jwt_token(token)
+
+    security.decode_jwt_token(token)  # warm the cache
+    rows = []
+    for label, fn in (("no cache (jose verify)", uncached), ("cached", cached)):
+        seconds = timeit.timeit(fn, number=args.iterations)
+        rows.append((label, args.iterations, f"{seconds / args.iterations * 1e6:.2f}", f"{args.iterations / seconds:,.0f}"))
+
+    print_table("decode_jwt_token", ("path", "calls", "us/call", "calls/s"), rows)
+
+
+if __name__ == "__main__":
+    main()
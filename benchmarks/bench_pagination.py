@@ -0,0 +1,183 @@
+# benchmarks/bench_pagination.py
+"""
+OFFSET vs keyset (cursor) pagination at increasing page depth.
+
+Seeds one synthetic payer with enough payments for 10,000 pages (the payment
+history endpoint's query), then times `keyset_paginate` both ways for pages
+1 .. 10,000. OFFSET has to read and discard every earlier row; the cursor
+seeks straight into ix_payments_payer_id_created_at_id, so its latency
+should stay flat. Talks to the database directly (BENCH_DATABASE_URL,
+default: the app's DATABASE_URL); use a scratch database:
+
+    python -m benchmarks.bench_pagination --seed
+    python -m benchmarks.bench_pagination --pages 1 100 1000 10000
+    python -m benchmarks.bench_pagination --cleanup
+
+With --endpoint it also times GET /api/v1/payments/history on a running
+server (BENCH_BASE_URL) pointed at the same database, as the payer, so the
+per-request work around the page (the count on offset pages, serialization)
+is measured too. The token is signed with this process's SECRET_KEY, which
+must match the server's.
+"""
+import argparse
+import os
+import statistics
+import time
+from typing import Dict, List
+
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.orm import Session
+
+from app.core.database import SQLALCHEMY_DATABASE_URL
+from app.core.security import create_access_token
+import app.models  # noqa: F401  configure every mapper Payment relates to
+from app.models.payment import Payment
+from app.utils.pagination import encode_cursor, keyset_paginate
+from benchmarks.common import dump_json, http_get, print_table
+
+BENCH_EMAIL = "bench-payer@example.invalid"
+HISTORY_PATH = "/api/v1/payments/history"
+
+SEED_SQL = """
+INSERT INTO payments (id, payer_id, recipient_id, amount, currency, payment_type, status,
+                      created_at, updated_at)
+SELECT gen_random_uuid(), :payer_id, :payer_id, 50 + (g % 200), 'MYR', 'BOOKING', 'COMPLETED',
+       timestamp '2020-01-01' + g * interval '1 minute', now()
+FROM generate_series(:start, :stop) AS g
+"""
+
+
+def bench_user_id(conn):
+    return conn.execute(text("SELECT id FROM users WHERE email = :email"), {"email": BENCH_EMAIL}).scalar()
+
+
+def seed(engine, rows: int, batch_size: int = 50000) -> None:
+    with engine.begin() as conn:
+        payer_id = bench_user_id(conn)
+        if payer_id is None:
+            payer_id = conn.execute(text(
+                "INSERT INTO users (id, email, hashed_password, full_name, user_type, is_active, "
+                "is_verified, is_admin, created_at, updated_at) VALUES (gen_random_uuid(), :email, "
+                "'x', 'Bench Payer', 'OWNER', true, true, false, now(), now()) RETURNING id"
+            ), {"email": BENCH_EMAIL}).scalar()
+        for start in range(1, rows + 1, batch_size):
+            conn.execute(text(SEED_SQL), {
+                "payer_id": payer_id, "start": start, "stop": min(start + batch_size - 1, rows)
+            })
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("ANALYZE payments"))
+    print(f"seeded {rows} payments")
+
+
+def cleanup(engine) -> None:
+    with engine.begin() as conn:
+        payer_id = bench_user_id(conn)
+        if payer_id is None:
+            return
+        deleted = conn.execute(text("DELETE FROM payments WHERE payer_id = :id"), {"id": payer_id}).rowcount
+        conn.execute(text("DELETE FROM users WHERE id = :id"), {"id": payer_id})
+    print(f"removed {deleted} benchmark payments")
+
+
+def timed(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def timed_get(path: str, headers: Dict[str, str], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        status, seconds, _ = http_get(path, headers)
+        if status != 200:
+            raise SystemExit(f"GET {path} returned {status}")
+        samples.append(seconds * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed", action="store_true", help="insert enough payments for the deepest page")
+    parser.add_argument("--cleanup", action="store_true", help="delete the synthetic payer and exit")
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 10, 100, 1000, 10000])
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--endpoint", action="store_true", help="also time the history endpoint over HTTP")
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args()
+
+    engine = create_engine(os.getenv("BENCH_DATABASE_URL", SQLALCHEMY_DATABASE_URL))
+    if args.cleanup:
+        cleanup(engine)
+        return
+    if args.seed:
+        seed(engine, max(args.pages) * args.limit)
+
+    results: List[Dict] = []
+    with Session(engine) as session:
+        payer_id = bench_user_id(session.connection())
+        if payer_id is None:
+            raise SystemExit("no benchmark data; run with --seed first")
+        base = session.query(Payment).filter(
+            (Payment.payer_id == payer_id) | (Payment.recipient_id == payer_id)
+        )
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': str(payer_id)})}"}
+
+        for page in args.pages:
+            skip = (page - 1) * args.limit
+            # The cursor a client would hold after reading the previous page (not timed)
+            cursor = None
+            if skip:
+                previous = session.execute(
+                    select(Payment.created_at, Payment.id)
+                    .where(Payment.payer_id == payer_id)
+                    .order_by(Payment.created_at.desc(), Payment.id.desc())
+                    .offset(skip - 1).limit(1)
+                ).first()
+                if previous is None:
+                    print(f"page {page}: not enough rows, skipped")
+                    continue
+                cursor = encode_cursor(*previous)
+
+            offset_ms = timed(
+                lambda: keyset_paginate(base, Payment.created_at, Payment.id, None, skip, args.limit),
+                args.repeat,
+            )
+            keyset_ms = timed(
+                lambda: keyset_paginate(base, Payment.created_at, Payment.id, cursor, 0, args.limit),
+                args.repeat,
+            )
+            session.expunge_all()
+            result = {"page": page, "offset_ms": offset_ms, "keyset_ms": keyset_ms}
+
+            if args.endpoint:
+                # Offset pages still count the payer's rows; cursor pages do not
+                result["endpoint_offset_ms"] = timed_get(
+                    f"{HISTORY_PATH}?skip={skip}&limit={args.limit}", headers, args.repeat
+                )
+                cursor_query = f"&cursor={cursor}" if cursor else ""
+                result["endpoint_cursor_ms"] = timed_get(
+                    f"{HISTORY_PATH}?limit={args.limit}{cursor_query}", headers, args.repeat
+                )
+            results.append(result)
+
+    print_table(
+        f"payment history, {args.limit} rows per page (median of {args.repeat})",
+        ["page", "offset ms", "cursor ms"],
+        [[r["page"], f"{r['offset_ms']:.2f}", f"{r['keyset_ms']:.2f}"] for r in results],
+    )
+    if args.endpoint:
+        print_table(
+            f"GET {HISTORY_PATH}, {args.limit} rows per page (median of {args.repeat})",
+            ["page", "offset ms", "cursor ms"],
+            [[r["page"], f"{r['endpoint_offset_ms']:.2f}", f"{r['endpoint_cursor_ms']:.2f}"] for r in results],
+        )
+    if args.json:
+        dump_json(args.json, {"limit": args.limit, "results": results})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# benchmarks/bench_password_hashing.py
+"""
+Login throughput per core for the bounded password-hashing pool.
+
+Measures bcrypt verify throughput through app.core.security's executor at
+several pool sizes, plus how many requests are shed with 429 when a burst
+exceeds PASSWORD_HASH_MAX_PENDING. Needs the app's environment (.env) only for
+settings; no database or server is touched:
+
+    python -m benchmarks.bench_password_hashing --burst 200
+"""
+import argparse
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import HTTPException
+
+from app.core import security
+from benchmarks.common import print_table
+
+
+async def burst(count: int, hashed: str) -> tuple:
+    """Fire `count` verifications at once; return (ok, rejected, seconds)."""
+    async def one():
+        try:
+            await security.verify_password_async("correct horse battery", hashed)
+            return True
+        except HTTPException as e:
+            if e.status_code != 429:
+                raise
+            return False
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(one() for _ in range(count)))
+    return sum(results), count - sum(results), time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--burst", type=int, default=200, help="concurrent logins per run")
+    args = parser.parse_args()
+
+    hashed = security.get_password_hash("correct horse battery")
+    cores = os.cpu_count() or 1
+
+    start = time.perf_counter()
+    for _ in range(10):
+        security.verify_password("correct horse battery", hashed)
+    single = 10 / (time.perf_counter() - start)
+
+    rows = [("inline (1 thread)", "-", f"{single:.1f}", f"{single:.1f}", 0)]
+    for workers in sorted({1, 2, cores, cores * 2}):
+        security._password_executor = ThreadPoolExecutor(max_workers=workers)
+        ok, rejected, seconds = asyncio.run(burst(args.burst, hashed))
+        per_second = ok / seconds if seconds else 0.0
+        rows.append((f"pool={workers}", args.burst, f"{per_second:.1f}", f"{per_second / min(workers, cores):.1f}", rejected))
+
+    print_table(
+        f"bcrypt verify throughput ({cores} cores, max pending {security.settings.PASSWORD_HASH_MAX_PENDING})",
+        ("mode", "burst", "logins/s", "logins/s/core", "rejected (429)"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
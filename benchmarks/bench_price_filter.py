@@ -0,0 +1,96 @@
+# benchmarks/bench_price_filter.py
+"""
+EXPLAIN ANALYZE of caregiver price filtering and cheapest-first pages: the
+old OR over the three price columns (and ORDER BY the service's price
+column) against caregiver_service_prices (migration a8d3f6b2c9e4), whose
+(service_type, price) index answers both as a range scan.
+
+Uses the synthetic caregivers of bench_search_explain; the
+caregiver_service_prices trigger fills the table as they are inserted:
+
+    python -m benchmarks.bench_search_explain --seed 100000
+    python -m benchmarks.bench_price_filter
+    python -m benchmarks.bench_search_explain --cleanup
+"""
+import argparse
+import os
+from typing import List
+
+from sqlalchemy import create_engine, func, or_, select
+
+from app.core.database import SQLALCHEMY_DATABASE_URL
+from app.models.caregiver import CaregiverProfile
+from app.models.caregiver_service_price import CaregiverServicePrice
+from app.utils.caregiver_search import SERVICE_PRICE_COLUMNS, search_filters
+from benchmarks.bench_search_explain import explain
+from benchmarks.common import dump_json, print_table
+
+SCENARIOS = [
+    ("BOARDING", 40.0),
+    ("DAYCARE", 25.0),
+    ("WALKING", 15.0),
+]
+
+
+def legacy_price(max_price: float):
+    return or_(
+        CaregiverProfile.price_per_night <= max_price,
+        CaregiverProfile.price_per_day <= max_price,
+        CaregiverProfile.price_per_walk <= max_price
+    )
+
+
+def statements(service: str, max_price: float, limit: int) -> List[tuple]:
+    tags = search_filters(service)
+    legacy = select(CaregiverProfile.id).where(*tags, legacy_price(max_price))
+    indexed = select(CaregiverProfile.id).where(*search_filters(service, max_price=max_price))
+    by_price = (
+        select(CaregiverProfile.id)
+        .join(CaregiverServicePrice, CaregiverServicePrice.caregiver_id == CaregiverProfile.id)
+        .where(CaregiverServicePrice.service_type == service, CaregiverServicePrice.is_available == True, *tags)
+    )
+    column = SERVICE_PRICE_COLUMNS[service]
+    return [
+        ("filter page", "OR columns", legacy.limit(limit)),
+        ("filter page", "service prices", indexed.limit(limit)),
+        ("filter count", "OR columns", select(func.count()).select_from(legacy.subquery())),
+        ("filter count", "service prices", select(func.count()).select_from(indexed.subquery())),
+        ("cheapest first", "price column",
+         select(CaregiverProfile.id).where(*tags, column.isnot(None))
+         .order_by(column, CaregiverProfile.id).limit(limit)),
+        ("cheapest first", "service prices",
+         by_price.order_by(CaregiverServicePrice.price, CaregiverServicePrice.caregiver_id).limit(limit)),
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args()
+
+    engine = create_engine(os.getenv("BENCH_DATABASE_URL", SQLALCHEMY_DATABASE_URL))
+    results = []
+    with engine.connect() as conn:
+        total = conn.execute(select(func.count(CaregiverProfile.id))).scalar()
+        for service, max_price in SCENARIOS:
+            for shape, style, stmt in statements(service, max_price, args.limit):
+                results.append({"service": service, "max_price": max_price, "shape": shape,
+                                "style": style, **explain(conn, stmt)})
+                conn.rollback()
+
+    print_table(
+        f"caregiver price filtering ({total} caregiver_profiles rows)",
+        ["service", "max", "query", "source", "ms", "buffers", "plan nodes", "indexes"],
+        [
+            [r["service"], r["max_price"], r["shape"], r["style"], f"{r['execution_ms']:.2f}", r["buffers"],
+             " ".join(r["nodes"]), " ".join(r["indexes"]) or "-"]
+            for r in results
+        ],
+    )
+    if args.json:
+        dump_json(args.json, {"rows": total, "results": results})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+# benchmarks/bench_ranking.py
+"""
+Ranking stage of caregiver search (app/utils/ranking.py) on synthetic
+candidate sets, no database needed.
+
+For each candidate count and sort, times sort_keys() + rank_page() for the
+first page and for a cursor page deep into the results. For comparison it
+also times candidate_matrix(), which turns DB rows into the float matrix,
+and a per-row Python scorer that computes the same relevance score.
+
+    python -m benchmarks.bench_ranking --sizes 5000 50000 --repeat 20
+"""
+import argparse
+import math
+import statistics
+import time
+import uuid
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from app.utils.ranking import (
+    EXPERIENCE_SCALE_YEARS, RATING_PRIOR_FALLBACK, RATING_PRIOR_REVIEWS, RECENCY_HALF_LIFE_DAYS, WEIGHTS,
+    candidate_matrix, rank_page, sort_keys,
+)
+from benchmarks.common import dump_json, print_table
+
+RADIUS_KM = 25.0
+
+
+def fake_rows(count: int, seed: int = 1) -> List[tuple]:
+    """Rows shaped like the candidate SELECT: id, price, rating, reviews, years, created epoch, distance, text rank."""
+    rng = np.random.default_rng(seed)
+    now = time.time()
+    prices = rng.uniform(15, 250, count).round()
+    prices[rng.random(count) < 0.1] = np.nan  # service not offered
+    columns = [
+        prices,
+        rng.uniform(0, 5, count).round(1),
+        rng.integers(0, 400, count),
+        rng.integers(0, 25, count),
+        now - rng.uniform(0, 3 * 365 * 86400, count),
+        rng.uniform(0, RADIUS_KM, count),
+        rng.uniform(0, 0.5, count),
+    ]
+    return [
+        (uuid.uuid4(), *(None if isinstance(v, float) and math.isnan(v) else v for v in values))
+        for values in zip(*(c.tolist() for c in columns))
+    ]
+
+
+def python_relevance(rows: List[tuple], now: float) -> List[float]:
+    """The relevance score one row at a time, as a plain loop would do it."""
+    total = sum(r[3] or 0 for r in rows)
+    prior = sum((r[2] or 0) * (r[3] or 0) for r in rows) / total if total else RATING_PRIOR_FALLBACK
+    prices = [r[1] for r in rows if r[1] is not None]
+    low, high = min(prices), max(prices)
+    scores = []
+    for _, price, rating, reviews, years, created, distance, text in rows:
+        price_fit = 1.0 - (price - low) / (high - low) if price is not None else 0.0
+        bayes = (RATING_PRIOR_REVIEWS * prior + (rating or 0) * (reviews or 0)) / (RATING_PRIOR_REVIEWS + (reviews or 0))
+        experience = 1.0 - math.exp(-(years or 0) / EXPERIENCE_SCALE_YEARS)
+        recency = 2 ** (-max(0.0, now // 86400 - created // 86400) / RECENCY_HALF_LIFE_DAYS)
+        near = max(0.0, min(1.0, 1.0 - distance / RADIUS_KM)) if distance is not None else 0.0
+        scores.append(
+            WEIGHTS["price"] * price_fit + WEIGHTS["rating"] * bayes / 5.0
+            + WEIGHTS["experience"] * experience + WEIGHTS["recency"] * recency
+            + WEIGHTS["distance"] * near + WEIGHTS["text"] * (text or 0.0)
+        )
+    return sorted(scores, reverse=True)[:20]
+
+
+def timed(fn: Callable, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args()
+
+    results: List[Dict] = []
+    for size in args.sizes:
+        rows = fake_rows(size)
+        ids, matrix = candidate_matrix(rows)
+        now = time.time()
+        results.append({"candidates": size, "stage": "rows -> matrix",
+                        "ms": timed(lambda: candidate_matrix(rows), args.repeat)})
+        results.append({"candidates": size, "stage": "python relevance",
+                        "ms": timed(lambda: python_relevance(rows, now), max(1, args.repeat // 4))})
+
+        for sort in ("relevance", "price", "rating"):
+            def first_page():
+                keys = sort_keys(matrix, sort, radius_km=RADIUS_KM, now=now)
+                return rank_page(ids, keys, None, 0, args.limit)
+
+            # Cursor of a page ~1000 rows in (not timed)
+            keys = sort_keys(matrix, sort, radius_km=RADIUS_KM, now=now)
+            positions, page_keys = rank_page(ids, keys, None, min(1000, size // 2), args.limit)
+            after = (page_keys[-1], ids[positions[-1]])
+
+            def cursor_page():
+                keys = sort_keys(matrix, sort, radius_km=RADIUS_KM, now=now)
+                return rank_page(ids, keys, after, 0, args.limit)
+
+            results.append({"candidates": size, "stage": f"{sort} page 1", "ms": timed(first_page, args.repeat)})
+            results.append({"candidates": size, "stage": f"{sort} cursor page", "ms": timed(cursor_page, args.repeat)})
+
+    print_table(
+        f"caregiver ranking, {args.limit} per page (median ms)",
+        ["candidates", "stage", "ms"],
+        [[r["candidates"], r["stage"], f"{r['ms']:.2f}"] for r in results],
+    )
+    if args.json:
+        dump_json(args.json, {"limit": args.limit, "results": results})
+
+
+if __name__ == "__main__":
+    main()
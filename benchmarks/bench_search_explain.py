@@ -0,0 +1,166 @@
+# benchmarks/bench_search_explain.py
+"""
+EXPLAIN ANALYZE of caregiver search predicates: the old `value = ANY(column)`
+filters against the `column @> ARRAY[value]` filters that the partial GIN
+indexes (migration b7d41c9e2a15) can answer.
+
+Talks to the database directly (BENCH_DATABASE_URL, default: the app's
+DATABASE_URL). `--seed` adds synthetic caregivers whose users have
+bench-caregiver-* emails, and `--cleanup` removes them again. Run it against a
+scratch database:
+
+    python -m benchmarks.bench_search_explain --seed 100000
+    python -m benchmarks.bench_search_explain
+    python -m benchmarks.bench_search_explain --cleanup
+"""
+import argparse
+import os
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import String, cast, create_engine, func, or_, select, text
+
+from app.core.database import SQLALCHEMY_DATABASE_URL
+from app.models.caregiver import CaregiverProfile
+from app.utils.caregiver_search import search_filters
+from benchmarks.common import dump_json, print_table
+
+SCENARIOS = [
+    {"service_type": "BOARDING"},
+    {"service_type": "WALKING", "pet_type": "cat"},
+    {"pet_type": "bird", "pet_size": "large"},
+    {"service_type": "DAYCARE", "pet_type": "dog", "pet_size": "small", "max_price": 40},
+]
+
+SEED_SQL = """
+WITH new_users AS (
+    INSERT INTO users (id, email, hashed_password, full_name, user_type, is_active, is_verified,
+                       is_admin, created_at, updated_at)
+    SELECT gen_random_uuid(), 'bench-caregiver-' || g || '-' || :batch || '@example.invalid', 'x',
+           'Bench Caregiver ' || g, 'CAREGIVER', true, true, false, now(), now()
+    FROM generate_series(1, :count) AS g
+    RETURNING id, email
+)
+INSERT INTO caregiver_profiles (
+    id, user_id, bio, years_of_experience, services_offered, accepted_pet_types,
+    preferred_pet_size, price_per_night, price_per_day, price_per_walk, maximum_pets,
+    is_available, rating, total_reviews, created_at, updated_at
+)
+SELECT gen_random_uuid(), u.id, 'Synthetic caregiver for search benchmarks', 1 + (h & 15),
+       ARRAY(SELECT s FROM unnest(ARRAY['BOARDING', 'DAYCARE', 'WALKING']) AS s
+             WHERE (hashtext(s || u.email) & 7) < 3)::varchar(50)[],
+       ARRAY(SELECT s FROM unnest(ARRAY['dog', 'cat', 'bird', 'fish', 'other']) AS s
+             WHERE (hashtext(s || u.email) & 7) < 2)::varchar(50)[],
+       ARRAY(SELECT s FROM unnest(ARRAY['small', 'medium', 'large']) AS s
+             WHERE (hashtext(s || u.email) & 7) < 4)::varchar(50)[],
+       30 + (h & 127), 20 + ((h >> 7) & 63), 10 + ((h >> 13) & 31), 1 + (h & 3),
+       (h & 15) <> 0, ((h >> 4) % 5) + 1, (h >> 9) & 255, now(), now()
+FROM (SELECT id, email, hashtext(email) & 2147483647 AS h FROM new_users) AS u
+"""
+
+
+def legacy_filters(service_type: Optional[str] = None, pet_type: Optional[str] = None,
+                   max_price: Optional[float] = None, pet_size: Optional[str] = None) -> List:
+    """The `= ANY(column)` predicates search_caregivers used before the rewrite."""
+    criteria = [CaregiverProfile.is_available == True]
+    if service_type:
+        criteria.append(CaregiverProfile.services_offered.any(cast(service_type, String)))
+    if pet_type:
+        criteria.append(CaregiverProfile.accepted_pet_types.any(cast(pet_type, String)))
+    if max_price:
+        criteria.append(or_(
+            CaregiverProfile.price_per_night <= max_price,
+            CaregiverProfile.price_per_day <= max_price,
+            CaregiverProfile.price_per_walk <= max_price
+        ))
+    if pet_size:
+        criteria.append(CaregiverProfile.preferred_pet_size.any(cast(pet_size, String)))
+    return criteria
+
+
+def plan_nodes(plan: Dict) -> Iterable[Dict]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+def explain(conn, stmt) -> Dict:
+    compiled = stmt.compile(dialect=conn.dialect)
+    rows = conn.exec_driver_sql(
+        "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + str(compiled), compiled.params
+    ).scalar()
+    root = rows[0]
+    nodes = list(plan_nodes(root["Plan"]))
+    return {
+        "execution_ms": root["Execution Time"],
+        "nodes": sorted({node["Node Type"] for node in nodes}),
+        "indexes": sorted({node["Index Name"] for node in nodes if "Index Name" in node}),
+        "buffers": sum(root["Plan"].get(key, 0) for key in ("Shared Hit Blocks", "Shared Read Blocks")),
+    }
+
+
+def seed(engine, count: int, batch_size: int = 10000) -> None:
+    with engine.begin() as conn:
+        already = conn.execute(
+            text("SELECT count(*) FROM users WHERE email LIKE 'bench-caregiver-%'")
+        ).scalar()
+        for batch, start in enumerate(range(0, count, batch_size), start=already):
+            conn.execute(text(SEED_SQL), {"count": min(batch_size, count - start), "batch": batch})
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("ANALYZE caregiver_profiles"))
+    print(f"seeded {count} caregivers")
+
+
+def cleanup(engine) -> None:
+    with engine.begin() as conn:
+        conn.execute(text(
+            "DELETE FROM caregiver_profiles WHERE user_id IN "
+            "(SELECT id FROM users WHERE email LIKE 'bench-caregiver-%')"
+        ))
+        deleted = conn.execute(text("DELETE FROM users WHERE email LIKE 'bench-caregiver-%'")).rowcount
+    print(f"removed {deleted} benchmark caregivers")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed", type=int, default=0, help="insert this many synthetic caregivers first")
+    parser.add_argument("--cleanup", action="store_true", help="delete the synthetic caregivers and exit")
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args()
+
+    engine = create_engine(os.getenv("BENCH_DATABASE_URL", SQLALCHEMY_DATABASE_URL))
+    if args.cleanup:
+        cleanup(engine)
+        return
+    if args.seed:
+        seed(engine, args.seed)
+
+    results = []
+    with engine.connect() as conn:
+        total = conn.execute(select(func.count(CaregiverProfile.id))).scalar()
+        for filters in SCENARIOS:
+            for style, build in (("= ANY", legacy_filters), ("@>", search_filters)):
+                criteria = build(**filters)
+                # The search page as served, and the full match count, which is
+                # where a sequential scan really hurts
+                for shape, stmt in (
+                    ("page", select(CaregiverProfile.id).where(*criteria).limit(20)),
+                    ("count", select(func.count()).select_from(CaregiverProfile).where(*criteria)),
+                ):
+                    results.append({"filters": filters, "style": style, "shape": shape, **explain(conn, stmt)})
+                conn.rollback()
+
+    print_table(
+        f"caregiver search plans ({total} caregiver_profiles rows)",
+        ["filters", "predicate", "query", "ms", "buffers", "plan nodes", "indexes"],
+        [
+            [",".join(f"{k}={v}" for k, v in r["filters"].items()), r["style"], r["shape"],
+             f"{r['execution_ms']:.2f}", r["buffers"], " ".join(r["nodes"]), " ".join(r["indexes"]) or "-"]
+            for r in results
+        ],
+    )
+    if args.json:
+        dump_json(args.json, {"rows": total, "results": results})
+
+
+if __name__ == "__main__":
+    main()
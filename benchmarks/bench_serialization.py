@@ -0,0 +1,124 @@
+# benchmarks/bench_serialization.py
+"""
+Response serialization cost for the hot list schemas, at 20 / 100 / 1000 items.
+
+Items are plain attribute objects shaped like the ORM rows, so no database is
+needed. Three paths are timed for each schema and size:
+
+  stdlib   - what FastAPI does for a response_model with the default
+             JSONResponse: validate_python(from_attributes) ->
+             dump_python(mode="json") -> json.dumps
+  orjson   - same, but rendered by ORJSONResponse (orjson.dumps)
+  adapter  - serialize_response(): validate_python -> dump_json, no
+             intermediate dict tree, encoded by pydantic-core
+
+    python -m benchmarks.bench_serialization --sizes 20 100 1000 --iterations 200
+"""
+import argparse
+import json
+import timeit
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Callable, Dict, List
+
+from pydantic import TypeAdapter
+
+from app.schemas.caregiver import CaregiverPublicProfile
+from app.schemas.pet import Pet
+from benchmarks.common import dump_json, print_table
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def fake_caregiver(i: int) -> SimpleNamespace:
+    now = datetime(2024, 1, 1) + timedelta(minutes=i)
+    return SimpleNamespace(
+        id=uuid.uuid4(), bio="Experienced sitter with a big garden. " * 3,
+        years_of_experience=i % 15, services_offered=["BOARDING", "WALKING"],
+        accepted_pet_types=["dog", "cat"], price_per_night=80.0 + i % 50,
+        price_per_walk=25.0, price_per_day=60.0, available_from=now, available_to=now,
+        maximum_pets=2, home_type="house", has_fenced_yard=True, living_space_size=120,
+        emergency_transport=bool(i % 2), preferred_pet_size=["small", "medium"],
+        rating=4.5, total_reviews=i % 200, is_available=True,
+        user_full_name=f"Caregiver {i}", user_profile_picture="https://example.com/p.jpg",
+    )
+
+
+def fake_pet(i: int) -> SimpleNamespace:
+    now = datetime(2024, 1, 1) + timedelta(minutes=i)
+    images = [
+        SimpleNamespace(id=uuid.uuid4(), url=f"https://example.com/{i}/{n}.jpg", order=n,
+                        thumbnail_url=None, created_at=now)
+        for n in range(3)
+    ]
+    return SimpleNamespace(
+        id=uuid.uuid4(), owner_id=uuid.uuid4(), name=f"Pet {i}", pet_type="dog",
+        breed="Beagle", age=3, size="medium", weight=12.5, gender="male", is_neutered=True,
+        medical_conditions=None, vaccination_status="up to date", special_requirements=None,
+        created_at=now, updated_at=now, images=images,
+        image_urls=[img.url for img in images], primary_image=images[0].url,
+    )
+
+
+def paths(adapter: TypeAdapter) -> Dict[str, Callable]:
+    def stdlib(items):
+        value = adapter.validate_python(items, from_attributes=True)
+        return json.dumps(adapter.dump_python(value, mode="json"), ensure_ascii=False,
+                          allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+    def orjson_path(items):
+        value = adapter.validate_python(items, from_attributes=True)
+        return orjson.dumps(adapter.dump_python(value, mode="json"))
+
+    def adapter_path(items):
+        return adapter.dump_json(adapter.validate_python(items, from_attributes=True))
+
+    result = {"stdlib": stdlib, "adapter": adapter_path}
+    if orjson is not None:
+        result["orjson"] = orjson_path
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[20, 100, 1000])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args()
+
+    schemas = {
+        "CaregiverPublicProfile": (TypeAdapter(List[CaregiverPublicProfile]), fake_caregiver),
+        "Pet": (TypeAdapter(List[Pet]), fake_pet),
+    }
+    results = []
+    for name, (adapter, factory) in schemas.items():
+        for size in args.sizes:
+            items = [factory(i) for i in range(size)]
+            timings = {}
+            for label, fn in paths(adapter).items():
+                iterations = max(1, args.iterations * 20 // size)
+                seconds = min(timeit.repeat(lambda: fn(items), number=iterations, repeat=3))
+                timings[label] = seconds / iterations * 1000
+            results.append({"schema": name, "items": size, "ms": timings})
+
+    labels = ["stdlib", "orjson", "adapter"] if orjson is not None else ["stdlib", "adapter"]
+    print_table(
+        "ms per response (best of 3)",
+        ["schema", "items", *labels, "adapter vs stdlib"],
+        [
+            [r["schema"], r["items"], *(f"{r['ms'][label]:.3f}" for label in labels),
+             f"{r['ms']['stdlib'] / r['ms']['adapter']:.2f}x"]
+            for r in results
+        ],
+    )
+
+    if args.json:
+        dump_json(args.json, {"iterations": args.iterations, "results": results})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# benchmarks/common.py
+"""Small helpers shared by the benchmark scripts (stdlib only)."""
+import json
+import os
+import time
+import urllib.error
+import urllib.request
+from typing import Dict, Iterable, List, Optional, Tuple
+
+BASE_URL = os.getenv("BENCH_BASE_URL", "http://localhost:8000")
+TOKEN = os.getenv("BENCH_TOKEN")
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def http_get(
+    path: str,
+    headers: Optional[Dict[str, str]] = None,
+    base_url: Optional[str] = None,
+) -> Tuple[int, float, int]:
+    """GET `path` against `base_url` (default BASE_URL). Returns (status, seconds, body bytes)."""
+    request_headers = dict(headers or {})
+    if TOKEN:
+        request_headers.setdefault("Authorization", f"Bearer {TOKEN}")
+    request = urllib.request.Request(f"{base_url or BASE_URL}{path}", headers=request_headers)
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request) as response:
+            body = response.read()
+            status = response.status
+    except urllib.error.HTTPError as e:
+        body = e.read()
+        status = e.code
+    return status, time.perf_counter() - start, len(body)
+
+
+def print_table(title: str, header: Iterable[str], rows: Iterable[Iterable]) -> None:
+    """Print rows as a fixed-width table."""
+    header = list(header)
+    rows = [[str(cell) for cell in row] for row in rows]
+    widths = [max(len(h), *(len(r[i]) for r in rows)) if rows else len(h) for i, h in enumerate(header)]
+    print(f"\n{title}")
+    print("  ".join(h.ljust(w) for h, w in zip(header, widths)))
+    print("  ".join("-" * w for w in widths))
+    for row in rows:
+        print("  ".join(cell.ljust(w) for cell, w in zip(row, widths)))
+
+
+def dump_json(path: str, data: Dict) -> None:
+    """Write benchmark results next to the console output for later comparison."""
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2, default=str)
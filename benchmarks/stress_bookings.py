@@ -0,0 +1,188 @@
+# benchmarks/stress_bookings.py
+"""
+Concurrent booking stress test for the caregiver capacity check and the pet
+overlap constraint (migration c4f9a2e7b1d3).
+
+Seeds one caregiver with `--capacity` slots and an owner with `--pets` pets,
+then fires `--attempts` bookings from `--workers` threads at once, with
+random stays packed into a few days so most of them collide. Each attempt
+goes through ensure_capacity() and commit_booking(), like POST /bookings.
+Afterwards the committed bookings are checked: peak occupancy never above
+capacity and no pet in two overlapping active bookings. Exits non-zero if
+either is violated. `--unlocked` skips the caregiver lock to show the race
+it closes. Talks to the database directly (BENCH_DATABASE_URL, default: the
+app's DATABASE_URL); use a scratch database:
+
+    python -m benchmarks.stress_bookings --attempts 500 --workers 32
+    python -m benchmarks.stress_bookings --unlocked
+    python -m benchmarks.stress_bookings --cleanup
+"""
+import argparse
+import os
+import random
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine, delete, select
+from sqlalchemy.orm import Session
+
+from app.core.database import SQLALCHEMY_DATABASE_URL
+import app.models  # noqa: F401  configure every mapper Booking relates to
+from app.models.booking import Booking, BookingStatus, ServiceType
+from app.models.caregiver import CaregiverProfile
+from app.models.pet import Pet, PetType
+from app.models.user import User, UserType
+from app.utils import availability
+from app.utils.availability import ACTIVE_BOOKING_STATUSES, commit_booking, ensure_capacity, peak_occupancy
+from benchmarks.common import dump_json, print_table
+
+OWNER_EMAIL = "bench-booking-owner@example.invalid"
+CAREGIVER_EMAIL = "bench-booking-caregiver@example.invalid"
+EPOCH = datetime(2030, 1, 1, 12)
+
+
+def seed(engine, capacity: int, pets: int) -> None:
+    """(Re)create the synthetic owner, pets and caregiver with no bookings."""
+    cleanup(engine, quiet=True)
+    with Session(engine) as session:
+        owner = User(email=OWNER_EMAIL, hashed_password="x", full_name="Bench Owner",
+                     user_type=UserType.OWNER, is_active=True, is_verified=True)
+        carer = User(email=CAREGIVER_EMAIL, hashed_password="x", full_name="Bench Caregiver",
+                     user_type=UserType.CAREGIVER, is_active=True, is_verified=True)
+        session.add_all([owner, carer])
+        session.flush()
+        session.add(CaregiverProfile(user_id=carer.id, services_offered=["BOARDING"], accepted_pet_types=["dog"],
+                                     price_per_night=50, maximum_pets=capacity, is_available=True))
+        session.add_all([Pet(owner_id=owner.id, name=f"Bench Pet {i}", pet_type=PetType.DOG) for i in range(pets)])
+        session.commit()
+
+
+def cleanup(engine, quiet: bool = False) -> None:
+    with Session(engine) as session:
+        owner_id = session.scalar(select(User.id).where(User.email == OWNER_EMAIL))
+        carer_id = session.scalar(select(User.id).where(User.email == CAREGIVER_EMAIL))
+        deleted = 0
+        if owner_id is not None:
+            deleted = session.execute(delete(Booking).where(Booking.owner_id == owner_id)).rowcount
+            session.execute(delete(Pet).where(Pet.owner_id == owner_id))
+        if carer_id is not None:
+            session.execute(delete(CaregiverProfile).where(CaregiverProfile.user_id == carer_id))
+        session.execute(delete(User).where(User.email.in_([OWNER_EMAIL, CAREGIVER_EMAIL])))
+        session.commit()
+    if not quiet:
+        print(f"removed {deleted} benchmark bookings")
+
+
+def attempt(engine, caregiver_id, owner_id, pet_id, start: datetime, end: datetime, go) -> str:
+    """One booking request; returns "created", "full", "pet overlap" or the error name."""
+    go.wait()
+    with Session(engine) as session:
+        caregiver = session.get(CaregiverProfile, caregiver_id)
+        try:
+            ensure_capacity(session, caregiver, start, end)
+            session.add(Booking(pet_id=pet_id, owner_id=owner_id, caregiver_id=caregiver_id,
+                                service_type=ServiceType.BOARDING, start_date=start, end_date=end,
+                                status=BookingStatus.PENDING, total_price=50))
+            commit_booking(session)
+            return "created"
+        except HTTPException as e:
+            return "full" if "fully booked" in e.detail else "pet overlap"
+        except Exception as e:  # deadlocks etc. would be bugs worth seeing
+            session.rollback()
+            return type(e).__name__
+
+
+def verify(session: Session, caregiver: CaregiverProfile) -> Dict:
+    """Recompute occupancy and pet overlaps from what actually committed."""
+    rows = session.execute(
+        select(Booking.pet_id, Booking.start_date, Booking.end_date)
+        .where(Booking.caregiver_id == caregiver.id, Booking.status.in_(ACTIVE_BOOKING_STATUSES))
+    ).all()
+    intervals = [(start, end) for _, start, end in rows]
+    peak = peak_occupancy(intervals, min(s for s, _ in intervals), max(e for _, e in intervals)) if rows else 0
+    by_pet = defaultdict(list)
+    for pet_id, start, end in rows:
+        by_pet[pet_id].append((start, end))
+    pet_overlaps = sum(
+        1 for stays in by_pet.values()
+        for i, (s1, e1) in enumerate(stays) for s2, e2 in stays[i + 1:] if s1 < e2 and s2 < e1
+    )
+    return {"bookings": len(rows), "peak": peak, "capacity": caregiver.maximum_pets, "pet_overlaps": pet_overlaps}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--capacity", type=int, default=3, help="the caregiver's maximum_pets")
+    parser.add_argument("--pets", type=int, default=8, help="pets shared by all attempts")
+    parser.add_argument("--attempts", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=32)
+    parser.add_argument("--days", type=int, default=5, help="stays start within this many days")
+    parser.add_argument("--unlocked", action="store_true", help="skip the caregiver lock (expect overbooking)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for the stays")
+    parser.add_argument("--cleanup", action="store_true", help="delete the synthetic users and exit")
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args()
+
+    engine = create_engine(
+        os.getenv("BENCH_DATABASE_URL", SQLALCHEMY_DATABASE_URL),
+        pool_size=args.workers, max_overflow=0,
+    )
+    if args.cleanup:
+        cleanup(engine)
+        return
+    seed(engine, args.capacity, args.pets)
+    if args.unlocked:
+        availability.lock_caregiver = lambda session, caregiver_id: None
+
+    with Session(engine) as session:
+        owner_id = session.scalar(select(User.id).where(User.email == OWNER_EMAIL))
+        caregiver_id = session.scalar(
+            select(CaregiverProfile.id).join(User, User.id == CaregiverProfile.user_id)
+            .where(User.email == CAREGIVER_EMAIL)
+        )
+        pet_ids = session.scalars(select(Pet.id).where(Pet.owner_id == owner_id)).all()
+
+    rng = random.Random(args.seed)
+    jobs = []
+    for _ in range(args.attempts):
+        start = EPOCH + timedelta(hours=rng.randrange(args.days * 24))
+        jobs.append((rng.choice(pet_ids), start, start + timedelta(hours=rng.randint(4, 48))))
+
+    # Queue every attempt first, then release them together
+    go = threading.Event()
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        futures = [pool.submit(attempt, engine, caregiver_id, owner_id, *job, go) for job in jobs]
+        started = time.perf_counter()
+        go.set()
+        outcomes: List[str] = [future.result() for future in futures]
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    with Session(engine) as session:
+        result = verify(session, session.get(CaregiverProfile, caregiver_id))
+    counts = Counter(outcomes)
+    result.update({"outcomes": dict(counts), "elapsed_ms": elapsed_ms, "locked": not args.unlocked})
+
+    print_table(
+        f"{args.attempts} booking attempts, {args.workers} workers, capacity {args.capacity}"
+        f"{' (no caregiver lock)' if args.unlocked else ''}",
+        ["outcome", "count"],
+        [[outcome, count] for outcome, count in counts.most_common()],
+    )
+    print_table(
+        f"committed state ({elapsed_ms:.0f} ms)",
+        ["active bookings", "peak occupancy", "capacity", "pet overlaps"],
+        [[result["bookings"], result["peak"], result["capacity"], result["pet_overlaps"]]],
+    )
+    if args.json:
+        dump_json(args.json, result)
+    if result["peak"] > args.capacity or result["pet_overlaps"]:
+        raise SystemExit("overbooked")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# tests/factories.py
+"""Committed rows for DB-backed tests, with just enough columns filled in."""
+from typing import Dict
+from uuid import uuid4
+from sqlalchemy.orm import Session
+from app.core.security import create_access_token
+from app.models.caregiver import CaregiverProfile
+from app.models.pet import Pet, PetType
+from app.models.user import User, UserType
+
+
+def create_user(db: Session, user_type: UserType = UserType.OWNER, **fields) -> User:
+    user = User(
+        email=f"{uuid4().hex}@example.invalid",
+        hashed_password="x",
+        full_name="Test User",
+        user_type=user_type,
+        is_active=True,
+        is_verified=True,
+        **fields,
+    )
+    db.add(user)
+    db.commit()
+    return user
+
+
+def create_caregiver(db: Session, maximum_pets: int = 1, **fields) -> CaregiverProfile:
+    user = create_user(db, UserType.CAREGIVER)
+    profile = CaregiverProfile(
+        user_id=user.id,
+        services_offered=["BOARDING"],
+        accepted_pet_types=["dog"],
+        price_per_night=50,
+        maximum_pets=maximum_pets,
+        # Copied from the user by a trigger in migrated databases; create_all has no triggers
+        user_full_name=user.full_name,
+        is_available=True,
+        **fields,
+    )
+    db.add(profile)
+    db.commit()
+    return profile
+
+
+def create_pet(db: Session, owner: User) -> Pet:
+    pet = Pet(owner_id=owner.id, name="Rex", pet_type=PetType.DOG)
+    db.add(pet)
+    db.commit()
+    return pet
+
+
+def auth_headers(user: User) -> Dict[str, str]:
+    return {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}
@@ -0,0 +1,47 @@
+# tests/test_api/test_bookings.py
+import pytest
+from app.utils import email as email_utils
+from tests.factories import auth_headers, create_caregiver, create_pet, create_user
+
+
+@pytest.fixture(autouse=True)
+def no_mail(monkeypatch):
+    async def _skip(*args, **kwargs):
+        return None
+    for name in ("send_booking_notification_to_caregiver", "send_booking_confirmation_email",
+                 "send_booking_status_update"):
+        monkeypatch.setattr(email_utils, name, _skip)
+
+
+def _booking(pet, caregiver):
+    return {
+        "pet_id": str(pet.id), "caregiver_id": str(caregiver.id), "service_type": "BOARDING",
+        "start_date": "2030-05-01T12:00:00+08:00", "end_date": "2030-05-03T12:00:00+08:00",
+    }
+
+
+def test_create_booking_then_the_last_slot_is_taken(client, db):
+    caregiver = create_caregiver(db, maximum_pets=1)
+    first, second = create_user(db), create_user(db)
+
+    response = client.post("/api/v1/bookings/", json=_booking(create_pet(db, first), caregiver),
+                           headers=auth_headers(first))
+    assert response.status_code == 200
+    assert response.json()["start_date"] == "2030-05-01T04:00:00"
+    assert response.json()["caregiver_name"] == "Test User"
+
+    response = client.post("/api/v1/bookings/", json=_booking(create_pet(db, second), caregiver),
+                           headers=auth_headers(second))
+    assert response.status_code == 409
+
+
+def test_caregiver_updates_booking_status(client, db):
+    caregiver = create_caregiver(db)
+    owner = create_user(db)
+    booking = client.post("/api/v1/bookings/", json=_booking(create_pet(db, owner), caregiver),
+                          headers=auth_headers(owner)).json()
+
+    response = client.put(f"/api/v1/bookings/{booking['id']}/status?status=CONFIRMED",
+                          headers=auth_headers(caregiver.user))
+    assert response.status_code == 200
+    assert response.json()["status"] == "CONFIRMED"
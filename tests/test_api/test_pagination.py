@@ -0,0 +1,29 @@
+# tests/test_api/test_pagination.py
+from tests.factories import auth_headers, create_caregiver, create_user
+
+
+def test_malformed_cursor_is_a_400(client, db):
+    headers = auth_headers(create_user(db))
+    response = client.get("/api/v1/pets/?cursor=not-a-cursor", headers=headers)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_limit_must_be_positive(client, db):
+    headers = auth_headers(create_user(db))
+    for path in ("/api/v1/pets/", "/api/v1/bookings/", "/api/v1/payments/history", "/api/v1/caregivers/search"):
+        assert client.get(f"{path}?limit=0", headers=headers).status_code == 422
+
+
+def test_exactly_full_ranked_page_has_no_next_cursor(client, db):
+    headers = auth_headers(create_user(db))
+    for _ in range(3):
+        create_caregiver(db)
+    response = client.get("/api/v1/caregivers/search?sort=rating&limit=3", headers=headers)
+    assert response.status_code == 200
+    assert len(response.json()) == 3
+    assert "X-Next-Cursor" not in response.headers
+
+    response = client.get("/api/v1/caregivers/search?sort=rating&limit=2", headers=headers)
+    assert len(response.json()) == 2
+    assert "X-Next-Cursor" in response.headers
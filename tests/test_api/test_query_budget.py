@@ -0,0 +1,66 @@
+# tests/test_api/test_query_budget.py
+"""
+Query budgets for the hot read endpoints. Each is measured with few and with
+many rows, so an N+1 (a lazy load per row) fails even when the budget
+itself would have room for it.
+"""
+from datetime import datetime, timedelta
+from app.core.query_stats import assert_query_budget
+from app.models.booking import Booking, BookingStatus, ServiceType
+from tests.factories import auth_headers, create_caregiver, create_pet, create_user
+
+
+def _book(db, owner, caregivers):
+    start = datetime(2030, 1, 1)
+    for offset, caregiver in enumerate(caregivers):
+        pet = create_pet(db, owner)
+        db.add(Booking(
+            pet_id=pet.id, owner_id=owner.id, caregiver_id=caregiver.id,
+            service_type=ServiceType.BOARDING, status=BookingStatus.CONFIRMED, total_price=50,
+            start_date=start + timedelta(days=offset), end_date=start + timedelta(days=offset + 1),
+        ))
+    db.commit()
+
+
+def test_caregiver_profile(client, db):
+    owner = create_user(db)
+    caregiver = create_caregiver(db)
+    headers = auth_headers(owner)
+
+    # Token -> user, updated_at probe, profile
+    with assert_query_budget(3):
+        response = client.get(f"/api/v1/caregivers/{caregiver.id}", headers=headers)
+    assert response.status_code == 200
+
+
+def test_caregiver_search_does_not_grow_with_results(client, db):
+    owner = create_user(db)
+    headers = auth_headers(owner)
+    create_caregiver(db)
+
+    with assert_query_budget(4) as few:
+        assert client.get("/api/v1/caregivers/search?limit=50", headers=headers).status_code == 200
+
+    for _ in range(10):
+        create_caregiver(db)
+    with assert_query_budget(4) as many:
+        response = client.get("/api/v1/caregivers/search?limit=50", headers=headers)
+    assert response.status_code == 200
+    assert len(response.json()) == 11
+    assert len(many) == len(few)
+
+
+def test_booking_list_does_not_grow_with_results(client, db):
+    owner = create_user(db)
+    headers = auth_headers(owner)
+    _book(db, owner, [create_caregiver(db)])
+
+    with assert_query_budget(3) as few:
+        assert client.get("/api/v1/bookings/", headers=headers).status_code == 200
+
+    _book(db, owner, [create_caregiver(db) for _ in range(10)])
+    with assert_query_budget(3) as many:
+        response = client.get("/api/v1/bookings/?limit=50", headers=headers)
+    assert response.status_code == 200
+    assert len(response.json()) == 11
+    assert len(many) == len(few)
@@ -0,0 +1,56 @@
+# tests/test_core/test_cache.py
+import time
+from app.core.cache import TTLCache
+
+
+def test_entries_expire_after_the_ttl():
+    cache = TTLCache(max_size=10, ttl=60)
+    cache.set("a", 1, ttl=0)
+    assert cache.get("a") is None
+    cache.set("b", 2)
+    assert cache.get("b") == 2
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(max_size=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert cache.stats()["evictions"] == 1
+
+
+def test_refill_is_held_off_after_a_clear():
+    cache = TTLCache(max_size=10, ttl=60, settle_seconds=60)
+    cache.set("a", 1)
+    cache.clear()
+    cache.set("a", "from a lagging replica")
+    assert cache.get("a") is None
+
+
+def test_refill_is_held_off_only_for_the_deleted_key():
+    cache = TTLCache(max_size=10, ttl=60, settle_seconds=60)
+    cache.delete("a")
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+
+def test_refill_resumes_once_settled():
+    cache = TTLCache(max_size=10, ttl=60, settle_seconds=0.01)
+    cache.delete("a")
+    cache.clear()
+    time.sleep(0.02)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+
+
+def test_without_settle_seconds_refills_immediately():
+    cache = TTLCache(max_size=10, ttl=60)
+    cache.clear()
+    cache.delete("a")
+    cache.set("a", 1)
+    assert cache.get("a") == 1
@@ -0,0 +1,66 @@
+# tests/test_core/test_query_stats.py
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from app.core.query_stats import QueryStats, _current_stats, assert_query_budget, fingerprint
+
+
+@pytest.fixture
+def engine():
+    return create_engine("sqlite://")
+
+
+@pytest.fixture
+def stats():
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    yield stats
+    _current_stats.reset(token)
+
+
+def test_counts_statements_of_the_current_request(engine, stats):
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        conn.execute(text("SELECT 2"))
+    assert stats.count == 2
+    assert stats.seconds > 0
+    assert stats.statements == ["SELECT 1", "SELECT 2"]
+
+
+def test_ignores_statements_outside_a_request(engine):
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        assert not conn.info.get("query_start_times")
+
+
+def test_failed_statement_does_not_leak_its_start_time(engine, stats):
+    with engine.connect() as conn:
+        with pytest.raises(OperationalError):
+            conn.execute(text("SELECT * FROM missing_table"))
+        assert conn.info["query_start_times"] == []
+        conn.execute(text("SELECT 1"))
+        assert conn.info["query_start_times"] == []
+    assert stats.count == 2
+    assert stats.statements[-1] == "SELECT 1"
+
+
+def test_fingerprint_collapses_literals_and_parameters():
+    assert fingerprint("SELECT *  FROM t WHERE a = 'x' AND b = 42 AND c IN (%(p1)s, %(p2)s)") == (
+        "SELECT * FROM t WHERE a = ? AND b = ? AND c IN (?)"
+    )
+
+
+def test_query_budget_passes_within_budget(engine):
+    with assert_query_budget(2, engine) as statements:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+    assert len(statements) == 2
+
+
+def test_query_budget_reports_repeated_statements(engine):
+    with pytest.raises(AssertionError, match=r"3 queries, budget 1[\s\S]*3x SELECT \?"):
+        with assert_query_budget(1, engine):
+            with engine.connect() as conn:
+                for value in range(3):
+                    conn.execute(text(f"SELECT {value}"))
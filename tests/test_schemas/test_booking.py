@@ -0,0 +1,22 @@
+# tests/test_schemas/test_booking.py
+from datetime import datetime
+from uuid import uuid4
+from app.schemas.booking import BookingCreate
+
+
+def _create(start: str, end: str) -> BookingCreate:
+    return BookingCreate(
+        pet_id=uuid4(), caregiver_id=uuid4(), service_type="BOARDING", start_date=start, end_date=end
+    )
+
+
+def test_offsets_are_converted_to_naive_utc():
+    booking = _create("2030-01-02T08:00:00+08:00", "2030-01-03T00:00:00Z")
+    assert booking.start_date == datetime(2030, 1, 2, 0, 0)
+    assert booking.end_date == datetime(2030, 1, 3, 0, 0)
+    assert booking.start_date.tzinfo is None and booking.end_date.tzinfo is None
+
+
+def test_naive_datetimes_are_kept_as_given():
+    booking = _create("2030-01-02T08:00:00", "2030-01-03T08:00:00")
+    assert booking.start_date == datetime(2030, 1, 2, 8, 0)
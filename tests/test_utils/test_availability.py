@@ -0,0 +1,172 @@
+# tests/test_utils/test_availability.py
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
+from app.models.booking import Booking, BookingStatus
+from app.utils.availability import (
+    ACTIVE_BOOKING_STATUSES, CALENDAR_RANGES_PER_CAREGIVER, PET_OVERLAP_CONSTRAINT, availability_cache, cache_calendar,
+    cached_calendar, commit_booking, daily_occupancy, peak_occupancy, to_naive_utc, validate_window,
+)
+
+DAY_START = datetime(2030, 1, 1)
+
+
+def _at(hours: float) -> datetime:
+    return DAY_START + timedelta(hours=hours)
+
+
+def _stays(*pairs):
+    return [(_at(start), _at(end)) for start, end in pairs]
+
+
+def test_aware_datetimes_become_naive_utc():
+    kuala_lumpur = timezone(timedelta(hours=8))
+    assert to_naive_utc(datetime(2030, 1, 2, 8, 0, tzinfo=kuala_lumpur)) == datetime(2030, 1, 2, 0, 0)
+    assert to_naive_utc(datetime(2030, 1, 2, 8, 0)) == datetime(2030, 1, 2, 8, 0)
+
+
+def test_window_mixing_offsets_is_compared_in_utc():
+    start = datetime(2030, 1, 1, 23, 0, tzinfo=timezone.utc)
+    end = datetime(2030, 1, 2, 1, 0, tzinfo=timezone(timedelta(hours=8)))  # 2030-01-01 17:00 UTC
+    with pytest.raises(HTTPException) as exc:
+        validate_window(start, end)
+    assert exc.value.status_code == 400
+
+
+def test_window_is_returned_naive():
+    window = validate_window(
+        datetime(2030, 1, 1, tzinfo=timezone.utc), datetime(2030, 1, 3, tzinfo=timezone.utc)
+    )
+    assert window == (datetime(2030, 1, 1), datetime(2030, 1, 3))
+
+
+def test_window_needs_both_dates():
+    assert validate_window(None, None) is None
+    with pytest.raises(HTTPException):
+        validate_window(datetime(2030, 1, 1), None)
+
+
+def test_back_to_back_stays_share_a_slot():
+    assert peak_occupancy(_stays((9, 12), (12, 15)), _at(0), _at(24)) == 1
+
+
+def test_stays_overlapping_the_window_but_not_each_other_take_one_slot():
+    assert peak_occupancy(_stays((1, 3), (5, 8), (10, 30)), _at(0), _at(24)) == 1
+
+
+def test_overlapping_stays_each_take_a_slot():
+    assert peak_occupancy(_stays((1, 5), (4, 8), (4, 6), (6, 9)), _at(0), _at(24)) == 3
+
+
+def test_stays_touching_the_window_edges_are_outside_it():
+    assert peak_occupancy(_stays((-5, 0), (24, 30)), _at(0), _at(24)) == 0
+    assert peak_occupancy([], _at(0), _at(24)) == 0
+
+
+class _FailingSession:
+    def __init__(self, error):
+        self.error = error
+        self.rolled_back = False
+
+    def commit(self):
+        raise self.error
+
+    def rollback(self):
+        self.rolled_back = True
+
+
+def _integrity_error(constraint_name):
+    orig = SimpleNamespace(diag=SimpleNamespace(constraint_name=constraint_name))
+    return IntegrityError("INSERT INTO bookings ...", {}, orig)
+
+
+def test_pet_overlap_violation_is_a_409():
+    session = _FailingSession(_integrity_error(PET_OVERLAP_CONSTRAINT))
+    with pytest.raises(HTTPException) as exc:
+        commit_booking(session)
+    assert exc.value.status_code == 409
+    assert session.rolled_back
+
+
+def test_other_integrity_errors_are_reraised():
+    error = _integrity_error("bookings_pet_id_fkey")
+    session = _FailingSession(error)
+    with pytest.raises(IntegrityError) as exc:
+        commit_booking(session)
+    assert exc.value is error
+    assert session.rolled_back
+
+
+def test_daily_occupancy_counts_a_multi_day_stay_on_every_day_it_covers():
+    stays = _stays((12, 24 * 3 + 10))  # Jan 1 noon to Jan 4 10:00
+    assert daily_occupancy(stays, date(2029, 12, 31), date(2030, 1, 5)) == [0, 1, 1, 1, 1, 0]
+
+
+def test_daily_occupancy_treats_midnight_as_the_start_of_the_next_day():
+    # Checking out at midnight frees Jan 2; checking in at midnight takes Jan 3
+    stays = _stays((0, 24), (48, 72))
+    assert daily_occupancy(stays, date(2030, 1, 1), date(2030, 1, 3)) == [1, 0, 1]
+
+
+def test_daily_occupancy_takes_the_peak_within_each_day():
+    stays = _stays((8, 12), (12, 16), (10, 11), (20, 40))
+    assert daily_occupancy(stays, date(2030, 1, 1), date(2030, 1, 2)) == [2, 1]
+
+
+def test_daily_occupancy_matches_peak_occupancy_per_day():
+    stays = _stays((5, 30), (23, 26), (24, 48), (47, 49), (60, 61))
+    days = [date(2030, 1, 1) + timedelta(days=offset) for offset in range(4)]
+    expected = [
+        peak_occupancy(stays, _at(24 * offset), _at(24 * (offset + 1))) for offset in range(len(days))
+    ]
+    assert daily_occupancy(stays, days[0], days[-1]) == expected
+
+
+@pytest.fixture
+def calendar_cache():
+    availability_cache.clear()
+    yield availability_cache
+    availability_cache.clear()
+
+
+def test_cache_calendar_keeps_the_newest_ranges(calendar_cache):
+    caregiver_id = uuid4()
+    for number in range(CALENDAR_RANGES_PER_CAREGIVER + 2):
+        cache_calendar(caregiver_id, number, (f"etag-{number}", b"{}"))
+    assert cached_calendar(caregiver_id, 0) is None
+    assert cached_calendar(caregiver_id, 1) is None
+    assert cached_calendar(caregiver_id, CALENDAR_RANGES_PER_CAREGIVER + 1) == (
+        f"etag-{CALENDAR_RANGES_PER_CAREGIVER + 1}", b"{}"
+    )
+    assert len(calendar_cache.get(caregiver_id)) == CALENDAR_RANGES_PER_CAREGIVER
+
+
+def test_cache_calendar_refreshes_a_recached_range(calendar_cache):
+    caregiver_id = uuid4()
+    for number in range(CALENDAR_RANGES_PER_CAREGIVER):
+        cache_calendar(caregiver_id, number, ("old", b"{}"))
+    cache_calendar(caregiver_id, 0, ("new", b"{}"))
+    cache_calendar(caregiver_id, "next", ("next", b"{}"))
+    # Range 0 was re-cached, so range 1 is now the oldest
+    assert cached_calendar(caregiver_id, 0) == ("new", b"{}")
+    assert cached_calendar(caregiver_id, 1) is None
+
+
+def test_cache_calendar_keeps_caregivers_apart(calendar_cache):
+    first, second = uuid4(), uuid4()
+    cache_calendar(first, "range", ("first", b"{}"))
+    cache_calendar(second, "range", ("second", b"{}"))
+    calendar_cache.delete(first)
+    assert cached_calendar(first, "range") is None
+    assert cached_calendar(second, "range") == ("second", b"{}")
+
+
+def test_pet_overlap_constraint_covers_every_active_status():
+    constraint = next(c for c in Booking.__table__.constraints if c.name == PET_OVERLAP_CONSTRAINT)
+    predicate = str(constraint.where)
+    assert BookingStatus.PAYMENT_REQUIRED in ACTIVE_BOOKING_STATUSES
+    for status in BookingStatus:
+        assert (f"'{status.value}'" in predicate) == (status in ACTIVE_BOOKING_STATUSES)
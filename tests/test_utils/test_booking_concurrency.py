@@ -0,0 +1,102 @@
+# tests/test_utils/test_booking_concurrency.py
+"""
+Concurrent bookings against a real database: the create_booking critical
+section (ensure_capacity, insert, commit_booking) run from several threads at
+once, each on its own connection, released together by a barrier.
+"""
+import threading
+from datetime import datetime
+from fastapi import HTTPException
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from app.models.booking import Booking, BookingStatus, ServiceType
+from app.models.caregiver import CaregiverProfile
+from app.utils.availability import commit_booking, ensure_capacity
+from tests.factories import create_caregiver, create_pet, create_user
+
+START, END = datetime(2030, 3, 1, 12), datetime(2030, 3, 4, 12)
+
+
+def _book(engine, barrier, outcomes, caregiver_id, pet_id, owner_id):
+    with Session(engine) as session:
+        caregiver = session.get(CaregiverProfile, caregiver_id)
+        barrier.wait()
+        try:
+            ensure_capacity(session, caregiver, START, END)
+            session.add(Booking(
+                pet_id=pet_id, owner_id=owner_id, caregiver_id=caregiver_id,
+                service_type=ServiceType.BOARDING, status=BookingStatus.PENDING, total_price=150,
+                start_date=START, end_date=END,
+            ))
+            commit_booking(session)
+            outcomes.append(201)
+        except HTTPException as e:
+            outcomes.append(e.status_code)
+
+
+def _race(engine, bookings):
+    barrier = threading.Barrier(len(bookings))
+    outcomes = []
+    threads = [
+        threading.Thread(target=_book, args=(engine, barrier, outcomes, caregiver_id, pet.id, pet.owner_id))
+        for caregiver_id, pet in bookings
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+    return sorted(outcomes)
+
+
+def _booking_count(db):
+    db.expire_all()
+    return db.execute(select(func.count(Booking.id))).scalar()
+
+
+def test_last_slot_goes_to_exactly_one_request(db, db_engine):
+    caregiver = create_caregiver(db, maximum_pets=1)
+    pets = [create_pet(db, create_user(db)) for _ in range(4)]
+
+    outcomes = _race(db_engine, [(caregiver.id, pet) for pet in pets])
+
+    assert outcomes == [201, 409, 409, 409]
+    assert _booking_count(db) == 1
+
+
+def test_pet_is_booked_with_only_one_caregiver(db, db_engine):
+    caregivers = [create_caregiver(db, maximum_pets=2) for _ in range(2)]
+    pet = create_pet(db, create_user(db))
+
+    outcomes = _race(db_engine, [(caregiver.id, pet) for caregiver in caregivers])
+
+    assert outcomes == [201, 409]
+    assert _booking_count(db) == 1
+
+
+def _awaiting_payment(db, caregiver, pet):
+    db.add(Booking(
+        pet_id=pet.id, owner_id=pet.owner_id, caregiver_id=caregiver.id,
+        service_type=ServiceType.BOARDING, status=BookingStatus.PAYMENT_REQUIRED, total_price=150,
+        start_date=START, end_date=END,
+    ))
+    db.commit()
+
+
+def test_booking_awaiting_payment_keeps_its_slot(db, db_engine):
+    caregiver = create_caregiver(db, maximum_pets=1)
+    _awaiting_payment(db, caregiver, create_pet(db, create_user(db)))
+
+    outcomes = _race(db_engine, [(caregiver.id, create_pet(db, create_user(db)))])
+
+    assert outcomes == [409]
+    assert _booking_count(db) == 1
+
+
+def test_booking_awaiting_payment_keeps_the_pets_dates(db, db_engine):
+    pet = create_pet(db, create_user(db))
+    _awaiting_payment(db, create_caregiver(db, maximum_pets=2), pet)
+
+    outcomes = _race(db_engine, [(create_caregiver(db, maximum_pets=2).id, pet)])
+
+    assert outcomes == [409]
+    assert _booking_count(db) == 1
@@ -0,0 +1,67 @@
+# tests/test_utils/test_caregiver_search.py
+from sqlalchemy.dialects import postgresql
+from app.utils.caregiver_search import facet_filters, normalize_search_params, search_cache_key
+
+
+def _key(params):
+    service_type, pet_type, max_price, pet_size, q = params
+    return search_cache_key(service_type, pet_type, max_price, pet_size, None, 10, None, 0, 20, q=q)
+
+
+def _sql(params):
+    service_type, pet_type, max_price, pet_size, _ = params
+    filters = facet_filters(service_type, pet_type, max_price, pet_size)
+    dialect = postgresql.dialect()
+    return [
+        str(f.compile(dialect=dialect, compile_kwargs={"literal_binds": True})) if f is not None else None
+        for f in filters.values()
+    ]
+
+
+def test_equivalent_requests_share_both_key_and_sql():
+    a = normalize_search_params(" BOARDING", "dog ", 10.004, "", "  Quiet   HOUSE ")
+    b = normalize_search_params("BOARDING", "dog", 10.0, None, "quiet house")
+    assert a == b
+    assert _key(a) == _key(b)
+
+
+def test_requests_with_different_sql_get_different_keys():
+    # Whatever reaches the key is exactly what reaches the filters
+    a = normalize_search_params(None, "dog", 10.5, None, None)
+    b = normalize_search_params(None, "dog", 10.0, None, None)
+    assert _sql(a) != _sql(b)
+    assert _key(a) != _key(b)
+
+
+def _migration(name):
+    import importlib.util
+    from pathlib import Path
+    path = next(Path(__file__).parents[2].glob(f"alembic/versions/{name}_*.py"))
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_search_version_trigger_watches_the_searched_columns():
+    from app.models.caregiver import CaregiverProfile
+    from app.utils.caregiver_search import SEARCHED_PROFILE_FIELDS
+    assert _migration("d6a1e8b3f5c2").SEARCHED_COLUMNS == SEARCHED_PROFILE_FIELDS
+    assert set(SEARCHED_PROFILE_FIELDS) <= set(CaregiverProfile.__table__.columns.keys())
+
+
+def test_only_searched_profile_changes_clear_the_search_cache(db):
+    from datetime import datetime
+    from app.utils.caregiver_search import search_cache
+    from tests.factories import create_caregiver
+
+    profile = create_caregiver(db)
+    search_cache.set("page", "cached")
+
+    profile.updated_at = datetime(2031, 1, 1)
+    db.commit()
+    assert search_cache.get("page") == "cached"
+
+    profile.bio = "Big garden"
+    db.commit()
+    assert search_cache.get("page") is None
@@ -0,0 +1,54 @@
+# tests/test_utils/test_pagination.py
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import DateTime, Integer, create_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+from app.utils.pagination import keyset_paginate
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class _Row(_Base):
+    __tablename__ = "rows"
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime)
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    _Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        start = datetime(2030, 1, 1)
+        session.add_all(_Row(id=i, created_at=start + timedelta(minutes=i)) for i in range(1, 6))
+        session.commit()
+        yield session
+
+
+def _page(session, cursor=None, skip=0, limit=2):
+    return keyset_paginate(session.query(_Row), _Row.created_at, _Row.id, cursor, skip, limit)
+
+
+def test_cursor_walks_every_row_once(session):
+    seen, cursor = [], None
+    while True:
+        rows, cursor = _page(session, cursor)
+        seen.extend(row.id for row in rows)
+        if cursor is None:
+            break
+    assert seen == [5, 4, 3, 2, 1]
+
+
+def test_full_last_page_has_no_next_cursor(session):
+    rows, cursor = _page(session, skip=3)
+    assert [row.id for row in rows] == [2, 1]
+    assert cursor is None
+
+
+def test_malformed_cursor_is_a_400(session):
+    from fastapi import HTTPException
+    with pytest.raises(HTTPException) as exc:
+        _page(session, "not-a-cursor")
+    assert exc.value.status_code == 400
@@ -0,0 +1,42 @@
+# tests/test_utils/test_ranking.py
+import uuid
+from app.utils.ranking import candidate_matrix, rank_page, sort_keys
+
+DAY = 86400.0
+NOW = 2_000_000_000.0 - 2_000_000_000.0 % DAY + 3600  # 01:00 UTC
+
+
+def _rows(count):
+    return [
+        (uuid.UUID(int=i + 1), 20.0 + i, 4.0 + i % 2 / 2, float(i), float(i % 6), NOW - i * DAY / 3, None, None)
+        for i in range(count)
+    ]
+
+
+def test_relevance_keys_hold_still_within_a_day():
+    _, matrix = candidate_matrix(_rows(30))
+    morning = sort_keys(matrix, "relevance", now=NOW)
+    evening = sort_keys(matrix, "relevance", now=NOW + 20 * 3600)
+    assert (morning == evening).all()
+
+
+def test_cursor_pages_cover_every_candidate_once():
+    ids, matrix = candidate_matrix(_rows(25))
+    seen, after = [], None
+    while True:
+        # Each page is ranked afresh, as each request is
+        keys = sort_keys(matrix, "relevance", now=NOW + len(seen) * 60)
+        positions, page_keys = rank_page(ids, keys, after, 0, 10)
+        seen.extend(ids[i] for i in positions)
+        if len(positions) < 10:
+            break
+        after = (page_keys[-1], ids[positions[-1]])
+    assert sorted(seen) == sorted(ids)
+
+
+def test_missing_prices_sort_last():
+    rows = _rows(3)
+    rows[0] = (rows[0][0], None, *rows[0][2:])
+    ids, matrix = candidate_matrix(rows)
+    positions, _ = rank_page(ids, sort_keys(matrix, "price"), None, 0, 3)
+    assert [ids[i] for i in positions] == [rows[1][0], rows[2][0], rows[0][0]]